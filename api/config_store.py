@@ -0,0 +1,101 @@
+"""
+Cached access to forecast_config.json.
+
+Reads are served from memory and only re-parse the file when its mtime or
+size changes; writes go through a temp file and an atomic rename, so a
+reader never sees a half-written config. ``version`` increases whenever the
+config content changes (by a write here or an edit on disk), so result
+caches can key on it instead of on the config itself.
+"""
+
+import copy
+import json
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class ConfigStore:
+    """In-memory view of a JSON config file with write-through updates."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._data: Dict[str, Any] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._loaded = False
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def _current_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh(self) -> None:
+        # Caller holds the lock
+        stamp = self._current_stamp()
+        if self._loaded and stamp == self._stamp:
+            return
+        if stamp is None:
+            data = {}
+        else:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        if not self._loaded or data != self._data:
+            self._version += 1
+        self._data = data
+        self._stamp = stamp
+        self._loaded = True
+
+    def read(self) -> Dict[str, Any]:
+        """The current config (a copy the caller may modify); {} if the file is missing."""
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._data)
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the config content changes."""
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def write(self, data: Dict[str, Any]) -> int:
+        """
+        Replace the config on disk atomically and in memory.
+
+        Returns:
+            The new config version
+        """
+        text = json.dumps(data, indent=2) + "\n"
+        with self._lock:
+            # mkstemp creates the file 0600; keep the config's own permissions
+            try:
+                mode = stat.S_IMODE(self.path.stat().st_mode)
+            except OSError:
+                mode = 0o644
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            if not self._loaded or data != self._data:
+                self._version += 1
+            self._data = copy.deepcopy(data)
+            self._stamp = self._current_stamp()
+            self._loaded = True
+            return self._version
@@ -8,12 +8,29 @@ Generalized to forecast any target quarter (Spring, Summer, Fall, Winter).
 """
 
 import csv
+import json
 import math
+import os
 import re
-from collections import defaultdict
+import sys
+import threading
+from array import array
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple, DefaultDict
 
+import numpy as np
+
+from forecast_tool.data.ratio_cube import load_history_ratio_cube
+from forecast_tool.forecasting.cohort_flow import (
+    fall_cohort_size,
+    get_admissions_counts,
+    get_cohort_flow_map,
+    run_cohort_flow,
+    second_year_cohort,
+)
+
 FOUN_CODE_RE = re.compile(r"\bFOUN\s*(\d{3})\b", re.IGNORECASE)
 
 # Quarter cycle: each quarter's two feeders in order (closer, farther)
@@ -27,6 +44,10 @@ QUARTER_CYCLE = {
 # SCAD term code quarter digits
 QUARTER_CODES = {"fall": 10, "winter": 20, "spring": 30, "summer": 40}
 
+# Campuses the sequence method forecasts separately
+SEQUENCE_CAMPUSES = ("SAVANNAH", "SCADNOW")
+CAMPUS_LABELS = {"SAVANNAH": "Savannah", "SCADNOW": "SCADnow"}
+
 
 def resolve_term_info(target_term: str) -> Dict:
     """Parse a human-readable term like 'Summer 2026' into quarter info
@@ -166,61 +187,227 @@ def parse_quarter_courses(cell_value: str) -> List[Tuple[str, float]]:
     return [(course, weight) for course in courses]
 
 
-def load_sequence_mappings(
-    path: Path,
-    target_quarter: str,
-    closer_quarter: str,
-    farther_quarter: str,
-) -> Dict[str, Dict[str, Dict[str, float]]]:
-    """Load the sequencing map CSV and build mappings for the given quarters.
+def _file_version(path: Path) -> Tuple[str, int, int]:
+    """Cache key for a data file: (resolved path, mtime_ns, size)."""
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
-    Returns per-campus dicts with keys:
-        farther_to_target, closer_to_target, target_counts
+
+class CompiledSequenceMap:
+    """Sequencing map parsed once into dense per-quarter weight matrices.
+
+    Every FOUN code in the map gets a column in ``courses``. For each quarter
+    column the map rows become a (rows x courses) weight matrix, so the
+    source->target weights for a campus are a single product of two of
+    them. Derived matrices are memoized, so each (campus, quarter pair) is
+    built at most once per map version.
     """
-    mappings = {
-        "SAVANNAH": {
-            "farther_to_target": defaultdict(float),
-            "closer_to_target": defaultdict(float),
-            "target_counts": defaultdict(float),
-        },
-        "SCADNOW": {
-            "farther_to_target": defaultdict(float),
-            "closer_to_target": defaultdict(float),
-            "target_counts": defaultdict(float),
-        },
-    }
 
+    def __init__(
+        self,
+        courses: List[str],
+        quarter_weights: Dict[str, np.ndarray],
+        campus_rows: Dict[str, np.ndarray],
+    ):
+        self.courses = courses
+        self.course_index = {course: i for i, course in enumerate(courses)}
+        self.quarter_weights = quarter_weights
+        self.campus_rows = campus_rows
+        self._pair_weights: Dict[Tuple[str, str, str], np.ndarray] = {}
+        self._transitions: Dict[Tuple[str, str], np.ndarray] = {}
+        self._target_counts: Dict[Tuple[str, str], np.ndarray] = {}
+        self._mappings: Dict[Tuple[str, str, str], Dict] = {}
+
+    def _rows(self, campus: str, quarter: str) -> np.ndarray:
+        weights = self.quarter_weights.get(quarter)
+        if weights is None:
+            weights = np.zeros((len(self.campus_rows[campus]), len(self.courses)))
+        return weights[self.campus_rows[campus]]
+
+    def pair_weights(self, campus: str, source_quarter: str, target_quarter: str) -> np.ndarray:
+        """Dense (courses x courses) source->target weights for one campus."""
+        key = (campus, source_quarter, target_quarter)
+        weights = self._pair_weights.get(key)
+        if weights is None:
+            weights = self._rows(campus, source_quarter).T @ self._rows(campus, target_quarter)
+            self._pair_weights[key] = weights
+        return weights
+
+    def transitions(self, source_quarter: str, target_quarter: str) -> np.ndarray:
+        """Row-normalized transition matrices stacked per campus.
+
+        Shape is (campuses x courses x courses) in ``SEQUENCE_CAMPUSES``
+        order; row ``s`` gives the share of source course ``s`` seats that
+        flow to each target course (all zeros when ``s`` feeds nothing).
+        """
+        key = (source_quarter, target_quarter)
+        stacked = self._transitions.get(key)
+        if stacked is None:
+            stacked = np.stack([
+                _row_normalize(self.pair_weights(campus, source_quarter, target_quarter))
+                for campus in SEQUENCE_CAMPUSES
+            ])
+            self._transitions[key] = stacked
+        return stacked
+
+    def enrollment_matrix(self, enrollments: Dict[Tuple[str, str], float]) -> np.ndarray:
+        """Scatter {(campus, course): seats} into a (campuses x courses) array.
+
+        Courses outside the map vocabulary and non-positive seat counts are
+        dropped, since they cannot feed any target course.
+        """
+        matrix = np.zeros((len(SEQUENCE_CAMPUSES), len(self.courses)))
+        campus_index = {campus: i for i, campus in enumerate(SEQUENCE_CAMPUSES)}
+        for (campus, course), seats in enrollments.items():
+            c = campus_index.get(campus)
+            i = self.course_index.get(course)
+            if c is None or i is None or seats <= 0:
+                continue
+            matrix[c, i] += seats
+        return matrix
+
+    def feeder_demand(
+        self, source_quarter: str, target_quarter: str, enrollments: np.ndarray
+    ) -> np.ndarray:
+        """Target-course demand from one feeder term at a multiplier of 1.
+
+        ``enrollments`` is a (campuses x courses) array from
+        ``enrollment_matrix``; every campus is projected in one batched
+        matrix-vector product.
+        """
+        return np.einsum(
+            "cs,cst->ct", enrollments, self.transitions(source_quarter, target_quarter)
+        )
+
+    def target_course_mask(self, target_quarter: str) -> np.ndarray:
+        """(campuses x courses) mask of courses offered in the target quarter."""
+        return np.stack([
+            self.target_counts(campus, target_quarter) > 0 for campus in SEQUENCE_CAMPUSES
+        ])
+
+    def target_counts(self, campus: str, target_quarter: str) -> np.ndarray:
+        """Per-course weight of the target quarter column for one campus."""
+        key = (campus, target_quarter)
+        counts = self._target_counts.get(key)
+        if counts is None:
+            counts = self._rows(campus, target_quarter).sum(axis=0)
+            self._target_counts[key] = counts
+        return counts
+
+    def mappings(
+        self, target_quarter: str, closer_quarter: str, farther_quarter: str
+    ) -> Dict[str, Dict[str, Dict]]:
+        """Dict view of the matrices in the ``load_sequence_mappings`` layout."""
+        key = (target_quarter, closer_quarter, farther_quarter)
+        cached = self._mappings.get(key)
+        if cached is None:
+            cached = {}
+            for campus in SEQUENCE_CAMPUSES:
+                cached[campus] = {
+                    "farther_to_target": self._pairs_to_dict(
+                        self.pair_weights(campus, farther_quarter, target_quarter)
+                    ),
+                    "closer_to_target": self._pairs_to_dict(
+                        self.pair_weights(campus, closer_quarter, target_quarter)
+                    ),
+                    "target_counts": {
+                        self.courses[i]: float(weight)
+                        for i, weight in enumerate(self.target_counts(campus, target_quarter))
+                        if weight
+                    },
+                }
+            self._mappings[key] = cached
+        return {
+            campus: {name: defaultdict(float, values) for name, values in by_name.items()}
+            for campus, by_name in cached.items()
+        }
+
+    def _pairs_to_dict(self, weights: np.ndarray) -> Dict[Tuple[str, str], float]:
+        sources, targets = np.nonzero(weights)
+        return {
+            (self.courses[s], self.courses[t]): float(weights[s, t])
+            for s, t in zip(sources, targets)
+        }
+
+
+def _row_normalize(weights: np.ndarray) -> np.ndarray:
+    totals = weights.sum(axis=1, keepdims=True)
+    return np.divide(weights, totals, out=np.zeros_like(weights), where=totals > 0)
+
+
+# Compiled sequencing maps: resolved path -> ((path, mtime_ns, size), compiled)
+_SEQUENCE_MAP_CACHE: Dict[str, Tuple[Tuple[str, int, int], CompiledSequenceMap]] = {}
+_SEQUENCE_MAP_LOCK = threading.Lock()
+
+
+def _compile_sequence_map(path: Path) -> CompiledSequenceMap:
+    row_campuses: List[Tuple[str, ...]] = []
+    row_courses: Dict[str, List[List[Tuple[str, float]]]] = {q: [] for q in QUARTER_CODES}
     with path.open(newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             campuses = parse_campuses(row.get("campus", ""))
             if not campuses:
                 continue
+            row_campuses.append(campuses)
+            for quarter in QUARTER_CODES:
+                row_courses[quarter].append(parse_quarter_courses(row.get(quarter)))
+
+    courses = sorted({
+        course
+        for per_row in row_courses.values()
+        for parsed in per_row
+        for course, _ in parsed
+    })
+    course_index = {course: i for i, course in enumerate(courses)}
+
+    quarter_weights: Dict[str, np.ndarray] = {}
+    for quarter, per_row in row_courses.items():
+        weights = np.zeros((len(per_row), len(courses)))
+        for r, parsed in enumerate(per_row):
+            for course, weight in parsed:
+                weights[r, course_index[course]] += weight
+        quarter_weights[quarter] = weights
+
+    campus_rows = {
+        campus: np.array([campus_matches(c, campus) for c in row_campuses], dtype=bool)
+        for campus in SEQUENCE_CAMPUSES
+    }
+    return CompiledSequenceMap(courses, quarter_weights, campus_rows)
 
-            farther_courses = parse_quarter_courses(row.get(farther_quarter))
-            closer_courses = parse_quarter_courses(row.get(closer_quarter))
-            target_courses = parse_quarter_courses(row.get(target_quarter))
-            if not target_courses:
-                continue
 
-            for campus in ("SAVANNAH", "SCADNOW"):
-                if not campus_matches(campuses, campus):
-                    continue
+def get_compiled_sequence_map(path: Path) -> CompiledSequenceMap:
+    """Return the compiled sequencing map, recompiling when the file changes."""
+    version = _file_version(path)
+    resolved = version[0]
+    with _SEQUENCE_MAP_LOCK:
+        cached = _SEQUENCE_MAP_CACHE.get(resolved)
+    if cached is not None and cached[0] == version:
+        return cached[1]
 
-                for target_course, target_weight in target_courses:
-                    mappings[campus]["target_counts"][target_course] += target_weight
+    compiled = _compile_sequence_map(path)
+    with _SEQUENCE_MAP_LOCK:
+        _SEQUENCE_MAP_CACHE[resolved] = (version, compiled)
+    return compiled
 
-                for farther_course, farther_weight in farther_courses:
-                    for target_course, target_weight in target_courses:
-                        key = (farther_course, target_course)
-                        mappings[campus]["farther_to_target"][key] += farther_weight * target_weight
 
-                for closer_course, closer_weight in closer_courses:
-                    for target_course, target_weight in target_courses:
-                        key = (closer_course, target_course)
-                        mappings[campus]["closer_to_target"][key] += closer_weight * target_weight
+def load_sequence_mappings(
+    path: Path,
+    target_quarter: str,
+    closer_quarter: str,
+    farther_quarter: str,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Load the sequencing map CSV and build mappings for the given quarters.
+
+    Served from the compiled map cache; the CSV is only re-parsed when it
+    changes on disk.
 
-    return mappings
+    Returns per-campus dicts with keys:
+        farther_to_target, closer_to_target, target_counts
+    """
+    return get_compiled_sequence_map(path).mappings(
+        target_quarter, closer_quarter, farther_quarter
+    )
 
 
 def parse_number(value: str) -> float:
@@ -235,14 +422,71 @@ def parse_number(value: str) -> float:
         return 0.0
 
 
-def load_term_enrollments(path: Path, term_code: Optional[str] = None) -> Dict[Tuple[str, str], float]:
-    totals: Dict[Tuple[str, str], float] = defaultdict(float)
+# --------------- Enrollment store ---------------
+
+@dataclass
+class EnrollmentColumns:
+    """FOUN enrollment rows from one source file, parsed once into columns.
+
+    ``has_term`` is False for single-term CSVs (Course/Enrollment layout);
+    their rows carry an empty term and match any requested term code.
+    ``available_terms`` lists every distinct TERM value in the file,
+    including non-FOUN rows.
+    """
+
+    has_term: bool = False
+    terms: List[str] = field(default_factory=list)
+    campuses: List[str] = field(default_factory=list)
+    courses: List[str] = field(default_factory=list)
+    enrollments: array = field(default_factory=lambda: array("d"))
+    available_terms: List[str] = field(default_factory=list)
+    _totals: Dict[Optional[str], Dict[Tuple[str, str], float]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def append(self, term: str, campus: str, course: str, enrollment: float) -> None:
+        self.terms.append(sys.intern(term))
+        self.campuses.append(sys.intern(campus))
+        self.courses.append(sys.intern(course))
+        self.enrollments.append(enrollment)
+
+    def totals(self, term_code: Optional[str] = None) -> Dict[Tuple[str, str], float]:
+        """Return {(campus, course): seats} for one term (memoized per term)."""
+        key = str(term_code) if term_code else None
+        cached = self._totals.get(key)
+        if cached is None:
+            cached = defaultdict(float)
+            check_term = key is not None and self.has_term
+            for term, campus, course, enrollment in zip(
+                self.terms, self.campuses, self.courses, self.enrollments
+            ):
+                if check_term and term != key:
+                    continue
+                cached[(campus, course)] += enrollment
+            self._totals[key] = cached
+        return defaultdict(float, cached)
+
+
+# Process-wide store: resolved path -> ((path, mtime_ns, size), columns)
+_ENROLLMENT_STORE: Dict[str, Tuple[Tuple[str, int, int], EnrollmentColumns]] = {}
+_ENROLLMENT_STORE_LOCK = threading.Lock()
+
+
+def _parse_enrollment_columns(path: Path) -> EnrollmentColumns:
+    """Read an enrollment CSV (Master Schedule or term export) into columns."""
+    table = EnrollmentColumns()
+    terms = set()
     with path.open(newline="", encoding="utf-8-sig", errors="replace") as f:
         reader = csv.DictReader(f)
         fieldnames = [name or "" for name in (reader.fieldnames or [])]
         has_course = "Course" in fieldnames and "Enrollment" in fieldnames
         has_master = "SUBJ" in fieldnames and "CRS NUMBER" in fieldnames and "ACT ENR" in fieldnames
+        table.has_term = has_master and not has_course
         for row in reader:
+            term_value = str(row.get("TERM") or "").strip()
+            if term_value:
+                terms.add(term_value)
+
             if has_course:
                 course = (row.get("Course") or "").strip()
                 if not course.startswith("FOUN "):
@@ -251,13 +495,10 @@ def load_term_enrollments(path: Path, term_code: Optional[str] = None) -> Dict[T
                 room = (row.get("Room") or "").strip().upper()
                 section = (row.get("Section #") or "").strip().upper()
                 campus = "SCADNOW" if (room == "OLNOW" or section.startswith("N")) else "SAVANNAH"
-                totals[(campus, course)] += enrollment
+                table.append("", campus, course, enrollment)
                 continue
 
             if has_master:
-                term_value = str(row.get("TERM") or "").strip()
-                if term_code and term_value != str(term_code):
-                    continue
                 subj = (row.get("SUBJ") or "").strip().upper()
                 if subj != "FOUN":
                     continue
@@ -273,8 +514,114 @@ def load_term_enrollments(path: Path, term_code: Optional[str] = None) -> Dict[T
                     campus = "SAVANNAH"
                 else:
                     continue
-                totals[(campus, course)] += enrollment
-    return totals
+                table.append(term_value, campus, course, enrollment)
+    table.available_terms = sorted(terms)
+    return table
+
+
+# On-disk term index written next to each enrollment source. It holds the
+# distinct TERM codes and one pre-aggregated (campus, course, seats) block per
+# term, so a cold process can answer term lookups without scanning the CSV.
+TERM_INDEX_SUFFIX = ".termidx.json"
+TERM_INDEX_VERSION = 1
+
+
+def term_index_path(path: Path) -> Path:
+    """Location of the term index for an enrollment source."""
+    return path.with_name(path.name + TERM_INDEX_SUFFIX)
+
+
+def _read_term_index(path: Path, stat: os.stat_result) -> Optional[EnrollmentColumns]:
+    """Load the term index for ``path`` if it matches the source's mtime/size."""
+    index_path = term_index_path(path)
+    try:
+        with index_path.open(encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        index.get("version") != TERM_INDEX_VERSION
+        or index.get("source_mtime_ns") != stat.st_mtime_ns
+        or index.get("source_size") != stat.st_size
+    ):
+        return None
+
+    table = EnrollmentColumns(
+        has_term=bool(index.get("has_term")),
+        available_terms=list(index.get("available_terms", [])),
+    )
+    for term, block in index.get("blocks", {}).items():
+        for campus, course, seats in block:
+            table.append(term, campus, course, float(seats))
+    return table
+
+
+def _write_term_index(path: Path, stat: os.stat_result, table: EnrollmentColumns) -> None:
+    """Persist ``table`` as per-term blocks next to ``path`` (best-effort)."""
+    aggregated: Dict[Tuple[str, str, str], float] = defaultdict(float)
+    for term, campus, course, enrollment in zip(
+        table.terms, table.campuses, table.courses, table.enrollments
+    ):
+        aggregated[(term, campus, course)] += enrollment
+
+    blocks: Dict[str, List[List]] = defaultdict(list)
+    for (term, campus, course), seats in sorted(aggregated.items()):
+        blocks[term].append([campus, course, seats])
+
+    index = {
+        "version": TERM_INDEX_VERSION,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_size": stat.st_size,
+        "has_term": table.has_term,
+        "available_terms": table.available_terms,
+        "blocks": blocks,
+    }
+    index_path = term_index_path(path)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # Read-only data directories still work; they just rescan on cold start.
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def get_enrollment_columns(path: Path) -> EnrollmentColumns:
+    """Return the parsed columns for ``path``, re-reading only when the
+    file's mtime or size changes.
+
+    A cold lookup first tries the on-disk term index; only when it is
+    missing or stale is the CSV scanned (and the index rewritten).
+    """
+    stat = path.stat()
+    resolved = str(path.resolve())
+    version = (resolved, stat.st_mtime_ns, stat.st_size)
+    with _ENROLLMENT_STORE_LOCK:
+        cached = _ENROLLMENT_STORE.get(resolved)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    table = _read_term_index(path, stat)
+    if table is None:
+        table = _parse_enrollment_columns(path)
+        _write_term_index(path, stat, table)
+    with _ENROLLMENT_STORE_LOCK:
+        _ENROLLMENT_STORE[resolved] = (version, table)
+    return table
+
+
+def clear_enrollment_store() -> None:
+    """Drop every cached enrollment source (e.g. after bulk data updates)."""
+    with _ENROLLMENT_STORE_LOCK:
+        _ENROLLMENT_STORE.clear()
+
+
+def load_term_enrollments(path: Path, term_code: Optional[str] = None) -> Dict[Tuple[str, str], float]:
+    return get_enrollment_columns(path).totals(term_code)
 
 
 def compute_sections(seats: float, capacity: int) -> int:
@@ -288,35 +635,45 @@ def distribute_enrollments(
     mapping: Dict[Tuple[str, str], float],
     multiplier: float,
 ) -> Dict[str, float]:
+    """Spread source-course seats over target courses by mapping weight.
+
+    Dict front-end to the same row-normalized transition matrix used by
+    ``CompiledSequenceMap.feeder_demand``.
+    """
     demand: Dict[str, float] = defaultdict(float)
-    by_source: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    if not mapping:
+        return demand
+
+    courses = sorted({course for pair in mapping for course in pair})
+    index = {course: i for i, course in enumerate(courses)}
+    weights = np.zeros((len(courses), len(courses)))
     for (source, target), weight in mapping.items():
-        by_source[source][target] += weight
-
-    for source_course, seats in enrollments.items():
-        if seats <= 0:
-            continue
-        targets = by_source.get(source_course)
-        if not targets:
-            continue
-        total_weight = sum(targets.values())
-        if total_weight <= 0:
-            continue
-        for target_course, weight in targets.items():
-            demand[target_course] += seats * multiplier * (weight / total_weight)
+        weights[index[source], index[target]] += weight
+
+    seats = np.zeros(len(courses))
+    for source_course, value in enrollments.items():
+        i = index.get(source_course)
+        if i is not None and value > 0:
+            seats[i] += value
+
+    flows = multiplier * (seats @ _row_normalize(weights))
+    for i in np.flatnonzero(flows):
+        demand[courses[i]] = float(flows[i])
     return demand
 
 
 def get_available_terms(master_schedule_path: Path) -> List[str]:
-    """Scan the Master Schedule CSV for distinct TERM values."""
-    terms = set()
-    with master_schedule_path.open(newline="", encoding="utf-8-sig", errors="replace") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            term_val = str(row.get("TERM") or "").strip()
-            if term_val:
-                terms.add(term_val)
-    return sorted(terms)
+    """Distinct TERM values in the Master Schedule CSV."""
+    return list(get_enrollment_columns(master_schedule_path).available_terms)
+
+
+def next_term_code(term_code: str) -> str:
+    """Term code of the quarter after ``term_code`` ('202640' -> '202710')."""
+    acad_year = int(term_code[:4])
+    quarter_digit = int(term_code[4:])
+    if quarter_digit >= 40:
+        return f"{acad_year + 1}10"
+    return f"{acad_year}{quarter_digit + 10}"
 
 
 def term_code_to_label(term_code: str) -> str:
@@ -361,61 +718,332 @@ def run_sequence_forecast(
         course, campus, projected_seats, sections, method
     """
     info = resolve_term_info(target_term)
-    target_quarter = info["target_quarter"]
-    closer = info["closer_feeder"]
-    farther = info["farther_feeder"]
-
-    mappings = load_sequence_mappings(
-        sequence_map_path,
-        target_quarter=target_quarter,
-        closer_quarter=closer["quarter"],
-        farther_quarter=farther["quarter"],
+    compiled, farther_demand, closer_demand = _sequence_feeder_demands(
+        sequence_map_path, enrollment_source_path, info
     )
+    demand = (
+        progression_rate ** info["farther_feeder"]["multiplier_exp"] * farther_demand
+        + progression_rate ** info["closer_feeder"]["multiplier_exp"] * closer_demand
+    )
+    return _sequence_output_rows(
+        compiled, info["target_quarter"], demand, capacity, buffer_percent
+    )
+
 
-    farther_enrollments = load_term_enrollments(enrollment_source_path, farther["term_code"])
-    closer_enrollments = load_term_enrollments(enrollment_source_path, closer["term_code"])
+def run_sequence_forecast_grid(
+    sequence_map_path: Path,
+    enrollment_source_path: Path,
+    target_term: str,
+    progression_rates: Iterable[float],
+    capacities: Iterable[int],
+    buffer_percents: Iterable[float],
+) -> List[Dict]:
+    """Run the sequence forecast for every (rate, capacity, buffer) combination.
 
-    farther_multiplier = progression_rate ** farther["multiplier_exp"]
-    closer_multiplier = progression_rate ** closer["multiplier_exp"]
+    Feeder enrollments and mappings are loaded once. Because the progression
+    rate only scales each feeder's demand by ``rate ** multiplier_exp``, the
+    whole grid is evaluated with array broadcasting.
 
-    output_rows: List[Dict] = []
-    for campus in ("SAVANNAH", "SCADNOW"):
-        farther_by_course = {
-            course: seats
-            for (campus_key, course), seats in farther_enrollments.items()
-            if campus_key == campus
-        }
-        closer_by_course = {
-            course: seats
-            for (campus_key, course), seats in closer_enrollments.items()
-            if campus_key == campus
+    Returns a list of dicts with keys:
+        progression_rate, capacity, buffer_percent, rows
+    where ``rows`` matches the ``run_sequence_forecast`` output format.
+    """
+    rates = np.asarray(list(progression_rates), dtype=float)
+    capacity_values = [int(c) for c in capacities]
+    buffers = np.asarray(list(buffer_percents), dtype=float)
+    if any(c <= 0 for c in capacity_values):
+        raise ValueError("Capacities must be positive.")
+
+    info = resolve_term_info(target_term)
+    compiled, farther_demand, closer_demand = _sequence_feeder_demands(
+        sequence_map_path, enrollment_source_path, info
+    )
+    offered = compiled.target_course_mask(info["target_quarter"])
+    campus_idx, course_idx = np.nonzero(offered)
+
+    # (rates x offered rows) base demand, then (rates x buffers x rows) seats
+    far_exp = info["farther_feeder"]["multiplier_exp"]
+    close_exp = info["closer_feeder"]["multiplier_exp"]
+    demand = (
+        (rates ** far_exp)[:, None] * farther_demand[campus_idx, course_idx]
+        + (rates ** close_exp)[:, None] * closer_demand[campus_idx, course_idx]
+    )
+    seats = demand[:, None, :] * (1.0 + buffers / 100.0)[None, :, None]
+
+    labels = [
+        (compiled.courses[i], CAMPUS_LABELS[SEQUENCE_CAMPUSES[c]])
+        for c, i in zip(campus_idx, course_idx)
+    ]
+    scenarios: List[Dict] = []
+    for r, rate in enumerate(rates):
+        for b, buffer_percent in enumerate(buffers):
+            scenario_seats = seats[r, b]
+            for capacity in capacity_values:
+                sections = np.where(
+                    scenario_seats > 0, np.ceil(scenario_seats / capacity), 0
+                ).astype(int)
+                scenarios.append({
+                    "progression_rate": float(rate),
+                    "capacity": capacity,
+                    "buffer_percent": float(buffer_percent),
+                    "rows": [
+                        {
+                            "course": course,
+                            "campus": campus,
+                            "projected_seats": float(value),
+                            "sections": int(count),
+                            "method": "sequence_map_feeder_mapping",
+                        }
+                        for (course, campus), value, count in zip(
+                            labels, scenario_seats, sections
+                        )
+                    ],
+                })
+    return scenarios
+
+
+def run_sequence_forecast_horizon(
+    sequence_map_path: Path,
+    enrollment_source_path: Path,
+    start_term: str,
+    quarters: int = 4,
+    capacity: int = 20,
+    progression_rate: float = 0.95,
+    buffer_percent: float = 0.0,
+    historical_data_path: Optional[Path] = None,
+) -> List[Dict]:
+    """Forecast ``quarters`` consecutive terms, chaining each projection forward.
+
+    Feeder terms projected earlier in the horizon stand in for actual
+    enrollments (unbuffered seats, so the buffer is not compounded); all
+    other feeders come from the enrollment source. When the sequence map
+    yields nothing for a term (e.g. Summer) and ``historical_data_path`` is
+    given, the term is projected with historical ratios applied to its
+    closer feeder instead.
+
+    Returns a list of dicts, one per term, with keys:
+        term, term_code, rows
+    where ``rows`` matches the ``run_sequence_forecast`` output format.
+    """
+    if quarters < 1:
+        raise ValueError("quarters must be at least 1.")
+    buffer_multiplier = 1.0 + (buffer_percent / 100.0)
+    if buffer_multiplier <= 0:
+        # Projections are chained unbuffered (seats / multiplier)
+        raise ValueError("buffer_percent must be greater than -100.")
+
+    compiled = get_compiled_sequence_map(sequence_map_path)
+    campus_keys = {label: campus for campus, label in CAMPUS_LABELS.items()}
+    projected: Dict[str, Dict[Tuple[str, str], float]] = {}
+
+    def feeder_enrollments(feeder: Dict) -> Dict[Tuple[str, str], float]:
+        synthetic = projected.get(feeder["term_code"])
+        if synthetic is not None:
+            return synthetic
+        return load_term_enrollments(enrollment_source_path, feeder["term_code"])
+
+    horizon: List[Dict] = []
+    term_code = resolve_term_info(start_term)["target_term_code"]
+    for _ in range(quarters):
+        label = term_code_to_label(term_code)
+        info = resolve_term_info(label)
+        target_quarter = info["target_quarter"]
+        closer = info["closer_feeder"]
+
+        demand = np.zeros((len(SEQUENCE_CAMPUSES), len(compiled.courses)))
+        for feeder in (info["farther_feeder"], closer):
+            demand += progression_rate ** feeder["multiplier_exp"] * compiled.feeder_demand(
+                feeder["quarter"],
+                target_quarter,
+                compiled.enrollment_matrix(feeder_enrollments(feeder)),
+            )
+        rows = _sequence_output_rows(compiled, target_quarter, demand, capacity, buffer_percent)
+        synthetic = {
+            (SEQUENCE_CAMPUSES[c], compiled.courses[i]): float(demand[c, i])
+            for c, i in zip(*np.nonzero(compiled.target_course_mask(target_quarter)))
         }
 
-        from_farther = distribute_enrollments(
-            farther_by_course, mappings[campus]["farther_to_target"], farther_multiplier
-        )
-        from_closer = distribute_enrollments(
-            closer_by_course, mappings[campus]["closer_to_target"], closer_multiplier
+        if not rows and historical_data_path is not None:
+            feeder_rows = [
+                (course, CAMPUS_LABELS[campus], seats)
+                for (campus, course), seats in feeder_enrollments(closer).items()
+                if campus in CAMPUS_LABELS and seats > 0
+            ]
+            rows = run_ratio_forecast_from_rows(
+                feeder_rows,
+                historical_data_path,
+                label,
+                capacity=capacity,
+                buffer_percent=buffer_percent,
+            )
+            synthetic = {
+                (campus_keys[row["campus"]], row["course"]): row["projected_seats"] / buffer_multiplier
+                for row in rows
+            }
+
+        projected[term_code] = synthetic
+        horizon.append({"term": label, "term_code": term_code, "rows": rows})
+        term_code = next_term_code(term_code)
+
+    return horizon
+
+
+def run_admissions_forecast(
+    sequence_map_path: Path,
+    admissions_path: Path,
+    target_term: str,
+    capacity: int = 20,
+    progression_rate: float = 0.95,
+    buffer_percent: float = 0.0,
+    scenario: str = "confirmed",
+    include_transfers: bool = False,
+    include_second_year: bool = True,
+    historical_data_path: Optional[Path] = None,
+) -> List[Dict]:
+    """Admissions-driven cohort-flow forecast for any target quarter.
+
+    Entering cohorts from the admissions workbook are walked through the
+    sequencing map by major to the target term. The previous fall's cohort
+    (second-year demand) is sized from ``historical_data_path`` when given.
+    The compiled map and the admissions counts are cached per file version.
+
+    Args:
+        sequence_map_path: Path to the sequencing map CSV.
+        admissions_path: Path to the accepted-applicants workbook.
+        target_term: Human-readable term, e.g. "Spring 2026".
+        scenario: "accepted" or "confirmed" (MAT fee paid) applicants.
+
+    Returns list of dicts matching run_sequence_forecast output format.
+    """
+    if scenario not in ("accepted", "confirmed"):
+        raise ValueError(f"Unknown admissions scenario: '{scenario}'.")
+    term_code = resolve_term_info(target_term)["target_term_code"]
+    flow_map = get_cohort_flow_map(sequence_map_path)
+    admissions_counts = get_admissions_counts(admissions_path)
+
+    prior_cohort_total = 0.0
+    if include_second_year and historical_data_path is not None and historical_data_path.is_file():
+        prior_cohort_total = fall_cohort_size(
+            historical_data_path, second_year_cohort(term_code).start_term
         )
 
-        combined = defaultdict(float)
-        for course, seats in from_farther.items():
-            combined[course] += seats
-        for course, seats in from_closer.items():
-            combined[course] += seats
+    result = run_cohort_flow(
+        flow_map,
+        admissions_counts,
+        term_code,
+        progression_rate=progression_rate,
+        include_transfers=include_transfers,
+        include_second_year=include_second_year,
+        prior_cohort_total=prior_cohort_total,
+        scenarios=(scenario,),
+    )
+
+    buffer_multiplier = 1.0 + (buffer_percent / 100.0)
+    output_rows: List[Dict] = []
+    for (course, campus), seats in sorted(result.demand_by_course(scenario).items()):
+        seats *= buffer_multiplier
+        output_rows.append({
+            "course": course,
+            "campus": campus,
+            "projected_seats": seats,
+            "sections": compute_sections(seats, capacity),
+            "method": "admissions_cohort_flow",
+        })
+    return output_rows
+
+
+# Unbuffered sequence projections by (map version, source version, term, rate),
+# used as feeder forecasts by the ratio fallback.
+_FEEDER_FORECAST_STORE: "OrderedDict[Tuple, List[Tuple[str, str, float]]]" = OrderedDict()
+_FEEDER_FORECAST_STORE_SIZE = 64
+_FEEDER_FORECAST_LOCK = threading.Lock()
+
+
+def resolve_feeder_forecast(
+    sequence_map_path: Path,
+    enrollment_source_path: Path,
+    feeder_term: str,
+    progression_rate: float = 0.95,
+) -> List[Tuple[str, str, float]]:
+    """Unbuffered sequence projection of ``feeder_term`` as (course, campus, seats).
+
+    Served from an in-process store, so repeated ratio fallbacks for the
+    same data versions cost a single lookup. Returns an empty list when the
+    sequence method cannot project the feeder term either.
+    """
+    key = (
+        _file_version(sequence_map_path),
+        _file_version(enrollment_source_path),
+        resolve_term_info(feeder_term)["target_term_code"],
+        float(progression_rate),
+    )
+    with _FEEDER_FORECAST_LOCK:
+        cached = _FEEDER_FORECAST_STORE.get(key)
+        if cached is not None:
+            _FEEDER_FORECAST_STORE.move_to_end(key)
+            return list(cached)
+
+    rows = run_sequence_forecast(
+        sequence_map_path,
+        enrollment_source_path,
+        feeder_term,
+        progression_rate=progression_rate,
+    )
+    feeder_rows = [
+        (row["course"], row["campus"], row["projected_seats"])
+        for row in rows
+        if row["projected_seats"] > 0
+    ]
+    with _FEEDER_FORECAST_LOCK:
+        _FEEDER_FORECAST_STORE[key] = feeder_rows
+        while len(_FEEDER_FORECAST_STORE) > _FEEDER_FORECAST_STORE_SIZE:
+            _FEEDER_FORECAST_STORE.popitem(last=False)
+    return list(feeder_rows)
+
+
+def _sequence_feeder_demands(
+    sequence_map_path: Path,
+    enrollment_source_path: Path,
+    info: Dict,
+) -> Tuple[CompiledSequenceMap, np.ndarray, np.ndarray]:
+    """Load the compiled map and each feeder's demand at a multiplier of 1."""
+    target_quarter = info["target_quarter"]
+    closer = info["closer_feeder"]
+    farther = info["farther_feeder"]
+
+    compiled = get_compiled_sequence_map(sequence_map_path)
+    farther_enrollments = compiled.enrollment_matrix(
+        load_term_enrollments(enrollment_source_path, farther["term_code"])
+    )
+    closer_enrollments = compiled.enrollment_matrix(
+        load_term_enrollments(enrollment_source_path, closer["term_code"])
+    )
+    return (
+        compiled,
+        compiled.feeder_demand(farther["quarter"], target_quarter, farther_enrollments),
+        compiled.feeder_demand(closer["quarter"], target_quarter, closer_enrollments),
+    )
 
-        for course in mappings[campus]["target_counts"].keys():
-            combined.setdefault(course, 0.0)
 
-        # Apply buffer
-        buffer_multiplier = 1.0 + (buffer_percent / 100.0)
+def _sequence_output_rows(
+    compiled: CompiledSequenceMap,
+    target_quarter: str,
+    demand: np.ndarray,
+    capacity: int,
+    buffer_percent: float,
+) -> List[Dict]:
+    """Turn a (campuses x courses) demand array into forecast result rows."""
+    buffer_multiplier = 1.0 + (buffer_percent / 100.0)
+    offered = compiled.target_course_mask(target_quarter)
 
-        for course in sorted(combined.keys()):
-            seats = combined[course] * buffer_multiplier
+    output_rows: List[Dict] = []
+    for c, campus in enumerate(SEQUENCE_CAMPUSES):
+        for i in np.flatnonzero(offered[c]):
+            seats = float(demand[c, i]) * buffer_multiplier
             output_rows.append(
                 {
-                    "course": course,
-                    "campus": "Savannah" if campus == "SAVANNAH" else "SCADnow",
+                    "course": compiled.courses[i],
+                    "campus": CAMPUS_LABELS[campus],
                     "projected_seats": seats,
                     "sections": compute_sections(seats, capacity),
                     "method": "sequence_map_feeder_mapping",
@@ -432,44 +1060,18 @@ def _compute_historical_ratios(
 ) -> Dict[str, float]:
     """Compute average target/feeder enrollment ratios per course from historical data.
 
+    Reads the shared ratio cube for the history file (built once per file
+    version and persisted beside it), so each call is an array slice.
+
     Quarter codes: "10"=Fall, "20"=Winter, "30"=Spring, "40"=Summer.
     Returns {course: ratio}.
     """
-    # Collect per-course, per-academic-year enrollment totals for each quarter
-    # Structure: {course: {acad_year: {quarter_code: total_enrollment}}}
-    data: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
-
     if not historical_path.is_file():
         return {}
 
-    with historical_path.open(newline="", encoding="utf-8-sig", errors="replace") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            subj = (row.get("SUBJ") or "").strip().upper()
-            crs = (row.get("CRS NUMBER") or "").strip()
-            if not subj.startswith("FOUN") or not crs:
-                continue
-            course = f"{subj} {crs}"
-            term_str = str(row.get("TERM") or "").strip()
-            if len(term_str) != 6:
-                continue
-            acad_year = term_str[:4]
-            qq = term_str[4:]
-            enrollment = parse_number(row.get("ACT ENR"))
-            data[course][acad_year][qq] += enrollment
-
-    ratios: Dict[str, float] = {}
-    for course, by_year in data.items():
-        year_ratios = []
-        for acad_year, by_qq in by_year.items():
-            feeder_enr = by_qq.get(feeder_quarter_code, 0.0)
-            target_enr = by_qq.get(target_quarter_code, 0.0)
-            if feeder_enr > 0 and target_enr > 0:
-                year_ratios.append(target_enr / feeder_enr)
-        if year_ratios:
-            ratios[course] = sum(year_ratios) / len(year_ratios)
-
-    return ratios
+    cube = load_history_ratio_cube(historical_path)
+    ratios = cube.mean_ratios(target_quarter_code, feeder_quarter_code)
+    return {course: ratio for course, ratio in ratios.items() if course.startswith("FOUN")}
 
 
 def run_ratio_forecast(
@@ -497,15 +1099,6 @@ def run_ratio_forecast(
 
     Returns list of dicts matching run_sequence_forecast output format.
     """
-    info = resolve_term_info(target_term)
-    target_qq = str(QUARTER_CODES[info["target_quarter"]])
-    feeder_qq = str(QUARTER_CODES[info["closer_feeder"]["quarter"]])
-
-    # Compute per-course historical ratios
-    historical_ratios = _compute_historical_ratios(
-        historical_data_path, target_qq, feeder_qq
-    )
-
     # Load the feeder forecast CSV
     feeder_data: List[Tuple[str, str, float]] = []
     if not feeder_forecast_path.is_file():
@@ -530,6 +1123,39 @@ def run_ratio_forecast(
             if course and campus and seats > 0:
                 feeder_data.append((course, campus, seats))
 
+    return run_ratio_forecast_from_rows(
+        feeder_data,
+        historical_data_path,
+        target_term,
+        capacity=capacity,
+        buffer_percent=buffer_percent,
+        default_ratio=default_ratio,
+    )
+
+
+def run_ratio_forecast_from_rows(
+    feeder_data: Iterable[Tuple[str, str, float]],
+    historical_data_path: Path,
+    target_term: str,
+    capacity: int = 20,
+    buffer_percent: float = 0.0,
+    default_ratio: float = 0.12,
+) -> List[Dict]:
+    """Ratio-based forecast over in-memory feeder seats.
+
+    ``feeder_data`` holds (course, campus label, seats) tuples for the
+    target's closer feeder term, e.g. rows projected earlier in the same
+    request. See ``run_ratio_forecast`` for the CSV-backed entry point.
+    """
+    info = resolve_term_info(target_term)
+    target_qq = str(QUARTER_CODES[info["target_quarter"]])
+    feeder_qq = str(QUARTER_CODES[info["closer_feeder"]["quarter"]])
+
+    # Compute per-course historical ratios
+    historical_ratios = _compute_historical_ratios(
+        historical_data_path, target_qq, feeder_qq
+    )
+
     buffer_multiplier = 1.0 + (buffer_percent / 100.0)
     output_rows: List[Dict] = []
 
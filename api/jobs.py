@@ -0,0 +1,197 @@
+"""
+Background job runner for long-running API computations.
+
+Ensemble forecasts and diagnostics can take minutes (one Prophet fit per
+course), so they run on a small thread pool instead of holding a request
+worker. Each job records the per-course rows it emits, so clients can
+stream them (Server-Sent Events) while the job runs, and completed jobs are
+kept, keyed by their parameters, so identical submissions reuse the result.
+"""
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Seconds between SSE keep-alive comments while a job is quiet
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+def job_key(kind: str, params: Dict[str, Any]) -> str:
+    """Cache key for a job kind and its (JSON-serializable) parameters."""
+    payload = json.dumps({"kind": kind, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class JobFailed(Exception):
+    """Raised by a job function to fail with a client-facing message."""
+
+    def __init__(self, detail: str, status_code: int = 500):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+class Job:
+    """State of one background computation."""
+
+    def __init__(self, kind: str, key: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.key = key
+        self.status = JOB_QUEUED
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self.events: List[Dict[str, Any]] = []
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.status_code: Optional[int] = None
+        self._cond = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
+
+    def emit(self, row: Dict[str, Any]) -> None:
+        """Record a partial result and wake any streaming readers."""
+        with self._cond:
+            self.events.append(row)
+            self._cond.notify_all()
+
+    def _finish(self, status: str, result=None, error=None, status_code=None) -> None:
+        with self._cond:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.status_code = status_code
+            self.finished = time.time()
+            self._cond.notify_all()
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "jobId": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": len(self.events),
+            "error": self.error,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+    def wait_events(self, start: int, timeout: float) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Block until there are events past ``start`` or the job finishes.
+
+        Returns:
+            (new events, whether the job is done)
+        """
+        with self._cond:
+            if len(self.events) <= start and not self.done:
+                self._cond.wait(timeout)
+            return self.events[start:], self.done
+
+
+class JobManager:
+    """Runs jobs on a thread pool and keeps recent ones, keyed by parameters."""
+
+    def __init__(self, max_workers: int = 2, max_jobs: int = 32):
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._by_key: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        kind: str,
+        params: Dict[str, Any],
+        fn: Callable[[Callable[[Dict[str, Any]], None]], Dict[str, Any]],
+    ) -> Tuple[Job, bool]:
+        """
+        Start ``fn(emit)`` in the background unless an identical job exists.
+
+        ``fn`` calls ``emit(row)`` for each partial result and returns the
+        final result; it raises JobFailed for client-facing failures.
+
+        Returns:
+            (job, reused) where reused is True for a queued, running or
+            completed job with the same parameters.
+        """
+        key = job_key(kind, params)
+        with self._lock:
+            existing = self._jobs.get(self._by_key.get(key, ""))
+            if existing is not None and existing.status != JOB_FAILED:
+                self._jobs.move_to_end(existing.id)
+                return existing, True
+            job = Job(kind, key)
+            self._jobs[job.id] = job
+            self._by_key[key] = job.id
+            self._evict()
+        self._executor.submit(self._run, job, fn)
+        return job, False
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, fn) -> None:
+        with job._cond:
+            job.status = JOB_RUNNING
+        try:
+            result = fn(job.emit)
+        except JobFailed as e:
+            job._finish(JOB_FAILED, error=e.detail, status_code=e.status_code)
+        except Exception:
+            job._finish(JOB_FAILED, error=f"{job.kind} job failed", status_code=500)
+        else:
+            job._finish(JOB_COMPLETED, result=result)
+
+    def _evict(self) -> None:
+        # Drop the least recently used finished jobs beyond the limit
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            job = self._jobs[job_id]
+            if not job.done:
+                continue
+            del self._jobs[job_id]
+            if self._by_key.get(job.key) == job_id:
+                del self._by_key[job.key]
+            excess -= 1
+
+
+def sse_events(job: Job, start: int = 0) -> Iterator[str]:
+    """
+    Server-Sent Events for a job: one "result" event per emitted row
+    (``id`` is the row index, for resuming), then "done" with the final
+    result or "error" with the failure detail.
+    """
+    index = start
+    while True:
+        events, done = job.wait_events(index, SSE_KEEPALIVE_SECONDS)
+        for row in events:
+            yield f"id: {index}\nevent: result\ndata: {json.dumps(row, default=str)}\n\n"
+            index += 1
+        if done:
+            # Rows emitted just before completion
+            for row in job.events[index:]:
+                yield f"id: {index}\nevent: result\ndata: {json.dumps(row, default=str)}\n\n"
+                index += 1
+            if job.status == JOB_COMPLETED:
+                yield f"event: done\ndata: {json.dumps(job.result, default=str)}\n\n"
+            else:
+                yield f"event: error\ndata: {json.dumps({'detail': job.error})}\n\n"
+            return
+        if not events:
+            yield ": keep-alive\n\n"
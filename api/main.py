@@ -3,14 +3,15 @@ FastAPI Backend for SCAD Forecast Tool
 Exposes existing Python forecasting logic to the Next.js frontend.
 """
 
-import json
 import re
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
 
 # Ensure forecast_tool package is importable from the api/ directory
@@ -18,22 +19,57 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from forecaster import (
     run_sequence_forecast,
+    run_sequence_forecast_grid,
+    run_sequence_forecast_horizon,
+    run_admissions_forecast,
     run_ratio_forecast,
+    run_ratio_forecast_from_rows,
+    resolve_feeder_forecast,
     load_previous_forecast,
-    get_available_terms,
     term_code_to_label,
     resolve_term_info,
     QUARTER_CYCLE,
 )
+from jobs import JobFailed, JobManager, sse_events
+from config_store import ConfigStore
+from registry import DataRegistry, file_stamp
+from result_cache import ResultCache, result_key
+from warmup import WarmUp
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = PROJECT_ROOT / "forecast_config.json"
 DATA_DIR = PROJECT_ROOT / "Data"
+DEFAULT_SEQUENCE_MAP = "Data/FOUN_sequencing_map_by_major.csv"
+DEFAULT_ENROLLMENT_SOURCE = "Data/Master Schedule of Classes.csv"
+DEFAULT_ADMISSIONS_SOURCE = "Data/PZSAAPF-SL31 - Accepted Applicants with Latest Decision.xlsx"
+
+# Source data shared by all endpoints (loaded at startup, refreshed on change)
+registry = DataRegistry(PROJECT_ROOT)
+config_store = ConfigStore(CONFIG_PATH)
+
+# Recent /api/forecast responses, keyed by request and input versions
+forecast_cache = ResultCache(max_entries=128)
+
+# Model libraries and history, preloaded in the background after startup
+warmup = WarmUp()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    disk_cfg = _read_disk_config()
+    registry.warm(
+        disk_cfg.get("sequence_map", DEFAULT_SEQUENCE_MAP),
+        disk_cfg.get("enrollment_source", DEFAULT_ENROLLMENT_SOURCE),
+    )
+    warmup.start(registry.history)
+    yield
+
 
 app = FastAPI(
     title="SCAD Forecast Tool API",
     description="AI-powered FOUN enrollment forecasting",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS for Next.js frontend
@@ -158,6 +194,9 @@ class ChatResponse(BaseModel):
     message: str
     parsedCommand: Dict[str, Any]
 
+# /api/forecast methods: sequence (with ratio fallback) or admissions cohort flow
+FORECAST_METHODS = ("sequence", "admissions")
+
 class ForecastRequest(BaseModel):
     term: str
     method: Optional[str] = "sequence"
@@ -181,6 +220,42 @@ class ForecastResponse(BaseModel):
     results: List[ForecastResult]
     summary: ForecastSummary
 
+class SweepRequest(BaseModel):
+    term: str
+    progression_rates: Optional[List[float]] = None
+    capacities: Optional[List[int]] = None
+    buffer_percents: Optional[List[float]] = None
+
+class SweepScenario(BaseModel):
+    progressionRate: float
+    capacity: int
+    bufferPercent: float
+    results: List[ForecastResult]
+    summary: ForecastSummary
+
+class SweepResponse(BaseModel):
+    scenarios: List[SweepScenario]
+
+# Upper bound on progression_rates x capacities x buffer_percents per sweep
+MAX_SWEEP_SCENARIOS = 1000
+
+class HorizonRequest(BaseModel):
+    term: str
+    quarters: Optional[int] = None
+    config: Optional[Dict[str, Any]] = None
+
+class HorizonTerm(BaseModel):
+    term: str
+    termCode: str
+    results: List[ForecastResult]
+    summary: ForecastSummary
+
+class HorizonResponse(BaseModel):
+    terms: List[HorizonTerm]
+
+# Longest chain of quarters a single horizon request may project
+MAX_HORIZON_QUARTERS = 8
+
 class TermOption(BaseModel):
     termCode: str
     label: str
@@ -197,25 +272,48 @@ class ConfigModel(BaseModel):
     defaultTerm: str = "Spring 2026"
 
 def _read_disk_config() -> dict:
-    """Read forecast_config.json from disk."""
-    if CONFIG_PATH.is_file():
-        with CONFIG_PATH.open(encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    """Read forecast_config.json (from memory unless the file changed)."""
+    return config_store.read()
 
 
 def _write_disk_config(data: dict) -> None:
-    """Write forecast_config.json to disk."""
-    with CONFIG_PATH.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    """Write forecast_config.json to disk atomically."""
+    config_store.write(data)
+
+def _resolve_data_path(disk_cfg: dict, key: str, default: str) -> Path:
+    """Resolve a configured data file path (relative paths are relative to PROJECT_ROOT)."""
+    p = Path(disk_cfg.get(key, default))
+    return p if p.is_absolute() else PROJECT_ROOT / p
+
+
+_TRUE_TEXT = {"true", "1", "yes", "on"}
+_FALSE_TEXT = {"false", "0", "no", "off"}
+
+
+def _config_bool(value: Any, key: str) -> bool:
+    """Parse a boolean config flag; raises ValueError for anything but a clear true/false."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_TEXT:
+            return True
+        if text in _FALSE_TEXT:
+            return False
+    raise ValueError(f"{key} must be true or false, got {value!r}")
 
 # ============== Routes ==============
 
 @app.get("/api/health")
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    """Health check endpoint (``warmup`` reports the model preload)."""
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "warmup": warmup.status,
+    }
 
 
 @app.post("/api/chat", response_model=ChatResponse)
@@ -237,9 +335,69 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail="Failed to process chat request")
 
 
+# Saved forecast CSVs read by /api/forecast (ratio fallback feeders and the
+# previous forecast used for change deltas both match this pattern)
+SAVED_FORECAST_PATTERN = "*_FOUN_Forecast*.csv"
+
+
+def _saved_forecast_stamps() -> List[Any]:
+    """Name and mtime/size of every saved forecast CSV, so edits in place expire results."""
+    return [
+        [path.name, file_stamp(path)]
+        for path in sorted(DATA_DIR.glob(SAVED_FORECAST_PATTERN))
+    ]
+
+
+def _forecast_cache_key(request: ForecastRequest) -> str:
+    """Key covering every input of a /api/forecast response."""
+    disk_cfg = _read_disk_config()
+    return result_key({
+        "term": request.term,
+        "method": request.method,
+        "config": request.config,
+        "config_version": config_store.version,
+        "sequence_map": registry.file_hash(
+            _resolve_data_path(disk_cfg, "sequence_map", DEFAULT_SEQUENCE_MAP)
+        ),
+        "enrollment_source": registry.file_hash(
+            _resolve_data_path(disk_cfg, "enrollment_source", DEFAULT_ENROLLMENT_SOURCE)
+        ),
+        "admissions_source": registry.file_hash(
+            _resolve_data_path(disk_cfg, "admissions_source", DEFAULT_ADMISSIONS_SOURCE)
+        ),
+        "history": registry.history_version(),
+        # Saved forecast CSVs feed the ratio fallback and change comparison
+        "saved_forecasts": _saved_forecast_stamps(),
+    })
+
+
 @app.post("/api/forecast", response_model=ForecastResponse)
 def run_forecast(request: ForecastRequest):
-    """Run forecast for specified term using real sequence-based logic."""
+    """Run forecast for specified term, serving repeats from the result cache."""
+    try:
+        key = _forecast_cache_key(request)
+    except (OSError, ValueError):
+        key = None
+    if key is not None:
+        cached = forecast_cache.get(key)
+        if cached is not None:
+            return cached
+
+    response = _compute_forecast(request)
+    if key is not None:
+        forecast_cache.put(key, response)
+    return response
+
+
+@app.get("/api/forecast/cache")
+def forecast_cache_stats():
+    """Hit/miss counters and size of the /api/forecast result cache."""
+    return forecast_cache.stats()
+
+
+def _compute_forecast(request: ForecastRequest) -> ForecastResponse:
+    """Run forecast for specified term using real sequence-based logic
+    (or the admissions cohort flow when ``method`` is "admissions")."""
     try:
         # Load config from disk, overlay any request-level overrides
         disk_cfg = _read_disk_config()
@@ -249,42 +407,95 @@ def run_forecast(request: ForecastRequest):
         progression_rate = float(req_cfg.get("progression_rate", disk_cfg.get("progression_rate", 0.95)))
         buffer_percent = float(req_cfg.get("buffer_percent", disk_cfg.get("buffer_percent", 0.0)))
 
-        # Resolve data file paths (relative paths are relative to PROJECT_ROOT)
-        def resolve(key: str, default: str) -> Path:
-            raw = disk_cfg.get(key, default)
-            p = Path(raw)
-            return p if p.is_absolute() else PROJECT_ROOT / p
-
-        sequence_map_path = resolve("sequence_map", "Data/FOUN_sequencing_map_by_major.csv")
-        enrollment_source_path = resolve("enrollment_source", "Data/Master Schedule of Classes.csv")
+        sequence_map_path = _resolve_data_path(
+            disk_cfg, "sequence_map", DEFAULT_SEQUENCE_MAP
+        )
+        enrollment_source_path = _resolve_data_path(
+            disk_cfg, "enrollment_source", DEFAULT_ENROLLMENT_SOURCE
+        )
 
         # Use the requested term, falling back to config default
         target_term = request.term or disk_cfg.get("default_term", "Spring 2026")
 
+        method = request.method or "sequence"
+        if method not in FORECAST_METHODS:
+            raise ValueError(
+                f"Unknown method {method!r}; expected one of {list(FORECAST_METHODS)}"
+            )
+
         # Run the real forecast
-        rows = run_sequence_forecast(
-            sequence_map_path=sequence_map_path,
-            enrollment_source_path=enrollment_source_path,
-            target_term=target_term,
-            capacity=capacity,
-            progression_rate=progression_rate,
-            buffer_percent=buffer_percent,
-        )
+        if method == "admissions":
+            # Cohort flow from the admissions workbook through the sequencing map
+            rows = run_admissions_forecast(
+                sequence_map_path=sequence_map_path,
+                admissions_path=_resolve_data_path(
+                    disk_cfg, "admissions_source", DEFAULT_ADMISSIONS_SOURCE
+                ),
+                target_term=target_term,
+                capacity=capacity,
+                progression_rate=progression_rate,
+                buffer_percent=buffer_percent,
+                scenario=str(req_cfg.get("scenario", disk_cfg.get("admissions_scenario", "confirmed"))),
+                include_transfers=_config_bool(
+                    req_cfg.get("include_transfers", disk_cfg.get("include_transfers", False)),
+                    "include_transfers",
+                ),
+                include_second_year=_config_bool(
+                    req_cfg.get("include_second_year", disk_cfg.get("include_second_year", True)),
+                    "include_second_year",
+                ),
+                historical_data_path=registry.history_path,
+            )
+            if not rows:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"No admissions data for {target_term}",
+                )
+            method_label = "Admissions cohort flow"
+        else:
+            rows = run_sequence_forecast(
+                sequence_map_path=sequence_map_path,
+                enrollment_source_path=enrollment_source_path,
+                target_term=target_term,
+                capacity=capacity,
+                progression_rate=progression_rate,
+                buffer_percent=buffer_percent,
+            )
+            method_label = "Sequence-based"
 
         # Fallback: if sequence-based returned no results (e.g. Summer has
-        # no sequencing data), try the ratio-based method using the closest
-        # feeder quarter's existing forecast output.
-        method_label = "Sequence-based"
-        if not rows:
+        # no sequencing data), try the ratio-based method on the closest
+        # feeder quarter's projection. The feeder is projected in memory
+        # (and kept in the feeder result store); saved forecast CSVs are
+        # only consulted when the feeder cannot be projected either.
+        if not rows and method != "admissions":
             info = resolve_term_info(target_term)
             feeder_quarter = info["closer_feeder"]["quarter"].capitalize()
             feeder_tc = info["closer_feeder"]["term_code"]
             feeder_label = term_code_to_label(feeder_tc)
             feeder_year = feeder_label.split()[1] if " " in feeder_label else feeder_tc[:4]
+            historical_path = registry.history_path
+
+            feeder_rows = resolve_feeder_forecast(
+                sequence_map_path,
+                enrollment_source_path,
+                feeder_label,
+                progression_rate=progression_rate,
+            )
+            if feeder_rows:
+                rows = run_ratio_forecast_from_rows(
+                    feeder_rows,
+                    historical_path,
+                    target_term,
+                    capacity=capacity,
+                    buffer_percent=buffer_percent,
+                )
+                if rows:
+                    method_label = "Ratio-based"
+
             # Look for the feeder quarter's forecast CSV
             feeder_pattern = f"{feeder_quarter}_{feeder_year}_FOUN_Forecast*.csv"
-            feeder_csvs = sorted(DATA_DIR.glob(feeder_pattern))
-            historical_path = DATA_DIR / "FOUN_Historical.csv"
+            feeder_csvs = sorted(DATA_DIR.glob(feeder_pattern)) if not rows else []
             if feeder_csvs:
                 # Prefer the Sequence Guides output (most reliable),
                 # then try others until one has compatible columns.
@@ -352,6 +563,8 @@ def run_forecast(request: ForecastRequest):
                 method=method_label,
             ),
         )
+    except HTTPException:
+        raise
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Required data file not found")
     except ValueError as e:
@@ -360,19 +573,153 @@ def run_forecast(request: ForecastRequest):
         raise HTTPException(status_code=500, detail="Forecast computation failed")
 
 
+@app.post("/api/forecast/sweep", response_model=SweepResponse)
+def run_forecast_sweep(request: SweepRequest):
+    """Run the sequence forecast over a progression_rate x capacity x buffer grid.
+
+    Omitted axes fall back to the single configured value. Feeder data and
+    mappings are loaded once for the whole grid.
+    """
+    try:
+        disk_cfg = _read_disk_config()
+        progression_rates = request.progression_rates or [
+            float(disk_cfg.get("progression_rate", 0.95))
+        ]
+        capacities = request.capacities or [int(disk_cfg.get("capacity", 20))]
+        buffer_percents = request.buffer_percents or [
+            float(disk_cfg.get("buffer_percent", 0.0))
+        ]
+        n_scenarios = len(progression_rates) * len(capacities) * len(buffer_percents)
+        if n_scenarios > MAX_SWEEP_SCENARIOS:
+            raise ValueError(
+                f"Sweep has {n_scenarios} scenarios; the limit is {MAX_SWEEP_SCENARIOS}."
+            )
+
+        scenarios = run_sequence_forecast_grid(
+            sequence_map_path=_resolve_data_path(
+                disk_cfg, "sequence_map", DEFAULT_SEQUENCE_MAP
+            ),
+            enrollment_source_path=_resolve_data_path(
+                disk_cfg, "enrollment_source", DEFAULT_ENROLLMENT_SOURCE
+            ),
+            target_term=request.term or disk_cfg.get("default_term", "Spring 2026"),
+            progression_rates=progression_rates,
+            capacities=capacities,
+            buffer_percents=buffer_percents,
+        )
+
+        response = []
+        for scenario in scenarios:
+            results = [
+                ForecastResult(
+                    course=row["course"],
+                    campus=row["campus"],
+                    projectedSeats=row["projected_seats"],
+                    sections=row["sections"],
+                )
+                for row in scenario["rows"]
+            ]
+            response.append(SweepScenario(
+                progressionRate=scenario["progression_rate"],
+                capacity=scenario["capacity"],
+                bufferPercent=scenario["buffer_percent"],
+                results=results,
+                summary=ForecastSummary(
+                    totalStudents=sum(r.projectedSeats for r in results),
+                    totalSections=sum(r.sections for r in results),
+                    coursesForecasted=len(set(r.course for r in results)),
+                    method="Sequence-based",
+                ),
+            ))
+        return SweepResponse(scenarios=response)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Required data file not found")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    except Exception:
+        raise HTTPException(status_code=500, detail="Forecast sweep failed")
+
+
+@app.post("/api/forecast/horizon", response_model=HorizonResponse)
+def run_forecast_horizon(request: HorizonRequest):
+    """Forecast consecutive quarters starting at ``term`` in one pass.
+
+    Each projected quarter feeds the next in memory; quarters without
+    sequencing data fall back to historical ratios on the prior projection.
+    The number of quarters defaults to ``quarters_to_forecast`` in config.
+    """
+    try:
+        disk_cfg = _read_disk_config()
+        req_cfg = request.config or {}
+
+        capacity = int(req_cfg.get("capacity", disk_cfg.get("capacity", 20)))
+        progression_rate = float(req_cfg.get("progression_rate", disk_cfg.get("progression_rate", 0.95)))
+        buffer_percent = float(req_cfg.get("buffer_percent", disk_cfg.get("buffer_percent", 0.0)))
+        quarters = request.quarters
+        if quarters is None:
+            quarters = disk_cfg.get("quarters_to_forecast", 2)
+        quarters = int(quarters)
+        if not 1 <= quarters <= MAX_HORIZON_QUARTERS:
+            raise ValueError(f"quarters must be between 1 and {MAX_HORIZON_QUARTERS}.")
+
+        horizon = run_sequence_forecast_horizon(
+            sequence_map_path=_resolve_data_path(
+                disk_cfg, "sequence_map", DEFAULT_SEQUENCE_MAP
+            ),
+            enrollment_source_path=_resolve_data_path(
+                disk_cfg, "enrollment_source", DEFAULT_ENROLLMENT_SOURCE
+            ),
+            start_term=request.term or disk_cfg.get("default_term", "Spring 2026"),
+            quarters=quarters,
+            capacity=capacity,
+            progression_rate=progression_rate,
+            buffer_percent=buffer_percent,
+            historical_data_path=registry.history_path,
+        )
+
+        terms = []
+        for entry in horizon:
+            results = [
+                ForecastResult(
+                    course=row["course"],
+                    campus=row["campus"],
+                    projectedSeats=row["projected_seats"],
+                    sections=row["sections"],
+                )
+                for row in entry["rows"]
+            ]
+            methods = {row["method"] for row in entry["rows"]}
+            terms.append(HorizonTerm(
+                term=entry["term"],
+                termCode=entry["term_code"],
+                results=results,
+                summary=ForecastSummary(
+                    totalStudents=sum(r.projectedSeats for r in results),
+                    totalSections=sum(r.sections for r in results),
+                    coursesForecasted=len(set(r.course for r in results)),
+                    method="Ratio-based" if methods == {"ratio_based"} else "Sequence-based",
+                ),
+            ))
+        return HorizonResponse(terms=terms)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Required data file not found")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+    except Exception:
+        raise HTTPException(status_code=500, detail="Horizon forecast failed")
+
+
 @app.get("/api/terms", response_model=TermsResponse)
 def list_terms():
     """List available and forecastable terms from the Master Schedule."""
     try:
         disk_cfg = _read_disk_config()
-        raw = disk_cfg.get("enrollment_source", "Data/Master Schedule of Classes.csv")
-        p = Path(raw)
-        master_path = p if p.is_absolute() else PROJECT_ROOT / p
+        master_path = _resolve_data_path(disk_cfg, "enrollment_source", DEFAULT_ENROLLMENT_SOURCE)
 
         if not master_path.is_file():
             raise HTTPException(status_code=404, detail="Master Schedule not found")
 
-        term_codes = get_available_terms(master_path)
+        term_codes = registry.available_terms(master_path)
         term_code_set = set(term_codes)
 
         available = []
@@ -539,115 +886,119 @@ class DiagnosticsResponse(BaseModel):
     summary: Dict[str, Any]
 
 
-@app.post("/api/forecast/ensemble", response_model=EnsembleResponse)
-def run_ensemble_forecast(request: EnsembleRequest):
-    """Run Prophet+ETS+ARIMA ensemble forecast on historical enrollment data."""
-    import os
-    import warnings
+def _ensemble_weight_method(req_cfg: Dict[str, Any], disk_cfg: Dict[str, Any]) -> str:
+    """Configured weight search, rejected with a 400 before any fits are scheduled."""
+    from forecast_tool.forecasting.ensemble import WEIGHT_SOLVERS
+
+    # Weight search: "grid" (exhaustive), or "nnls" / "simplex" solvers
+    weight_method = req_cfg.get("weight_method", disk_cfg.get("weight_method", "grid"))
+    allowed = {"grid", *WEIGHT_SOLVERS}
+    if weight_method not in allowed:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown weight_method {weight_method!r}; expected one of {sorted(allowed)}",
+        )
+    return weight_method
+
+
+def _compute_ensemble(
+    request: EnsembleRequest,
+    on_result: Optional[Callable[[EnsembleResult], None]] = None,
+) -> EnsembleResponse:
+    """
+    Run the ensemble forecast, calling ``on_result`` with each course's row
+    as soon as it (and every course before it) has finished.
+    """
     import numpy as np
-    import pandas as pd
-    from forecast_tool.data.loaders import load_historical_data
-    from forecast_tool.data.transformers import quarter_to_date
+    from forecast_tool.data.panel import EnrollmentPanel
     from forecast_tool.forecasting.prophet_forecast import forecast_prophet
     from forecast_tool.forecasting.ets_forecast import forecast_ets
     from forecast_tool.forecasting.arima_forecast import forecast_arima
     from forecast_tool.forecasting.ensemble import (
         ensemble_forecast_weighted,
-        optimize_ensemble_weights,
         DEFAULT_WEIGHTS,
     )
+    from forecast_tool.forecasting.parallel import iter_course_forecasts
 
-    try:
-        disk_cfg = _read_disk_config()
-        req_cfg = request.config or {}
-        capacity = int(req_cfg.get("capacity", disk_cfg.get("capacity", 20)))
-        buffer_percent = float(req_cfg.get("buffer_percent", disk_cfg.get("buffer_percent", 0.0)))
-
-        # forecast_tool loaders use relative paths from project root
-        prev_cwd = os.getcwd()
-        os.chdir(PROJECT_ROOT)
-        try:
-            df_hist = load_historical_data()
-        finally:
-            os.chdir(prev_cwd)
-        if df_hist.empty:
-            raise HTTPException(status_code=404, detail="Historical data not found or empty")
-
-        # Filter to FOUN courses
-        foun_mask = df_hist["course_code"].str.startswith("FOUN ")
-        df_foun = df_hist[foun_mask].copy()
-        if df_foun.empty:
-            raise HTTPException(status_code=404, detail="No FOUN courses in historical data")
-
-        # Optionally filter by course/campus
-        if request.course:
-            df_foun = df_foun[df_foun["course_code"] == request.course]
-        if request.campus:
-            # Historical data doesn't have campus breakdown at this level;
-            # results will be aggregated across campuses
-            pass
-
-        # Group by course and build time series
-        courses = df_foun["course_code"].unique()
-        periods = request.periods
-
-        forecast_fns = {
-            "prophet": forecast_prophet,
-            "ets": forecast_ets,
-            "arima": forecast_arima,
-        }
-
-        results = []
-        weights_used = dict(DEFAULT_WEIGHTS)
-        cv_mape = None
-
-        for course in sorted(courses):
-            course_df = df_foun[df_foun["course_code"] == course]
-            agg = (
-                course_df.groupby(["year", "quarter"])["enrollment"]
-                .sum()
-                .reset_index()
-            )
-            agg["ds"] = agg.apply(
-                lambda row: quarter_to_date(row["year"], row["quarter"]), axis=1
-            )
-            agg = agg.rename(columns={"enrollment": "y"}).sort_values("ds").reset_index(drop=True)
-            df_ts = agg[["ds", "y"]]
-
-            if len(df_ts) < 4:
-                continue
+    disk_cfg = _read_disk_config()
+    req_cfg = request.config or {}
+    capacity = int(req_cfg.get("capacity", disk_cfg.get("capacity", 20)))
+    buffer_percent = float(req_cfg.get("buffer_percent", disk_cfg.get("buffer_percent", 0.0)))
+    weight_method = _ensemble_weight_method(req_cfg, disk_cfg)
+
+    df_hist = registry.history()
+    if df_hist.empty:
+        raise HTTPException(status_code=404, detail="Historical data not found or empty")
+
+    # Filter to FOUN courses
+    foun_mask = df_hist["course_code"].str.startswith("FOUN ")
+    df_foun = df_hist[foun_mask].copy()
+    if df_foun.empty:
+        raise HTTPException(status_code=404, detail="No FOUN courses in historical data")
+
+    # Optionally filter by course/campus
+    if request.course:
+        df_foun = df_foun[df_foun["course_code"] == request.course]
+    if request.campus:
+        # Historical data doesn't have campus breakdown at this level;
+        # results will be aggregated across campuses
+        pass
+
+    # Group by course and build time series
+    periods = request.periods
+
+    forecast_fns = {
+        "prophet": forecast_prophet,
+        "ets": forecast_ets,
+        "arima": forecast_arima,
+    }
+
+    series = EnrollmentPanel(df_foun).quarterly(min_length=4)
+
+    # Fan per-course weight optimization and model fits out over worker
+    # processes (pool size from config "max_workers")
+    max_workers = req_cfg.get("max_workers", disk_cfg.get("max_workers"))
+    max_workers = int(max_workers) if max_workers is not None else None
+
+    optimize_keys = []
+    if request.optimize_weights:
+        optimize_keys = [course for course, df_ts in series.items() if len(df_ts) >= 10]
+    finished = iter_course_forecasts(
+        series,
+        forecast_fns,
+        periods,
+        optimize_keys=optimize_keys,
+        max_workers=max_workers,
+        min_train_size=6,
+        horizon=1,
+        step=1,
+        method=weight_method,
+    )
 
-            # Optimize weights if requested and enough data
-            if request.optimize_weights and len(df_ts) >= 10:
-                try:
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore")
-                        weights_used, best_error = optimize_ensemble_weights(
-                            df_ts, forecast_fns, min_train_size=6, horizon=1, step=1
-                        )
-                    cv_mape = best_error if best_error != float("inf") else None
-                except (ValueError, Exception):
+    results = []
+    weights_used = dict(DEFAULT_WEIGHTS)
+    cv_mape = None
+
+    # Courses finish in any order; rows are assembled in course order since
+    # optimized weights carry forward to courses too short to optimize
+    order = list(series)
+    ready = {}
+    next_index = 0
+    for course, was_optimized, optimized, predictions in finished:
+        ready[course] = (was_optimized, optimized, predictions)
+        while next_index < len(order) and order[next_index] in ready:
+            course = order[next_index]
+            was_optimized, optimized, predictions = ready.pop(course)
+            next_index += 1
+
+            if was_optimized:
+                if optimized is None:
                     weights_used = dict(DEFAULT_WEIGHTS)
+                else:
+                    weights_used, best_error = optimized
+                    cv_mape = best_error if best_error != float("inf") else None
 
-            # Run each model
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                preds = {}
-                for name, fn in forecast_fns.items():
-                    try:
-                        raw = fn(df_ts, periods)
-                        if isinstance(raw, pd.DataFrame):
-                            if not raw.empty and "yhat" in raw.columns:
-                                preds[name] = float(raw["yhat"].values[-1])
-                            else:
-                                preds[name] = float("nan")
-                        else:
-                            arr = np.asarray(raw).flatten()
-                            preds[name] = float(arr[-1]) if len(arr) > 0 else float("nan")
-                    except Exception:
-                        preds[name] = float("nan")
-
-            projected = ensemble_forecast_weighted(preds, weights_used)
+            projected = ensemble_forecast_weighted(predictions, weights_used)
             if np.isnan(projected) or projected <= 0:
                 continue
 
@@ -656,7 +1007,7 @@ def run_ensemble_forecast(request: EnsembleRequest):
             projected *= buffer_mult
             sections = int(np.ceil(projected / capacity)) if capacity > 0 else 0
 
-            results.append(EnsembleResult(
+            row = EnsembleResult(
                 course=course,
                 campus="All",
                 projectedSeats=round(projected, 2),
@@ -664,22 +1015,32 @@ def run_ensemble_forecast(request: EnsembleRequest):
                 method="Ensemble (Prophet+ETS+ARIMA)",
                 weights={k: round(v, 3) for k, v in weights_used.items()},
                 cvMape=round(cv_mape, 2) if cv_mape is not None else None,
-            ))
+            )
+            results.append(row)
+            if on_result is not None:
+                on_result(row)
+
+    total_students = sum(r.projectedSeats for r in results)
+    total_sections = sum(r.sections for r in results)
+
+    return EnsembleResponse(
+        results=results,
+        summary={
+            "totalStudents": round(total_students, 1),
+            "totalSections": total_sections,
+            "coursesForecasted": len(results),
+            "method": "Ensemble (Prophet+ETS+ARIMA)",
+            "weights": {k: round(v, 3) for k, v in weights_used.items()},
+            "cvMape": round(cv_mape, 2) if cv_mape is not None else None,
+        },
+    )
 
-        total_students = sum(r.projectedSeats for r in results)
-        total_sections = sum(r.sections for r in results)
 
-        return EnsembleResponse(
-            results=results,
-            summary={
-                "totalStudents": round(total_students, 1),
-                "totalSections": total_sections,
-                "coursesForecasted": len(results),
-                "method": "Ensemble (Prophet+ETS+ARIMA)",
-                "weights": {k: round(v, 3) for k, v in weights_used.items()},
-                "cvMape": round(cv_mape, 2) if cv_mape is not None else None,
-            },
-        )
+@app.post("/api/forecast/ensemble", response_model=EnsembleResponse)
+def run_ensemble_forecast(request: EnsembleRequest):
+    """Run Prophet+ETS+ARIMA ensemble forecast on historical enrollment data."""
+    try:
+        return _compute_ensemble(request)
     except HTTPException:
         raise
     except ValueError as e:
@@ -688,84 +1049,175 @@ def run_ensemble_forecast(request: EnsembleRequest):
         raise HTTPException(status_code=500, detail="Ensemble forecast failed")
 
 
+def _compute_diagnostics(
+    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> DiagnosticsResponse:
+    """Run diagnostics course by course, calling ``on_result(course, result)`` for each."""
+    import numpy as np
+    from forecast_tool.data.panel import EnrollmentPanel
+    from forecast_tool.diagnostics.stationarity_test import analyze_course, summarize_diagnostics
+
+    df_hist = registry.history()
+    if df_hist.empty:
+        raise HTTPException(status_code=404, detail="Historical data not found or empty")
+
+    foun_mask = df_hist["course_code"].str.startswith("FOUN ") | df_hist["course_code"].str.startswith("DRAW ")
+    df_foun = df_hist[foun_mask].copy()
+
+    # Build per-course enrollment series (aggregated by quarter, ordered chronologically)
+    panel = EnrollmentPanel(df_foun).quarterly(min_length=4)
+    course_dict = {
+        course: panel[course]["y"].rename("enrollment")
+        for course in df_foun["course_code"].unique()
+        if course in panel
+    }
+
+    if not course_dict:
+        raise HTTPException(status_code=404, detail="Insufficient historical data for diagnostics")
+
+    # Sanitize for JSON serialization: convert numpy types, strip arrays
+    def sanitize(obj):
+        if isinstance(obj, dict):
+            return {k: sanitize(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [sanitize(v) for v in obj]
+        if isinstance(obj, (np.bool_,)):
+            return bool(obj)
+        if isinstance(obj, (np.integer,)):
+            return int(obj)
+        if isinstance(obj, (np.floating,)):
+            return float(obj)
+        return obj
+
+    raw_results = {}
+    clean_results = {}
+    for course, series in course_dict.items():
+        raw_results[course] = analyze_course(series)
+        course_data = sanitize(raw_results[course])
+
+        # Remove large arrays from API response
+        seasonality = course_data.get("seasonality", {})
+        for key in ["seasonal_component", "trend_component", "residual_component"]:
+            if key in seasonality:
+                seasonality[key] = None
+
+        clean_results[course] = course_data
+        if on_result is not None:
+            on_result(course, course_data)
+
+    return DiagnosticsResponse(
+        results=clean_results,
+        summary=sanitize(summarize_diagnostics(raw_results)),
+    )
+
+
 @app.get("/api/diagnostics", response_model=DiagnosticsResponse)
 def run_diagnostics():
     """Run stationarity and seasonality diagnostics on all FOUN courses."""
-    import os
-    import numpy as np
-    import pandas as pd
-    from forecast_tool.data.loaders import load_historical_data
-    from forecast_tool.data.transformers import quarter_to_date
-    from forecast_tool.diagnostics.stationarity_test import analyze_all_courses
-
     try:
-        prev_cwd = os.getcwd()
-        os.chdir(PROJECT_ROOT)
-        try:
-            df_hist = load_historical_data()
-        finally:
-            os.chdir(prev_cwd)
-        if df_hist.empty:
-            raise HTTPException(status_code=404, detail="Historical data not found or empty")
-
-        foun_mask = df_hist["course_code"].str.startswith("FOUN ") | df_hist["course_code"].str.startswith("DRAW ")
-        df_foun = df_hist[foun_mask].copy()
-
-        # Build per-course enrollment series (aggregated by quarter, ordered chronologically)
-        course_dict = {}
-        for course in df_foun["course_code"].unique():
-            course_df = df_foun[df_foun["course_code"] == course]
-            agg = (
-                course_df.groupby(["year", "quarter"])["enrollment"]
-                .sum()
-                .reset_index()
-            )
-            agg["ds"] = agg.apply(
-                lambda row: quarter_to_date(row["year"], row["quarter"]), axis=1
-            )
-            agg = agg.sort_values("ds").reset_index(drop=True)
-            if len(agg) >= 4:
-                course_dict[course] = agg["enrollment"]
-
-        if not course_dict:
-            raise HTTPException(status_code=404, detail="Insufficient historical data for diagnostics")
-
-        analysis = analyze_all_courses(course_dict)
-
-        # Sanitize for JSON serialization: convert numpy types, strip arrays
-        def sanitize(obj):
-            if isinstance(obj, dict):
-                return {k: sanitize(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [sanitize(v) for v in obj]
-            if isinstance(obj, (np.bool_,)):
-                return bool(obj)
-            if isinstance(obj, (np.integer,)):
-                return int(obj)
-            if isinstance(obj, (np.floating,)):
-                return float(obj)
-            return obj
-
-        clean_results = sanitize(analysis["results"])
-        clean_summary = sanitize(analysis["summary"])
-
-        # Remove large arrays from API response
-        for course_data in clean_results.values():
-            seasonality = course_data.get("seasonality", {})
-            for key in ["seasonal_component", "trend_component", "residual_component"]:
-                if key in seasonality:
-                    seasonality[key] = None
-
-        return DiagnosticsResponse(
-            results=clean_results,
-            summary=clean_summary,
-        )
+        return _compute_diagnostics()
     except HTTPException:
         raise
     except Exception:
         raise HTTPException(status_code=500, detail="Diagnostics analysis failed")
 
 
+# ============== Background Jobs ==============
+
+jobs = JobManager()
+
+
+class JobSubmitResponse(BaseModel):
+    jobId: str
+    status: str
+    cached: bool
+
+
+class JobStatusResponse(BaseModel):
+    jobId: str
+    kind: str
+    status: str
+    progress: int
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+
+
+def _run_job(compute: Callable[[], BaseModel], failure: str) -> Dict[str, Any]:
+    """Run an endpoint computation for a job, mapping errors to JobFailed."""
+    try:
+        return compute().model_dump()
+    except HTTPException as e:
+        raise JobFailed(str(e.detail), e.status_code)
+    except ValueError as e:
+        raise JobFailed(f"Invalid input: {str(e)}", 400)
+    except Exception:
+        raise JobFailed(failure, 500)
+
+
+@app.post("/api/jobs/ensemble", response_model=JobSubmitResponse)
+def submit_ensemble_job(request: EnsembleRequest):
+    """Start an ensemble forecast in the background; rows stream from /api/jobs/{id}/events."""
+    _ensemble_weight_method(request.config or {}, _read_disk_config())
+    params = {
+        "request": request.model_dump(),
+        "config": _read_disk_config(),
+        "history": registry.history_version(),
+    }
+
+    def compute(emit):
+        return _run_job(
+            lambda: _compute_ensemble(request, lambda row: emit(row.model_dump())),
+            "Ensemble forecast failed",
+        )
+
+    job, cached = jobs.submit("ensemble", params, compute)
+    return JobSubmitResponse(jobId=job.id, status=job.status, cached=cached)
+
+
+@app.post("/api/jobs/diagnostics", response_model=JobSubmitResponse)
+def submit_diagnostics_job():
+    """Start diagnostics in the background; per-course results stream from /api/jobs/{id}/events."""
+    # history_version covers the history CSV and the crosswalk applied to it
+    params = {"history": registry.history_version()}
+
+    def compute(emit):
+        return _run_job(
+            lambda: _compute_diagnostics(
+                lambda course, result: emit({"course": course, **result})
+            ),
+            "Diagnostics analysis failed",
+        )
+
+    job, cached = jobs.submit("diagnostics", params, compute)
+    return JobSubmitResponse(jobId=job.id, status=job.status, cached=cached)
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobStatusResponse)
+def get_job(job_id: str):
+    """Job status, with the full result once completed."""
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobStatusResponse(**job.to_dict())
+
+
+@app.get("/api/jobs/{job_id}/events")
+def stream_job_events(job_id: str, after: int = -1):
+    """
+    Server-Sent Events: a "result" event per course as it finishes, then
+    "done" (final response) or "error". Pass ``after`` (the last event id
+    received) to resume.
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        sse_events(job, start=max(after + 1, 0)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,141 @@
+"""
+Shared source data for the API endpoints.
+
+The registry loads the historical enrollment frame once (in the startup
+warm-up) and hands endpoints read-only views of it, reloading whenever the
+history CSV or the course crosswalk changes on disk (mtime/size). Compiled
+sequencing maps and Master Schedule term lists are served from the
+forecaster's own per-file caches, which refresh the same way.
+
+All paths resolve against the project root, so nothing here depends on the
+process working directory.
+"""
+
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from forecaster import get_available_terms, get_compiled_sequence_map
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size) of a file, or None when it does not exist
+FileStamp = Optional[Tuple[int, int]]
+
+
+def file_stamp(path: Path) -> FileStamp:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class DataRegistry:
+    """
+    Loaded frames and compiled lookups, refreshed when their files change.
+
+    Attributes:
+        root: Directory relative data paths resolve against
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._entries: Dict[str, Tuple[Tuple[FileStamp, ...], Any]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        return path if path.is_absolute() else self.root / path
+
+    def _get(self, name: str, paths: Tuple[Path, ...], build: Callable[[], Any]) -> Any:
+        """Cached ``build()`` result, rebuilt when any of ``paths`` changes."""
+        stamp = tuple(file_stamp(path) for path in paths)
+        with self._lock:
+            cached = self._entries.get(name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        value = build()
+        with self._lock:
+            self._entries[name] = (stamp, value)
+        return value
+
+    @property
+    def history_path(self) -> Path:
+        from forecast_tool.config.settings import HISTORICAL_DATA_PATH
+
+        return self.resolve(HISTORICAL_DATA_PATH)
+
+    @property
+    def crosswalk_path(self) -> Path:
+        from forecast_tool.config.settings import CROSSWALK_PATH
+
+        return self.resolve(CROSSWALK_PATH)
+
+    def history(self):
+        """
+        Processed historical enrollment (forecast_tool loader output).
+
+        Returns a shallow copy: callers may filter or add columns, and
+        copy-on-write keeps the shared frame unchanged.
+        """
+        from forecast_tool.data.loaders import load_historical_data
+
+        hist_path = self.history_path
+        crosswalk_path = self.crosswalk_path
+        frame = self._get(
+            "history",
+            (hist_path, crosswalk_path),
+            lambda: load_historical_data(hist_path, crosswalk_path),
+        )
+        return frame.copy(deep=False)
+
+    def history_version(self) -> List[Optional[List[int]]]:
+        """
+        mtime/size of the historical CSV and the crosswalk (None when a file
+        is missing), so results derived from ``history()`` expire when
+        either changes.
+        """
+        stamps = (file_stamp(self.history_path), file_stamp(self.crosswalk_path))
+        return [list(stamp) if stamp is not None else None for stamp in stamps]
+
+    def file_hash(self, path: Union[str, Path]) -> Optional[str]:
+        """sha256 of a file's content (None if missing), recomputed only when it changes."""
+        path = self.resolve(path)
+
+        def build():
+            if not path.is_file():
+                return None
+            digest = hashlib.sha256()
+            with path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            return digest.hexdigest()
+
+        return self._get(f"hash:{path}", (path,), build)
+
+    def sequence_map(self, path: Union[str, Path]):
+        """Compiled sequencing map for ``path``."""
+        return get_compiled_sequence_map(self.resolve(path))
+
+    def available_terms(self, path: Union[str, Path]) -> List[str]:
+        """Distinct term codes in a Master Schedule CSV."""
+        return get_available_terms(self.resolve(path))
+
+    def warm(self, sequence_map_path: Union[str, Path], enrollment_source_path: Union[str, Path]) -> None:
+        """
+        Load the sequence endpoints' sources up front; failures are logged
+        and retried on first use. The history frame needs pandas, so it is
+        loaded by the background warm-up instead.
+        """
+        loaders = (
+            ("sequencing map", lambda: self.sequence_map(sequence_map_path)),
+            ("enrollment source", lambda: self.available_terms(enrollment_source_path)),
+        )
+        for label, load in loaders:
+            try:
+                load()
+            except Exception as e:
+                logger.warning(f"Could not preload {label}: {e}")
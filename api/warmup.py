@@ -0,0 +1,142 @@
+"""
+Startup warm-up and import budget for the API.
+
+Importing the API only loads what the sequence endpoints need (numpy and
+the sequence forecaster). The model stack (pandas, statsmodels, prophet and
+its Stan backend, plus the historical data) is loaded by a background
+thread once the server is up, so the first ensemble or diagnostics call
+does not pay for it while holding a request. A request that arrives
+mid-warm-up simply waits on the same imports.
+
+``check_import_budget`` measures a cold import in a fresh interpreter; run
+``python api/warmup.py`` (exit code 1 when over budget) from tests or CI.
+"""
+
+import importlib
+import json
+import logging
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+API_DIR = Path(__file__).resolve().parent
+
+# Loaded in the background after startup, in this order
+WARMUP_MODULES = (
+    "pandas",
+    "forecast_tool.data.loaders",
+    "statsmodels.tsa.holtwinters",
+    "statsmodels.tsa.arima.model",
+    "statsmodels.tsa.stattools",
+    "prophet",
+    "forecast_tool.forecasting.prophet_forecast",
+    "forecast_tool.forecasting.ets_forecast",
+    "forecast_tool.forecasting.arima_forecast",
+    "forecast_tool.forecasting.parallel",
+    "forecast_tool.diagnostics.stationarity_test",
+)
+
+# Modules that must not load when the API module is imported
+HEAVY_MODULES = ("pandas", "scipy", "statsmodels", "prophet", "cmdstanpy")
+
+# Cold import budget for the API module, in seconds
+API_IMPORT_BUDGET_SECONDS = 2.0
+
+WARMUP_PENDING = "pending"
+WARMUP_RUNNING = "running"
+WARMUP_DONE = "done"
+WARMUP_FAILED = "failed"
+
+
+class WarmUp:
+    """Background preload of the model stack; ``status`` reports progress."""
+
+    def __init__(self, modules: Iterable[str] = WARMUP_MODULES):
+        self.modules = tuple(modules)
+        self.status = WARMUP_PENDING
+        self.seconds: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self, extra: Optional[Callable[[], Any]] = None) -> None:
+        """Start warming up (once); ``extra`` runs after the imports."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.status = WARMUP_RUNNING
+            self._thread = threading.Thread(
+                target=self._run, args=(extra,), name="warmup", daemon=True
+            )
+            self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until warm-up finishes; returns whether it has."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.status in (WARMUP_DONE, WARMUP_FAILED)
+
+    def _run(self, extra: Optional[Callable[[], Any]]) -> None:
+        start = time.perf_counter()
+        try:
+            for name in self.modules:
+                importlib.import_module(name)
+            # Constructing a model loads the Stan backend
+            from prophet import Prophet
+
+            Prophet()
+            if extra is not None:
+                extra()
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {e}")
+            self.status = WARMUP_FAILED
+        else:
+            self.status = WARMUP_DONE
+        self.seconds = time.perf_counter() - start
+
+
+def check_import_budget(
+    module: str = "main",
+    budget_seconds: float = API_IMPORT_BUDGET_SECONDS,
+    forbidden: Iterable[str] = HEAVY_MODULES,
+) -> Dict[str, Any]:
+    """
+    Import ``module`` in a fresh interpreter and check time and heavy imports.
+
+    Returns:
+        dict with seconds, budget, loaded (forbidden modules that were
+        imported) and ok
+    """
+    forbidden = list(forbidden)
+    code = (
+        "import json, sys, time\n"
+        f"sys.path.insert(0, {str(API_DIR)!r})\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "seconds = time.perf_counter() - start\n"
+        f"loaded = [m for m in {forbidden!r} if m in sys.modules]\n"
+        "print(json.dumps({'seconds': seconds, 'loaded': loaded}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    report = json.loads(output.strip().splitlines()[-1])
+    report["module"] = module
+    report["budget"] = budget_seconds
+    report["ok"] = report["seconds"] <= budget_seconds and not report["loaded"]
+    return report
+
+
+def main(argv: List[str]) -> int:
+    report = check_import_budget(*argv[:1])
+    print(json.dumps(report, indent=2))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -5,6 +5,9 @@ import re
 import os
 import sys
 
+from forecast_tool.data.admissions import find_header_row
+from forecast_tool.data.program_resolver import resolver_for
+from forecast_tool.data.xlsx_reader import XlsxReader
 from utils import get_data_dir
 
 # --- Configuration ---
@@ -94,38 +97,43 @@ def parse_masterlist_requirements(path):
     return major_courses, major_codes
 
 def load_admissions_data(filepath):
-    xl = pd.ExcelFile(filepath)
     all_data = []
-    HEADER_ROW = 10
 
-    for sheet in xl.sheet_names:
+    def is_spring_sheet(sheet):
         sheet_upper = sheet.upper()
-        if "202620" not in sheet_upper: continue
-        
-        is_fr = "FR" in sheet_upper
-        is_tr = "TR" in sheet_upper
-        if not (is_fr or is_tr): continue
-        
-        df = xl.parse(sheet, header=HEADER_ROW)
-        
-        loc_col = 'Campus'
-        if is_fr:
-            target_col = '1st Interest'
-            st_type = 'FR'
-        elif is_tr:
-            target_col = 'Major'
-            st_type = 'TR'
-            
-        if target_col not in df.columns: continue
-        if loc_col not in df.columns: df[loc_col] = 'Unknown'
-
-        grouped = df.groupby([target_col, loc_col]).size().reset_index(name='Count')
-        grouped.columns = ['MajorRaw', 'Location', 'Count']
-        grouped['StudentType'] = st_type
-        all_data.append(grouped)
+        return "202620" in sheet_upper and ("FR" in sheet_upper or "TR" in sheet_upper)
+
+    with XlsxReader(filepath) as book:
+        for sheet in book.sheet_names(is_spring_sheet):
+            sheet_upper = sheet.upper()
+            if "FR" in sheet_upper:
+                target_col = '1st Interest'
+                st_type = 'FR'
+            else:
+                target_col = 'Major'
+                st_type = 'TR'
+
+            # Header row located as the admissions parser does
+            found = find_header_row(book, sheet)
+            if found is None: continue
+            header_number, header = found
+            if target_col not in header: continue
+            target_idx = header.index(target_col)
+            loc_idx = header.index('Campus') if 'Campus' in header else None
+
+            # Count (major, campus) pairs; blank cells are dropped as groupby drops NaN
+            counts = {}
+            for row in book.iter_rows(sheet, min_row=header_number + 1):
+                major = row[target_idx] if target_idx < len(row) else ""
+                loc = 'Unknown' if loc_idx is None else (row[loc_idx] if loc_idx < len(row) else "")
+                if major == "" or loc == "": continue
+                counts[(major, loc)] = counts.get((major, loc), 0) + 1
+
+            for (major, loc), count in sorted(counts.items()):
+                all_data.append({'MajorRaw': major, 'Location': loc, 'Count': count, 'StudentType': st_type})
 
     if not all_data: return pd.DataFrame()
-    return pd.concat(all_data, ignore_index=True)
+    return pd.DataFrame(all_data)
 
 def calculate_demand(admissions_df, major_courses, extracted_codes):
     demand_list = []
@@ -155,6 +163,7 @@ def calculate_demand(admissions_df, major_courses, extracted_codes):
                     break
     
     unmapped_majors = set()
+    resolver = resolver_for(major_courses)
     
     for _, row in admissions_df.iterrows():
         raw_major = str(row['MajorRaw'])
@@ -177,12 +186,10 @@ def calculate_demand(admissions_df, major_courses, extracted_codes):
         
         # 3. Fuzzy Logic
         if not matched_key:
-            # 'ANIMATION' -> 'ANIMATION 2D...'
-            for mk in major_courses.keys():
-                # Starts with logic: "ANIMATION" matches "ANIMATION 2D..."
-                if mk.startswith(clean_adm):
-                    matched_key = mk
-                    break
+            # Starts with logic: "ANIMATION" matches "ANIMATION 2D..."
+            prefixed = resolver.with_prefix(clean_adm)
+            if prefixed:
+                matched_key = prefixed[0]
         
         if matched_key:
             for course in major_courses[matched_key]:
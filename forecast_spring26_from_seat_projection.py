@@ -2,12 +2,12 @@
 
 import csv
 import math
-import zipfile
-import xml.etree.ElementTree as ET
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
+from forecast_tool.data.xlsx_reader import read_sheet_rows
+
 
 DATA_DIR = Path(__file__).resolve().parent / "Data"
 SEQUENCE_PATH = DATA_DIR / "clon_sav_atl_seat_projection_202630_20260107.xlsx"
@@ -17,20 +17,6 @@ OUTPUT_PATH = DATA_DIR / "Spring_2026_FOUN_Forecast_SAV_SCADnow.csv"
 
 SECTION_CAPACITY = 20
 
-NS = {
-    "main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
-    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
-}
-
-
-def col_letter_to_index(col: str) -> int:
-    idx = 0
-    for ch in col:
-        if not ch.isalpha():
-            break
-        idx = idx * 26 + (ord(ch.upper()) - ord("A") + 1)
-    return idx
-
 
 def parse_float(value: str) -> float:
     try:
@@ -39,81 +25,6 @@ def parse_float(value: str) -> float:
         return 0.0
 
 
-def load_shared_strings(zf: zipfile.ZipFile) -> List[str]:
-    try:
-        with zf.open("xl/sharedStrings.xml") as f:
-            root = ET.parse(f).getroot()
-    except KeyError:
-        return []
-
-    strings = []
-    for si in root.findall("main:si", NS):
-        texts = []
-        for t in si.findall(".//main:t", NS):
-            texts.append(t.text or "")
-        strings.append("".join(texts))
-    return strings
-
-
-def load_sheet_targets(zf: zipfile.ZipFile) -> Dict[str, str]:
-    with zf.open("xl/workbook.xml") as f:
-        root = ET.parse(f).getroot()
-        sheets = []
-        for sheet in root.findall("main:sheets/main:sheet", NS):
-            name = sheet.attrib.get("name")
-            rid = sheet.attrib.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id")
-            sheets.append((name, rid))
-
-    with zf.open("xl/_rels/workbook.xml.rels") as f:
-        root = ET.parse(f).getroot()
-        rid_to_target = {
-            rel.attrib["Id"]: rel.attrib["Target"]
-            for rel in root.findall("rel:Relationship", NS)
-        }
-
-    return {name: rid_to_target[rid] for name, rid in sheets if rid in rid_to_target}
-
-
-def read_sheet_rows(path: Path, sheet_name: str) -> List[List[str]]:
-    with zipfile.ZipFile(path) as zf:
-        shared_strings = load_shared_strings(zf)
-        targets = load_sheet_targets(zf)
-        target = targets.get(sheet_name)
-        if not target:
-            raise KeyError(f"Sheet not found: {sheet_name}")
-
-        with zf.open(f"xl/{target}") as f:
-            root = ET.parse(f).getroot()
-
-        rows: List[List[str]] = []
-        for row in root.findall(".//main:sheetData/main:row", NS):
-            cells: Dict[int, str] = {}
-            for c in row.findall("main:c", NS):
-                ref = c.attrib.get("r")
-                if not ref:
-                    continue
-                col_letters = "".join(ch for ch in ref if ch.isalpha())
-                col_idx = col_letter_to_index(col_letters)
-                cell_type = c.attrib.get("t")
-                v = c.find("main:v", NS)
-                if v is None:
-                    value = ""
-                else:
-                    raw = v.text or ""
-                    if cell_type == "s":
-                        try:
-                            value = shared_strings[int(raw)]
-                        except (ValueError, IndexError):
-                            value = raw
-                    else:
-                        value = raw
-                cells[col_idx] = value
-            if cells:
-                max_col = max(cells)
-                rows.append([cells.get(i, "") for i in range(1, max_col + 1)])
-        return rows
-
-
 def extract_foun_totals(path: Path, sheet_name: str) -> Dict[str, float]:
     rows = read_sheet_rows(path, sheet_name)
     if not rows:
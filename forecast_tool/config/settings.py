@@ -2,6 +2,8 @@
 Default configuration settings for the forecasting tool.
 """
 
+import os
+
 # Forecasting Parameters
 DEFAULT_SECTION_CAPACITY = 20
 DEFAULT_BUFFER_PERCENT = 10
@@ -16,6 +18,17 @@ HISTORICAL_DATA_PATH = "Data/FOUN_Historical.csv"
 MASTERLIST_BY_MAJOR_PATH = "Data/Masterlist_FOUN_courses_by_major.xlsx"
 MASTERLIST_BY_QUARTER_PATH = "Data/Masterlist_FOUN_courses_by_quarter.xlsx"
 
+# Parallel Execution
+FORECAST_MAX_WORKERS = None  # Process pool size for per-course fits; None = os.cpu_count()
+
+# Fitted-model cache (pickled fits keyed by series fingerprint, LRU-evicted).
+# Holds final fits only (about one per course and model); CV folds bypass it.
+MODEL_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    ".model_cache",
+)
+MODEL_CACHE_MAX_ENTRIES = 256
+
 # Model Configuration
 PROPHET_YEARLY_SEASONALITY = True
 PROPHET_WEEKLY_SEASONALITY = False
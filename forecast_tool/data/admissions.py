@@ -0,0 +1,147 @@
+"""
+Admissions report parsing.
+
+Reads the "Accepted Applicants with Latest Decision" workbook (one sheet per
+``<term> - <campus> - <FR|TR>``) into applicant counts by program interest,
+for the accepted and confirmed (MAT fee paid) scenarios. Program names are
+normalized the same way as the sequencing map's, so the two can be matched.
+"""
+
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from forecast_tool.data.xlsx_reader import XlsxReader
+
+SHEET_RE = re.compile(r"^(?P<term>\d{6})\s*-\s*(?P<campus>[A-Z]{3})\s*-\s*(?P<stype>FR|TR)\s*$")
+
+# Sheet campus codes -> campus names used in forecasts
+ADMISSIONS_CAMPUSES = {"SAV": "Savannah", "ATL": "Atlanta", "ELN": "SCADnow"}
+
+ADMISSIONS_SCENARIOS = ("accepted", "confirmed")
+
+# A sheet's header row is the first row naming either interest column,
+# within the report's preamble
+HEADER_LABELS = ("1st Interest", "Major")
+HEADER_SEARCH_ROWS = 40
+
+# counts[(term, campus_name, stype)][scenario][interest] = applicants
+AdmissionsCounts = Dict[Tuple[str, str, str], Dict[str, Dict[str, int]]]
+
+
+def normalize_text(value: str) -> str:
+    value = value or ""
+    value = str(value).upper()
+    value = value.replace("&", " AND ")
+    value = value.replace("/", " ")
+    value = value.replace("-", " ")
+    value = re.sub(r"[()]", " ", value)
+    value = re.sub(r"^\d+\s+", "", value)  # e.g. "1 Acting"
+    value = re.sub(r"\s+", " ", value)
+    return value.strip()
+
+
+def normalize_program_base(program: str) -> str:
+    program = normalize_text(program)
+    program = program.replace("ON LY", "ONLY")  # typo observed in source
+    program = re.sub(r"\b(FALL|WINTER|SPRING)\s+ONLY\b", " ", program)
+    program = re.sub(r"\bGROUP\s+[A-Z]\b", " ", program)
+    program = re.sub(r"\s+", " ", program).strip()
+    return program
+
+
+def find_header_row(book: XlsxReader, sheet_name: str) -> Optional[Tuple[int, List[str]]]:
+    """
+    Locate an admissions sheet's header row.
+
+    Returns:
+        (1-based row number, header values), or None when no row within
+        HEADER_SEARCH_ROWS names an interest column
+    """
+    for number, row in book.iter_numbered_rows(sheet_name, max_row=HEADER_SEARCH_ROWS):
+        if any(label in row for label in HEADER_LABELS):
+            return number, list(row)
+    return None
+
+
+def parse_admissions_counts(
+    admissions_path: Path,
+    terms: Optional[Iterable[str]] = None,
+) -> AdmissionsCounts:
+    """
+    Count admitted applicants per sheet and program interest.
+
+    Args:
+        admissions_path: Admissions workbook
+        terms: Term codes to read (all sheets when None)
+
+    Returns:
+        counts[(term, campus_name, stype)][scenario][interest_name] = count
+        where scenario is "accepted" or "confirmed"
+    """
+    terms = set(terms) if terms is not None else None
+    counts: AdmissionsCounts = defaultdict(
+        lambda: {"accepted": defaultdict(int), "confirmed": defaultdict(int)}
+    )
+
+    with XlsxReader(admissions_path) as book:
+        for sheet_name in book.sheet_names(SHEET_RE):
+            match = SHEET_RE.match(sheet_name.strip())
+            term = match.group("term")
+            campus_code = match.group("campus")
+            stype = match.group("stype")
+            if terms is not None and term not in terms:
+                continue
+            campus_name = ADMISSIONS_CAMPUSES.get(campus_code, campus_code)
+            _count_admissions_sheet(
+                book, sheet_name, counts[(term, campus_name, stype)]
+            )
+
+    return counts
+
+
+def _count_admissions_sheet(
+    book: XlsxReader,
+    sheet_name: str,
+    sheet_counts: Dict[str, Dict[str, int]],
+) -> None:
+    """Add one admissions sheet's accepted/confirmed counts by interest."""
+    header = find_header_row(book, sheet_name)
+    if header is None:
+        return
+    header_row_idx, headers = header
+
+    def col_index(label: str) -> Optional[int]:
+        try:
+            return headers.index(label)
+        except ValueError:
+            return None
+
+    interest_idx = col_index("1st Interest")
+    major_idx = col_index("Major")
+    decision_idx = col_index("Latest Decision")
+    mat_fee_date_idx = col_index("MAT Fee Paid Date")
+
+    for row in book.iter_rows(sheet_name, min_row=header_row_idx + 1):
+        if not row or not any(row):
+            continue
+
+        raw_interest = row[interest_idx] if (interest_idx is not None and interest_idx < len(row)) else None
+        raw_major = row[major_idx] if (major_idx is not None and major_idx < len(row)) else None
+        raw_decision = row[decision_idx] if (decision_idx is not None and decision_idx < len(row)) else None
+        raw_mat_fee_date = row[mat_fee_date_idx] if (mat_fee_date_idx is not None and mat_fee_date_idx < len(row)) else None
+
+        interest = raw_interest or raw_major
+        if not interest:
+            continue
+        interest_norm = normalize_program_base(str(interest))
+        if not interest_norm:
+            continue
+
+        sheet_counts["accepted"][interest_norm] += 1
+
+        decision_text = normalize_text(str(raw_decision)) if raw_decision else ""
+        is_confirmed = bool(raw_mat_fee_date) or ("MAT FEE" in decision_text)
+        if is_confirmed:
+            sheet_counts["confirmed"][interest_norm] += 1
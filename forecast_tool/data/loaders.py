@@ -6,44 +6,54 @@ Extracted from app.py for modularity.
 import logging
 import pandas as pd
 
+from forecast_tool.config.settings import CROSSWALK_PATH, HISTORICAL_DATA_PATH
+from forecast_tool.data.ratio_cube import ratio_cube_from_frame
+from forecast_tool.data.snapshot import read_history_csv
+from forecast_tool.data.transformers import parse_term_codes
+
 logger = logging.getLogger(__name__)
 
 
-def load_course_mapping():
+def load_course_mapping(crosswalk_path=CROSSWALK_PATH):
     """
     Load course code mapping from Data/sequence_crosswalk_template.csv.
 
+    Args:
+        crosswalk_path: Crosswalk CSV (relative paths resolve against the cwd)
+
     Returns:
         dict: Mapping from legacy course codes to FOUN course codes.
               Returns empty dict if file not found or error occurs.
     """
     try:
-        crosswalk_path = "Data/sequence_crosswalk_template.csv"
         df_cross = pd.read_csv(crosswalk_path)
         # Create dictionary: legacy_code -> foun_code
         # Strip whitespace just in case
         mapping = dict(zip(df_cross['legacy_code'].str.strip(), df_cross['foun_code'].str.strip()))
         return mapping
     except FileNotFoundError:
-        logger.warning("Crosswalk file (Data/sequence_crosswalk_template.csv) not found.")
+        logger.warning(f"Crosswalk file ({crosswalk_path}) not found.")
         return {}
     except Exception as e:
         logger.warning(f"Error loading crosswalk: {e}")
         return {}
 
 
-def load_historical_data():
+def load_historical_data(hist_path=HISTORICAL_DATA_PATH, crosswalk_path=CROSSWALK_PATH):
     """
     Load and process historical data from Data/FOUN_Historical.csv.
 
+    Args:
+        hist_path: Historical enrollment CSV (relative paths resolve against the cwd)
+        crosswalk_path: Crosswalk CSV applied to the course codes
+
     Returns:
         pd.DataFrame: Processed historical enrollment data with columns:
             year, quarter, course_code, enrollment, waitlist.
             Returns empty DataFrame if file not found or error occurs.
     """
     try:
-        hist_path = "Data/FOUN_Historical.csv"
-        df_hist = pd.read_csv(hist_path)
+        df_hist = read_history_csv(hist_path)
 
         # Process columns
         # Combine SUBJ and CRS NUMBER to create Course
@@ -57,25 +67,10 @@ def load_historical_data():
 
         # Parse TERM (YYYYMM)
         # 10=Fall (prev year), 20=Winter, 30=Spring, 40=Summer
-        def parse_term(term_code):
-            term_str = str(term_code)
-            year_part = int(term_str[:4])
-            suffix = int(term_str[4:])
-
-            if suffix == 10:
-                return 'Fall', year_part - 1
-            elif suffix == 20:
-                return 'Winter', year_part
-            elif suffix == 30:
-                return 'Spring', year_part
-            elif suffix == 40:
-                return 'Summer', year_part
-            return None, None
-
-        df_hist[['quarter', 'year']] = df_hist['TERM'].apply(lambda x: pd.Series(parse_term(x)))
+        df_hist[['quarter', 'year']] = parse_term_codes(df_hist['TERM'])
 
         # Apply Course Mapping
-        mapping = load_course_mapping()
+        mapping = load_course_mapping(crosswalk_path)
         if mapping:
             # Use map to replace, fillna with original to keep codes that don't need mapping
             df_hist['course_code'] = df_hist['course_code'].map(mapping).fillna(df_hist['course_code'])
@@ -83,7 +78,7 @@ def load_historical_data():
         return df_hist[['year', 'quarter', 'course_code', 'enrollment', 'waitlist']]
 
     except FileNotFoundError:
-        logger.warning("Historical data file (Data/FOUN_Historical.csv) not found.")
+        logger.warning(f"Historical data file ({hist_path}) not found.")
         return pd.DataFrame()
     except Exception as e:
         logger.warning(f"Error loading historical data: {e}")
@@ -92,36 +87,10 @@ def load_historical_data():
 
 def calculate_summer_ratios(df):
     """Calculate average Summer/Spring ratio for each course."""
-    ratios = {}
-
     # Ensure we have necessary columns
     if 'course_code' not in df.columns or 'quarter' not in df.columns or 'year' not in df.columns:
-        return ratios
-
-    # Group by Course, Year, Quarter
-    # We need to sum enrollment in case there are multiple rows per course/term
-    df_agg = df.groupby(['course_code', 'year', 'quarter'])['enrollment'].sum().reset_index()
-
-    courses = df_agg['course_code'].unique()
-
-    for course in courses:
-        course_df = df_agg[df_agg['course_code'] == course]
-        course_ratios = []
-
-        years = course_df['year'].unique()
-        for year in years:
-            # Find Spring and Summer for this year
-            spring = course_df[(course_df['year'] == year) & (course_df['quarter'].str.lower() == 'spring')]
-            summer = course_df[(course_df['year'] == year) & (course_df['quarter'].str.lower() == 'summer')]
-
-            if not spring.empty and not summer.empty:
-                spring_val = spring['enrollment'].values[0]
-                summer_val = summer['enrollment'].values[0]
-
-                if spring_val > 0:
-                    course_ratios.append(summer_val / spring_val)
-
-        if course_ratios:
-            ratios[course] = sum(course_ratios) / len(course_ratios)
+        return {}
 
-    return ratios
+    # Pivot once into a course x year x quarter cube; the ratio is a slice of it
+    cube = ratio_cube_from_frame(df)
+    return cube.mean_ratios('summer', 'spring', require_positive_target=False)
@@ -0,0 +1,141 @@
+"""
+Grouped enrollment panel.
+
+Sorts a long enrollment frame (course_code, campus, year, quarter,
+enrollment, ...) by its key columns once, so every course (or course and
+campus) is one contiguous block of rows. Per-group frames, column arrays,
+quarterly series and quarter-over-quarter ratios are slices of those
+blocks, instead of a boolean filter over the whole frame per course.
+"""
+
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from forecast_tool.data.transformers import quarters_to_dates
+
+
+def _group_slices(df: pd.DataFrame, key_columns: List[str]) -> Dict[Any, slice]:
+    """Map each group key to its row slice in a frame sorted by ``key_columns``."""
+    n = len(df)
+    if n == 0:
+        return {}
+    starts_mask = np.zeros(n, dtype=bool)
+    starts_mask[0] = True
+    columns = [df[col].to_numpy() for col in key_columns]
+    for values in columns:
+        starts_mask[1:] |= values[1:] != values[:-1]
+    starts = np.flatnonzero(starts_mask)
+    stops = np.append(starts[1:], n)
+    if len(columns) == 1:
+        keys = columns[0][starts].tolist()
+    else:
+        keys = list(zip(*(values[starts].tolist() for values in columns)))
+    return {key: slice(int(a), int(b)) for key, a, b in zip(keys, starts, stops)}
+
+
+class EnrollmentPanel:
+    """
+    Enrollment rows grouped once by one or more key columns.
+
+    Keys are column values for a single key column and tuples for several
+    (e.g. ``("FOUN 110", "SAV")`` for ``keys=["course_code", "campus"]``),
+    in sorted order. Rows with a missing key are dropped, as in groupby.
+
+    Attributes:
+        key_columns: Columns the rows are grouped by
+        data: The rows, sorted by key (original order within a group)
+    """
+
+    def __init__(self, df: pd.DataFrame, keys: Union[str, Sequence[str]] = "course_code"):
+        self.key_columns = [keys] if isinstance(keys, str) else list(keys)
+        data = df.dropna(subset=self.key_columns)
+        self.data = data.sort_values(self.key_columns, kind="stable").reset_index(drop=True)
+        self._slices = _group_slices(self.data, self.key_columns)
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._slices)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._slices)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._slices
+
+    @property
+    def keys(self) -> List[Any]:
+        return list(self._slices)
+
+    def frame(self, key: Any) -> pd.DataFrame:
+        """Rows of one group (a contiguous slice of ``data``)."""
+        return self.data.iloc[self._slices[key]]
+
+    def items(self) -> Iterator[Tuple[Any, pd.DataFrame]]:
+        """(key, rows) for every group, in key order."""
+        for key, rows in self._slices.items():
+            yield key, self.data.iloc[rows]
+
+    def values(self, key: Any, column: str) -> np.ndarray:
+        """One group's values of ``column`` (a view of the column array)."""
+        array = self._arrays.get(column)
+        if array is None:
+            array = self._arrays[column] = self.data[column].to_numpy()
+        return array[self._slices[key]]
+
+    def quarterly(self, value_col: str = "enrollment", min_length: int = 0) -> Dict[Any, pd.DataFrame]:
+        """
+        Every group's quarterly series, built with one groupby.
+
+        Args:
+            value_col: Column summed per group and quarter
+            min_length: Drop groups with fewer quarters than this
+
+        Returns:
+            {key: DataFrame with 'ds' and 'y', sorted by ds}
+        """
+        group_cols = self.key_columns + ["year", "quarter"]
+        agg = self.data.groupby(group_cols)[value_col].sum().reset_index()
+        agg["ds"] = quarters_to_dates(agg["year"], agg["quarter"])
+        agg = agg.rename(columns={value_col: "y"})
+        agg = agg.sort_values(self.key_columns + ["ds"]).reset_index(drop=True)
+        return {
+            key: agg.iloc[rows][["ds", "y"]].reset_index(drop=True)
+            for key, rows in _group_slices(agg, self.key_columns).items()
+            if rows.stop - rows.start >= min_length
+        }
+
+    def quarter_ratios(
+        self,
+        target_quarter: str,
+        feeder_quarter: str,
+        value_col: str = "enrollment",
+    ) -> Dict[Any, float]:
+        """
+        Mean target/feeder quarter ratio per group across years.
+
+        A year counts when both quarters have rows that year and the feeder
+        total is positive; groups with no such year are omitted.
+
+        Args:
+            target_quarter: Quarter name in the numerator (e.g. "summer")
+            feeder_quarter: Quarter name in the denominator (e.g. "spring")
+            value_col: Column summed per quarter
+        """
+        target = target_quarter.strip().lower()
+        feeder = feeder_quarter.strip().lower()
+        quarter = self.data["quarter"].astype(str).str.strip().str.lower()
+        rows = self.data.assign(_quarter=quarter)[quarter.isin([target, feeder])]
+        totals = (
+            rows.groupby(self.key_columns + ["year", "_quarter"])[value_col]
+            .sum()
+            .unstack("_quarter")
+        )
+        if target not in totals.columns or feeder not in totals.columns:
+            return {}
+        valid = totals[target].notna() & (totals[feeder] > 0)
+        ratios = totals.loc[valid, target] / totals.loc[valid, feeder]
+        levels = self.key_columns if len(self.key_columns) > 1 else self.key_columns[0]
+        means = ratios.groupby(level=levels).mean()
+        return {key: float(value) for key, value in means.items()}
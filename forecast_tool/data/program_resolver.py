@@ -0,0 +1,237 @@
+"""
+Program-name resolution for matching admissions interests to map rows.
+
+Admissions exports name programs loosely ("Animation", "UX Design",
+"1 Acting"), while the sequencing map and the FOUN masterlist use their own
+spellings. ``ProgramResolver`` indexes a fixed set of normalized program keys
+once and answers the lookups the demand scripts need:
+
+- ``exact``: dict lookup
+- ``with_prefix``: keys starting with the name, from a character prefix trie
+- ``containing``: keys that contain the name or are contained in it, with
+  candidates narrowed by a trigram index before the substring check
+- ``close``: difflib-style fuzzy matches, scored only against keys that
+  share a bigram with the name or are short enough to match without one
+
+Results are memoized per (map version, raw name), where the version is a
+hash of the keys, so repeated interests across cohorts and scenarios cost a
+dict lookup. ``resolver_for`` returns one shared resolver per key set and
+normalizer.
+"""
+
+import difflib
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+NGRAM_SIZE = 3
+
+# Shared resolvers by map version; a handful of maps are live at most
+_RESOLVER_CACHE_SIZE = 16
+
+# Memoized lookups per resolver (least recently used are dropped)
+_MEMO_SIZE = 4096
+
+
+def keys_version(keys: Iterable[str]) -> str:
+    """Stable hash of an ordered key set."""
+    digest = hashlib.sha1()
+    for key in keys:
+        digest.update(key.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _ngrams(text: str, size: int = NGRAM_SIZE) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Indices of the keys below this node, in key order
+        self.ids: List[int] = []
+
+
+class ProgramResolver:
+    """
+    Precomputed lookup over a fixed, ordered set of normalized program keys.
+
+    Args:
+        keys: Normalized program keys; their order breaks ties the same way
+              a linear scan over them would
+        normalize: Applied to raw names before lookup (identity by default)
+    """
+
+    def __init__(self, keys: Iterable[str], normalize: Optional[Callable[[str], str]] = None):
+        self.keys: Tuple[str, ...] = tuple(dict.fromkeys(keys))
+        self.normalize = normalize or (lambda name: name)
+        self.version = keys_version(self.keys)
+
+        self._exact = {key: i for i, key in enumerate(self.keys)}
+
+        self._trie = _TrieNode()
+        for i, key in enumerate(self.keys):
+            node = self._trie
+            node.ids.append(i)
+            for ch in key:
+                node = node.children.setdefault(ch, _TrieNode())
+                node.ids.append(i)
+
+        self._key_ngrams = [_ngrams(key) for key in self.keys]
+        self._ngram_index: Dict[str, List[int]] = {}
+        for i, grams in enumerate(self._key_ngrams):
+            for gram in grams:
+                self._ngram_index.setdefault(gram, []).append(i)
+        # Keys too short to have an n-gram are always checked directly
+        self._short_ids = [i for i, grams in enumerate(self._key_ngrams) if not grams]
+
+        self._bigram_index: Dict[str, List[int]] = {}
+        self._ids_by_length: Dict[int, List[int]] = {}
+        for i, key in enumerate(self.keys):
+            for gram in _ngrams(key, 2):
+                self._bigram_index.setdefault(gram, []).append(i)
+            self._ids_by_length.setdefault(len(key), []).append(i)
+
+        self._memo: "OrderedDict[Tuple[str, str, str], Tuple[str, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _memoized(self, kind: str, raw: str, compute: Callable[[str], Tuple[str, ...]]) -> Tuple[str, ...]:
+        memo_key = (self.version, kind, raw)
+        with self._lock:
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                self._memo.move_to_end(memo_key)
+                return cached
+        result = compute(self.normalize(raw))
+        with self._lock:
+            self._memo[memo_key] = result
+            while len(self._memo) > _MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return result
+
+    def _shared_ngram_counts(self, name: str) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        for gram in _ngrams(name):
+            for i in self._ngram_index.get(gram, ()):
+                counts[i] = counts.get(i, 0) + 1
+        return counts
+
+    def _with_prefix(self, name: str) -> Tuple[str, ...]:
+        node = self._trie
+        for ch in name:
+            node = node.children.get(ch)
+            if node is None:
+                return ()
+        return tuple(self.keys[i] for i in node.ids)
+
+    def _containing(self, name: str) -> Tuple[str, ...]:
+        if not name:
+            return ()
+        name_grams = _ngrams(name)
+        if not name_grams:
+            # Too short to index: check every key
+            candidates = range(len(self.keys))
+        else:
+            # A key inside the name has all of its n-grams in the name; a key
+            # containing the name has all of the name's n-grams.
+            counts = self._shared_ngram_counts(name)
+            candidates = [
+                i for i, shared in counts.items()
+                if shared == len(self._key_ngrams[i]) or shared == len(name_grams)
+            ]
+            candidates.extend(self._short_ids)
+        found = sorted(i for i in candidates if self.keys[i] in name or name in self.keys[i])
+        return tuple(sorted((self.keys[i] for i in found), key=len))
+
+    def _close(self, name: str, n: int, cutoff: float) -> Tuple[str, ...]:
+        if not name:
+            return ()
+        if cutoff <= 2 / 3:
+            candidates = list(self.keys)
+        else:
+            # difflib matches a key with no bigram in common with the name
+            # one character at a time, and consecutive matched characters
+            # are separated in at least one of the strings. M matched
+            # characters then need len(name) + len(key) >= 3M - 1, so the
+            # ratio 2M / (len(name) + len(key)) is at most 2M / (3M - 1);
+            # only keys short enough to stay above the cutoff that way can
+            # match without a shared bigram.
+            # (the epsilon only widens the candidate set against float error)
+            max_matched = int(cutoff / (3 * cutoff - 2) + 1e-9)
+            max_length = int(2 * max_matched / cutoff + 1e-9) - len(name)
+            ids = {i for gram in _ngrams(name, 2) for i in self._bigram_index.get(gram, ())}
+            for length, length_ids in self._ids_by_length.items():
+                if length <= max_length:
+                    ids.update(length_ids)
+            candidates = [self.keys[i] for i in sorted(ids)]
+        return tuple(difflib.get_close_matches(name, candidates, n=n, cutoff=cutoff))
+
+    def exact(self, raw: str) -> Optional[str]:
+        """The key equal to the normalized name, if any."""
+        name = self.normalize(raw)
+        return name if name in self._exact else None
+
+    def with_prefix(self, raw: str) -> Tuple[str, ...]:
+        """Keys starting with the normalized name, in key order."""
+        return self._memoized("prefix", raw, self._with_prefix)
+
+    def containing(self, raw: str) -> Tuple[str, ...]:
+        """
+        Keys that contain the normalized name or are contained in it,
+        shortest first (key order within a length).
+        """
+        return self._memoized("containing", raw, self._containing)
+
+    def close(self, raw: str, n: int = 5, cutoff: float = 0.78) -> Tuple[str, ...]:
+        """
+        Fuzzy matches as ``difflib.get_close_matches`` ranks them, scored only
+        against keys that can reach ``cutoff``: those sharing a bigram with
+        the name, plus very short keys (all keys when ``cutoff`` <= 2/3).
+        """
+        return self._memoized(f"close:{n}:{cutoff}", raw, lambda name: self._close(name, n, cutoff))
+
+    def matches(self, raw: str) -> Tuple[str, ...]:
+        """
+        Best keys for a raw name: the exact key, else the containing keys,
+        else the fuzzy matches (empty when nothing qualifies).
+        """
+
+        def compute(name: str) -> Tuple[str, ...]:
+            if not name:
+                return ()
+            if name in self._exact:
+                return (name,)
+            return self._containing(name) or self._close(name, 5, 0.78)
+
+        return self._memoized("matches", raw, compute)
+
+
+_resolvers: "OrderedDict[Tuple[str, Optional[Callable[[str], str]]], ProgramResolver]" = OrderedDict()
+_resolvers_lock = threading.Lock()
+
+
+def resolver_for(keys: Iterable[str], normalize: Optional[Callable[[str], str]] = None) -> ProgramResolver:
+    """
+    Shared resolver for a key set and normalizer, so memoized matches carry
+    over between calls (and cohorts) that use the same map.
+
+    The normalizer itself is part of the cache key (and kept alive by it),
+    so pass the same function object each time, e.g. a module-level one.
+    """
+    keys = tuple(dict.fromkeys(keys))
+    cache_key = (keys_version(keys), normalize)
+    with _resolvers_lock:
+        resolver = _resolvers.get(cache_key)
+        if resolver is not None:
+            _resolvers.move_to_end(cache_key)
+            return resolver
+    resolver = ProgramResolver(keys, normalize)
+    with _resolvers_lock:
+        _resolvers[cache_key] = resolver
+        while len(_resolvers) > _RESOLVER_CACHE_SIZE:
+            _resolvers.popitem(last=False)
+    return resolver
@@ -0,0 +1,261 @@
+"""
+Quarter-over-quarter enrollment ratio cube.
+
+Pivots enrollment into a course x academic year x quarter array once, so any
+target/feeder quarter ratio (and its mean and dispersion across years) is an
+array slice instead of a loop of DataFrame filters. The cube for the raw
+historical CSV is persisted next to it and reused by the FastAPI backend
+across requests and restarts. The Streamlit loaders build theirs in memory
+from the frame they are given (already combined and crosswalked), since it
+is not the raw CSV.
+"""
+
+import csv
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from forecast_tool.config.settings import HISTORICAL_DATA_PATH
+
+logger = logging.getLogger(__name__)
+
+# Quarter axis order; SCAD term codes end in these digits
+QUARTER_CODES: Dict[str, int] = {"fall": 10, "winter": 20, "spring": 30, "summer": 40}
+_QUARTER_AXIS: Dict[int, int] = {code: i for i, code in enumerate(QUARTER_CODES.values())}
+
+RATIO_CUBE_SUFFIX = ".ratiocube.npz"
+RATIO_CUBE_VERSION = 1
+
+
+@dataclass
+class RatioCube:
+    """Enrollment pivoted to (courses x academic years x quarters).
+
+    ``observed`` marks cells that had at least one source row, so a
+    recorded zero can be told apart from a missing term.
+    """
+
+    courses: np.ndarray
+    years: np.ndarray
+    enrollment: np.ndarray
+    observed: np.ndarray
+
+    def ratios(
+        self,
+        target_quarter: Union[str, int],
+        feeder_quarter: Union[str, int],
+        require_positive_target: bool = True,
+    ) -> np.ndarray:
+        """Per course, per year target/feeder ratios (NaN where undefined).
+
+        A year counts when the feeder quarter has positive enrollment and the
+        target quarter is positive (or merely observed, when
+        ``require_positive_target`` is False). An unknown quarter gives all
+        NaN.
+        """
+        t = _quarter_axis(target_quarter)
+        f = _quarter_axis(feeder_quarter)
+        if t is None or f is None:
+            return np.full(self.enrollment.shape[:2], np.nan)
+        feeder = self.enrollment[:, :, f]
+        target = self.enrollment[:, :, t]
+        valid = feeder > 0
+        valid &= (target > 0) if require_positive_target else self.observed[:, :, t]
+        out = np.full(feeder.shape, np.nan)
+        np.divide(target, feeder, out=out, where=valid)
+        return out
+
+    def ratio_stats(
+        self,
+        target_quarter: Union[str, int],
+        feeder_quarter: Union[str, int],
+        require_positive_target: bool = True,
+    ) -> Dict[str, np.ndarray]:
+        """Mean, standard deviation and year count of the ratio per course."""
+        values = self.ratios(target_quarter, feeder_quarter, require_positive_target)
+        count = np.sum(~np.isnan(values), axis=1)
+        has_any = count > 0
+        mean = np.full(len(self.courses), np.nan)
+        std = np.full(len(self.courses), np.nan)
+        if has_any.any():
+            mean[has_any] = np.nanmean(values[has_any], axis=1)
+            std[has_any] = np.nanstd(values[has_any], axis=1)
+        return {"mean": mean, "std": std, "count": count}
+
+    def mean_ratios(
+        self,
+        target_quarter: Union[str, int],
+        feeder_quarter: Union[str, int],
+        require_positive_target: bool = True,
+    ) -> Dict[str, float]:
+        """Average target/feeder ratio per course, omitting courses with no valid year."""
+        mean = self.ratio_stats(target_quarter, feeder_quarter, require_positive_target)["mean"]
+        return {
+            str(course): float(value)
+            for course, value in zip(self.courses, mean)
+            if not np.isnan(value)
+        }
+
+
+def _quarter_axis(quarter: Union[str, int]) -> Optional[int]:
+    """Map a quarter name ('spring') or code (30 / '30') to its cube axis (None if unknown)."""
+    text = str(quarter).strip().lower()
+    code = QUARTER_CODES.get(text)
+    if code is None:
+        if not text.isdigit():
+            return None
+        code = int(text)
+    return _QUARTER_AXIS.get(code)
+
+
+def build_ratio_cube(
+    courses: Iterable[str],
+    academic_years: Iterable[int],
+    quarter_codes: Iterable[int],
+    enrollments: Iterable[float],
+) -> RatioCube:
+    """Pivot parallel record columns into a RatioCube with one scatter-add."""
+    courses = np.asarray(list(courses), dtype=str)
+    academic_years = np.asarray(list(academic_years), dtype=int)
+    quarter_codes = np.asarray(list(quarter_codes), dtype=int)
+    enrollments = np.asarray(list(enrollments), dtype=float)
+
+    known = np.isin(quarter_codes, list(_QUARTER_AXIS))
+    courses, academic_years = courses[known], academic_years[known]
+    quarter_codes, enrollments = quarter_codes[known], enrollments[known]
+
+    course_labels, course_idx = np.unique(courses, return_inverse=True)
+    year_labels, year_idx = np.unique(academic_years, return_inverse=True)
+    quarter_idx = np.searchsorted(np.array(sorted(_QUARTER_AXIS)), quarter_codes)
+
+    shape = (len(course_labels), len(year_labels), len(_QUARTER_AXIS))
+    enrollment = np.zeros(shape)
+    counts = np.zeros(shape, dtype=int)
+    np.add.at(enrollment, (course_idx, year_idx, quarter_idx), enrollments)
+    np.add.at(counts, (course_idx, year_idx, quarter_idx), 1)
+    return RatioCube(course_labels, year_labels, enrollment, counts > 0)
+
+
+def ratio_cube_from_frame(df) -> RatioCube:
+    """Build a cube from a loader frame (course_code, year, quarter, enrollment).
+
+    ``year`` follows the loaders' calendar-year convention, so Fall rows are
+    shifted forward one year onto the SCAD academic year.
+    """
+    quarters = df["quarter"].astype(str).str.strip().str.lower()
+    codes = quarters.map(QUARTER_CODES).fillna(0).astype(int).to_numpy()
+    years = df["year"].astype(int).to_numpy() + (codes == QUARTER_CODES["fall"])
+    return build_ratio_cube(
+        df["course_code"].astype(str).to_numpy(),
+        years,
+        codes,
+        df["enrollment"].fillna(0).astype(float).to_numpy(),
+    )
+
+
+def ratio_cube_path(history_path: Union[str, Path]) -> Path:
+    """Location of the persisted cube for a history CSV."""
+    history_path = Path(history_path)
+    return history_path.with_name(history_path.name + RATIO_CUBE_SUFFIX)
+
+
+def _read_history_records(history_path: Path) -> RatioCube:
+    """Scan a history CSV (SUBJ, CRS NUMBER, TERM, ACT ENR) into a cube."""
+    courses, years, codes, enrollments = [], [], [], []
+    with history_path.open(newline="", encoding="utf-8-sig", errors="replace") as f:
+        for row in csv.DictReader(f):
+            subj = (row.get("SUBJ") or "").strip().upper()
+            crs = (row.get("CRS NUMBER") or "").strip()
+            term = str(row.get("TERM") or "").strip()
+            if not subj or not crs or len(term) != 6 or not term.isdigit():
+                continue
+            text = str(row.get("ACT ENR") or "").replace(",", "").strip()
+            try:
+                enrollment = float(text) if text else 0.0
+            except ValueError:
+                enrollment = 0.0
+            courses.append(f"{subj} {crs}")
+            years.append(int(term[:4]))
+            codes.append(int(term[4:]))
+            enrollments.append(enrollment)
+    return build_ratio_cube(courses, years, codes, enrollments)
+
+
+def _save_ratio_cube(cube: RatioCube, history_path: Path, stat: os.stat_result) -> None:
+    """Persist ``cube`` beside ``history_path`` (best-effort, atomic rename)."""
+    cube_path = ratio_cube_path(history_path)
+    tmp_path = cube_path.with_name(cube_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            np.savez_compressed(
+                f,
+                version=RATIO_CUBE_VERSION,
+                source_mtime_ns=stat.st_mtime_ns,
+                source_size=stat.st_size,
+                courses=cube.courses,
+                years=cube.years,
+                enrollment=cube.enrollment,
+                observed=cube.observed,
+            )
+        os.replace(tmp_path, cube_path)
+    except OSError as e:
+        logger.warning(f"Could not persist ratio cube: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _load_saved_ratio_cube(history_path: Path, stat: os.stat_result):
+    """Return the persisted cube if it was built from this version of the CSV."""
+    try:
+        with np.load(ratio_cube_path(history_path), allow_pickle=False) as saved:
+            if (
+                int(saved["version"]) != RATIO_CUBE_VERSION
+                or int(saved["source_mtime_ns"]) != stat.st_mtime_ns
+                or int(saved["source_size"]) != stat.st_size
+            ):
+                return None
+            return RatioCube(
+                saved["courses"], saved["years"], saved["enrollment"], saved["observed"]
+            )
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+_HISTORY_CUBES: Dict[str, Tuple[Tuple[int, int], RatioCube]] = {}
+_HISTORY_CUBES_LOCK = threading.Lock()
+
+
+def load_history_ratio_cube(history_path: Union[str, Path] = HISTORICAL_DATA_PATH) -> RatioCube:
+    """
+    Load the ratio cube for a history CSV, building and persisting it if needed.
+
+    Courses use the raw "SUBJ CRS" codes across all campuses. The cube is
+    cached in-process and on disk, and rebuilt only when the CSV's mtime or
+    size changes.
+
+    Raises:
+        FileNotFoundError: If the history CSV does not exist.
+    """
+    history_path = Path(history_path)
+    stat = history_path.stat()
+    key = str(history_path.resolve())
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _HISTORY_CUBES_LOCK:
+        cached = _HISTORY_CUBES.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    cube = _load_saved_ratio_cube(history_path, stat)
+    if cube is None:
+        cube = _read_history_records(history_path)
+        _save_ratio_cube(cube, history_path, stat)
+    with _HISTORY_CUBES_LOCK:
+        _HISTORY_CUBES[key] = (stamp, cube)
+    return cube
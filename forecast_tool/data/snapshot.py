@@ -0,0 +1,196 @@
+"""
+Columnar binary snapshots of history CSVs.
+
+Parsing the historical CSV dominates loader time and grows with every year
+of history. The snapshot stores each column once, typed, as its own .npy
+file beside the CSV (``FOUN_Historical.csv.snapshot/``): numeric columns as
+plain arrays and text columns dictionary-encoded (int32 codes plus a
+category list in the manifest). Loaders memory-map the arrays instead of
+re-parsing the CSV, and the snapshot is rebuilt whenever the CSV's mtime or
+size changes.
+
+Ingest ahead of time with::
+
+    python -m forecast_tool.data.snapshot [CSV ...]
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from forecast_tool.config.settings import HISTORICAL_DATA_PATH
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_VERSION = 1
+_MANIFEST = "manifest.json"
+
+
+def snapshot_path(csv_path: Union[str, Path]) -> Path:
+    """Directory holding the snapshot for a CSV."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(csv_path.name + SNAPSHOT_SUFFIX)
+
+
+def _encode_column(series: pd.Series) -> Tuple[Dict, np.ndarray]:
+    """Column spec and the array to store for one CSV column.
+
+    Raises:
+        ValueError: For text columns holding non-string values.
+    """
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return {"name": series.name, "kind": "numeric"}, series.to_numpy()
+    codes, categories = pd.factorize(series)
+    if not all(isinstance(value, str) for value in categories):
+        raise ValueError(f"Column '{series.name}' has non-string values")
+    spec = {"name": series.name, "kind": "category", "categories": list(categories)}
+    return spec, codes.astype(np.int32)
+
+
+def _decode_column(spec: Dict, array: np.ndarray) -> np.ndarray:
+    if spec["kind"] == "numeric":
+        return array
+    # Code -1 (missing) picks the trailing None
+    categories = np.array(spec["categories"] + [None], dtype=object)
+    return categories[array]
+
+
+def write_snapshot(csv_path: Union[str, Path], df: Optional[pd.DataFrame] = None) -> Path:
+    """
+    Write the snapshot for a CSV (``df`` is its already-parsed contents).
+
+    Column files are written under a fresh name and the manifest is swapped
+    in atomically. Only the files of the snapshot this one replaces are then
+    deleted, never those of another writer's snapshot. A reader still opening
+    the replaced files may find them gone; it then parses the CSV instead.
+    If two writers race, the files of whichever swapped in first are left
+    behind unreferenced (they are never read).
+
+    Raises:
+        FileNotFoundError: If the CSV does not exist.
+        ValueError: If a text column holds non-string values.
+    """
+    csv_path = Path(csv_path)
+    stat = csv_path.stat()
+    if df is None:
+        df = pd.read_csv(csv_path)
+    encoded = [_encode_column(df[name]) for name in df.columns]
+
+    directory = snapshot_path(csv_path)
+    directory.mkdir(exist_ok=True)
+    token = uuid.uuid4().hex[:12]
+    columns = []
+    for i, (spec, array) in enumerate(encoded):
+        spec["file"] = f"{token}-{i}.npy"
+        np.save(directory / spec["file"], np.ascontiguousarray(array), allow_pickle=False)
+        columns.append(spec)
+
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_size": stat.st_size,
+        "rows": len(df),
+        "columns": columns,
+    }
+    previous = _manifest_files(directory)
+    tmp_path = directory / f"{_MANIFEST}.{token}.tmp"
+    tmp_path.write_text(json.dumps(manifest))
+    os.replace(tmp_path, directory / _MANIFEST)
+
+    # Drop the column files of the snapshot just replaced
+    current = {spec["file"] for spec in columns}
+    for name in previous - current:
+        try:
+            (directory / name).unlink()
+        except OSError:
+            pass
+    return directory
+
+
+def _manifest_files(directory: Path) -> Set[str]:
+    """Column files listed in a snapshot directory's manifest (empty if unreadable)."""
+    try:
+        manifest = json.loads((directory / _MANIFEST).read_text())
+        return {spec["file"] for spec in manifest["columns"]}
+    except (OSError, KeyError, TypeError, ValueError):
+        return set()
+
+
+def _read_snapshot(csv_path: Path, stat: os.stat_result) -> Optional[Dict[str, np.ndarray]]:
+    """Memory-mapped, decoded columns if the snapshot matches this CSV version."""
+    directory = snapshot_path(csv_path)
+    try:
+        manifest = json.loads((directory / _MANIFEST).read_text())
+        if (
+            manifest["version"] != SNAPSHOT_VERSION
+            or manifest["source_mtime_ns"] != stat.st_mtime_ns
+            or manifest["source_size"] != stat.st_size
+        ):
+            return None
+        columns = {}
+        for spec in manifest["columns"]:
+            array = np.load(directory / spec["file"], mmap_mode="r", allow_pickle=False)
+            if len(array) != manifest["rows"]:
+                return None
+            columns[spec["name"]] = _decode_column(spec, array)
+        return columns
+    except (OSError, KeyError, TypeError, ValueError):
+        return None
+
+
+_SNAPSHOTS: Dict[str, Tuple[Tuple[int, int], Dict[str, np.ndarray]]] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def read_history_csv(csv_path: Union[str, Path] = HISTORICAL_DATA_PATH) -> pd.DataFrame:
+    """
+    Contents of a history CSV, read from its snapshot when current.
+
+    Equivalent to ``pd.read_csv(csv_path)``. A missing or stale snapshot is
+    rebuilt from the CSV (best-effort); decoded columns are cached
+    in-process until the CSV changes. Each call returns a new DataFrame, so
+    callers may add or modify columns freely.
+
+    Raises:
+        FileNotFoundError: If the CSV does not exist.
+    """
+    csv_path = Path(csv_path)
+    stat = csv_path.stat()
+    key = str(csv_path.resolve())
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _SNAPSHOTS_LOCK:
+        cached = _SNAPSHOTS.get(key)
+    columns = cached[1] if cached is not None and cached[0] == stamp else None
+
+    if columns is None:
+        columns = _read_snapshot(csv_path, stat)
+        if columns is None:
+            df = pd.read_csv(csv_path)
+            try:
+                write_snapshot(csv_path, df)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not write snapshot for {csv_path}: {e}")
+            return df
+        with _SNAPSHOTS_LOCK:
+            _SNAPSHOTS[key] = (stamp, columns)
+    return pd.DataFrame(columns)
+
+
+def main(argv: List[str]) -> int:
+    for csv_path in argv or [HISTORICAL_DATA_PATH]:
+        directory = write_snapshot(csv_path)
+        print(f"Wrote {directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -4,7 +4,19 @@ Extracted from app.py for modularity.
 """
 
 from datetime import datetime
-from typing import Union
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+# Quarter name (or 1-4 number) -> month the quarter starts in
+QUARTER_START_MONTHS = {
+    'fall': 9, 'winter': 1, 'spring': 4, 'summer': 6,
+    '1': 1, '2': 4, '3': 6, '4': 9
+}
+
+# SCAD term code suffix (YYYYMM) -> quarter name
+TERM_SUFFIX_QUARTERS = {10: 'Fall', 20: 'Winter', 30: 'Spring', 40: 'Summer'}
 
 
 def quarter_to_date(year: Union[int, str], quarter: Union[str, int]) -> datetime:
@@ -18,12 +30,8 @@ def quarter_to_date(year: Union[int, str], quarter: Union[str, int]) -> datetime
     Returns:
         datetime object representing the start of that quarter
     """
-    quarter_map = {
-        'fall': 9, 'winter': 1, 'spring': 4, 'summer': 6,
-        '1': 1, '2': 4, '3': 6, '4': 9
-    }
     q = str(quarter).lower().strip()
-    month = quarter_map.get(q, 1)
+    month = QUARTER_START_MONTHS.get(q, 1)
     # Winter quarter belongs to the next calendar year conceptually
     if q == 'winter':
         year = int(year) + 1
@@ -32,6 +40,55 @@ def quarter_to_date(year: Union[int, str], quarter: Union[str, int]) -> datetime
     return datetime(year, month, 1)
 
 
+def quarters_to_dates(
+    years: Union[pd.Series, Iterable[Union[int, str]]],
+    quarters: Union[pd.Series, Iterable[Union[str, int]]],
+) -> pd.Series:
+    """
+    Vectorized ``quarter_to_date`` over whole columns.
+
+    Args:
+        years: Calendar years
+        quarters: Quarter names or numbers, aligned with ``years``
+
+    Returns:
+        datetime64 Series (indexed like ``years`` when it is a Series)
+    """
+    index = years.index if isinstance(years, pd.Series) else None
+    q = pd.Series(np.asarray(quarters, dtype=object)).astype(str).str.lower().str.strip()
+    month = q.map(QUARTER_START_MONTHS).fillna(1).astype(int).to_numpy()
+    year = np.asarray(years, dtype=float).astype(int) + (q == 'winter').to_numpy()
+    dates = pd.to_datetime(pd.DataFrame({'year': year, 'month': month, 'day': 1}))
+    if index is not None:
+        dates.index = index
+    return dates
+
+
+def parse_term_codes(terms: Union[pd.Series, Iterable[Union[int, str]]]) -> pd.DataFrame:
+    """
+    Vectorized term code (YYYYMM) parsing into quarter name and year.
+
+    Fall (suffix 10) belongs to the previous calendar year, e.g. 202210 is
+    Fall 2021 and 202220 is Winter 2022.
+
+    Returns:
+        DataFrame with 'quarter' and 'year' columns (indexed like ``terms``
+        when it is a Series); unknown suffixes give None / NaN.
+    """
+    index = terms.index if isinstance(terms, pd.Series) else None
+    codes = pd.to_numeric(pd.Series(np.asarray(terms, dtype=object)), errors='coerce')
+    suffix = codes % 100
+    quarter = suffix.map(TERM_SUFFIX_QUARTERS)
+    known = quarter.notna()
+    year = (codes // 100 - (suffix == 10)).where(known)
+    if known.all():
+        year = year.astype(int)
+    parsed = pd.DataFrame({'quarter': quarter.where(known, None), 'year': year})
+    if index is not None:
+        parsed.index = index
+    return parsed
+
+
 def date_to_quarter_label(date: datetime) -> str:
     """
     Convert datetime back to quarter label.
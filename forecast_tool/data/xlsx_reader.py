@@ -0,0 +1,235 @@
+"""
+Streaming XLSX reader.
+
+Reads worksheet rows straight from the workbook's zip members with
+``iterparse``, one row at a time, instead of building a DOM of the whole
+sheet (ElementTree) or a workbook model (openpyxl / pandas). Sheets are
+selected by name from workbook.xml before any sheet XML is parsed, and the
+shared-string table is parsed only as far as the rows being read need it.
+
+Cell values come back as strings, as stored in the file: shared and inline
+strings as text, numbers and dates as their raw serial text, empty cells as
+"". Formulas give their cached value.
+"""
+
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+_ROW = f"{{{_MAIN_NS}}}row"
+_CELL = f"{{{_MAIN_NS}}}c"
+_VALUE = f"{{{_MAIN_NS}}}v"
+_TEXT = f"{{{_MAIN_NS}}}t"
+_INLINE = f"{{{_MAIN_NS}}}is"
+_SHARED_ITEM = f"{{{_MAIN_NS}}}si"
+_SHEET_DATA = f"{{{_MAIN_NS}}}sheetData"
+
+SheetFilter = Union[str, Pattern[str], Callable[[str], bool]]
+
+
+def column_index(ref: str) -> int:
+    """1-based column index of a cell reference ('A1' -> 1, 'AB12' -> 28)."""
+    idx = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        idx = idx * 26 + (ord(ch.upper()) - ord("A") + 1)
+    return idx
+
+
+def _row_number(ref: str) -> Optional[int]:
+    digits = ref.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+    return int(digits) if digits.isdigit() else None
+
+
+def _item_text(elem: ET.Element) -> str:
+    """Concatenated text runs of a shared/inline string item."""
+    return "".join(t.text or "" for t in elem.iter(_TEXT))
+
+
+class _SharedStrings:
+    """Shared-string table parsed incrementally, up to the highest index used."""
+
+    def __init__(self, zf: zipfile.ZipFile):
+        self._zf = zf
+        self._strings: List[str] = []
+        self._items: Optional[Iterator[str]] = None
+        self._exhausted = False
+
+    def _iter_items(self) -> Iterator[str]:
+        try:
+            f = self._zf.open("xl/sharedStrings.xml")
+        except KeyError:
+            return
+        with f:
+            parent = None
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if parent is None:
+                        parent = elem
+                    continue
+                if elem.tag == _SHARED_ITEM:
+                    yield _item_text(elem)
+                    parent.clear()
+
+    def __getitem__(self, index: int) -> str:
+        while len(self._strings) <= index and not self._exhausted:
+            if self._items is None:
+                self._items = self._iter_items()
+            try:
+                self._strings.append(next(self._items))
+            except StopIteration:
+                self._exhausted = True
+        return self._strings[index]
+
+
+class XlsxReader:
+    """
+    Streaming access to the worksheets of an .xlsx file.
+
+    Use as a context manager (or call ``close``)::
+
+        with XlsxReader(path) as book:
+            for name in book.sheet_names(SHEET_RE):
+                for row in book.iter_rows(name):
+                    ...
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._zf = zipfile.ZipFile(self.path)
+        self._shared = _SharedStrings(self._zf)
+        self._targets = self._load_sheet_targets()
+
+    def __enter__(self) -> "XlsxReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._zf.close()
+
+    def _load_sheet_targets(self) -> Dict[str, str]:
+        """Sheet name -> zip member, in workbook order."""
+        with self._zf.open("xl/workbook.xml") as f:
+            sheets = [
+                (sheet.get("name"), sheet.get(f"{{{_DOC_REL_NS}}}id"))
+                for sheet in ET.parse(f).getroot().iter(f"{{{_MAIN_NS}}}sheet")
+            ]
+        with self._zf.open("xl/_rels/workbook.xml.rels") as f:
+            rid_to_target = {
+                rel.get("Id"): rel.get("Target")
+                for rel in ET.parse(f).getroot().iter(f"{{{_REL_NS}}}Relationship")
+            }
+        targets = {}
+        for name, rid in sheets:
+            target = rid_to_target.get(rid)
+            if name is None or not target:
+                continue
+            # Targets are relative to xl/ unless absolute within the package
+            targets[name] = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+        return targets
+
+    def sheet_names(self, match: Optional[SheetFilter] = None) -> List[str]:
+        """
+        Sheet names in workbook order, optionally filtered.
+
+        Args:
+            match: Regex (string or compiled, matched against the stripped
+                   name) or predicate on the name
+        """
+        names = list(self._targets)
+        if match is None:
+            return names
+        if callable(match) and not isinstance(match, re.Pattern):
+            return [name for name in names if match(name)]
+        pattern = re.compile(match) if isinstance(match, str) else match
+        return [name for name in names if pattern.match(name.strip())]
+
+    def _cell_value(self, cell: ET.Element) -> str:
+        cell_type = cell.get("t")
+        if cell_type == "inlineStr":
+            inline = cell.find(_INLINE)
+            return _item_text(inline) if inline is not None else ""
+        v = cell.find(_VALUE)
+        if v is None:
+            return ""
+        raw = v.text or ""
+        if cell_type == "s":
+            try:
+                return self._shared[int(raw)]
+            except (ValueError, IndexError):
+                return raw
+        return raw
+
+    def iter_numbered_rows(
+        self,
+        sheet_name: str,
+        min_row: int = 1,
+        max_row: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Tuple[str, ...]]]:
+        """
+        Yield ``(row_number, values)`` for each row of a sheet that has cells.
+
+        ``values`` runs from column A to the row's last cell, with "" for
+        gaps. Rows outside ``min_row``..``max_row`` (1-based) are skipped;
+        parsing stops after ``max_row``.
+
+        Raises:
+            KeyError: If the sheet does not exist.
+        """
+        target = self._targets.get(sheet_name)
+        if not target:
+            raise KeyError(f"Sheet not found: {sheet_name}")
+
+        with self._zf.open(target) as f:
+            sheet_data = None
+            last_row = 0
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == _SHEET_DATA:
+                        sheet_data = elem
+                    continue
+                if elem.tag != _ROW:
+                    continue
+
+                number = _row_number(elem.get("r", "")) or last_row + 1
+                last_row = number
+                if max_row is not None and number > max_row:
+                    break
+                if number >= min_row:
+                    cells: Dict[int, str] = {}
+                    last_col = 0
+                    for cell in elem.iter(_CELL):
+                        ref = cell.get("r")
+                        col = column_index(ref) if ref else last_col + 1
+                        last_col = col
+                        cells[col] = self._cell_value(cell)
+                    if cells:
+                        yield number, tuple(cells.get(i, "") for i in range(1, max(cells) + 1))
+                # Drop finished rows so memory stays flat
+                if sheet_data is not None:
+                    sheet_data.clear()
+
+    def iter_rows(
+        self,
+        sheet_name: str,
+        min_row: int = 1,
+        max_row: Optional[int] = None,
+    ) -> Iterator[Tuple[str, ...]]:
+        """Yield the values of each row of a sheet (see ``iter_numbered_rows``)."""
+        for _, values in self.iter_numbered_rows(sheet_name, min_row, max_row):
+            yield values
+
+
+def read_sheet_rows(path: Union[str, Path], sheet_name: str) -> List[List[str]]:
+    """All rows of one sheet as lists of strings."""
+    with XlsxReader(path) as book:
+        return [list(row) for row in book.iter_rows(sheet_name)]
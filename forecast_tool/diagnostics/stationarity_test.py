@@ -232,7 +232,33 @@ def analyze_all_courses(
                 - avg_seasonal_strength: mean seasonal strength across valid courses
                 - strong_seasonality_courses: list of courses with strength >= 0.6
     """
-    results = {}
+    results = {
+        course_name: analyze_course(series, significance_level, seasonal_period)
+        for course_name, series in course_dict.items()
+    }
+    return {"results": results, "summary": summarize_diagnostics(results)}
+
+
+def analyze_course(
+    series: pd.Series,
+    significance_level: float = ADF_SIGNIFICANCE_LEVEL,
+    seasonal_period: int = 4,
+) -> Dict:
+    """
+    Run stationarity and seasonality diagnostics on one course.
+
+    Returns:
+        dict with 'stationarity' and 'seasonality' sub-dicts (see
+        ``test_stationarity`` and ``measure_seasonal_strength``).
+    """
+    return {
+        "stationarity": test_stationarity(series, significance_level),
+        "seasonality": measure_seasonal_strength(series, seasonal_period),
+    }
+
+
+def summarize_diagnostics(results: Dict[str, Dict]) -> Dict:
+    """Aggregate per-course diagnostics into the summary of ``analyze_all_courses``."""
     stationary_count = 0
     non_stationary_count = 0
     insufficient_data_count = 0
@@ -240,14 +266,9 @@ def analyze_all_courses(
     seasonal_strengths = []
     strong_seasonality_courses = []
 
-    for course_name, series in course_dict.items():
-        stationarity = test_stationarity(series, significance_level)
-        seasonality = measure_seasonal_strength(series, seasonal_period)
-
-        results[course_name] = {
-            "stationarity": stationarity,
-            "seasonality": seasonality,
-        }
+    for course_name, diagnostics in results.items():
+        stationarity = diagnostics["stationarity"]
+        seasonality = diagnostics["seasonality"]
 
         if stationarity["is_stationary"] is None:
             insufficient_data_count += 1
@@ -266,8 +287,8 @@ def analyze_all_courses(
         float(np.mean(seasonal_strengths)) if seasonal_strengths else None
     )
 
-    summary = {
-        "total_courses": len(course_dict),
+    return {
+        "total_courses": len(results),
         "stationary_count": stationary_count,
         "non_stationary_count": non_stationary_count,
         "insufficient_data_count": insufficient_data_count,
@@ -275,5 +296,3 @@ def analyze_all_courses(
         "avg_seasonal_strength": avg_seasonal_strength,
         "strong_seasonality_courses": sorted(strong_seasonality_courses),
     }
-
-    return {"results": results, "summary": summary}
@@ -7,13 +7,30 @@ from typing import Union
 import warnings
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.arima.model import ARIMA
+
+from forecast_tool.forecasting.model_cache import get_model_cache, series_fingerprint
+
+# Orders tried in order:
+#   (1,1,1) — one autoregressive term, first differencing, one MA term
+#   (1,1,0) — simpler model without MA component
+#   (0,1,1) — MA-only with differencing
+ARIMA_ORDERS = ((1, 1, 1), (1, 1, 0), (0, 1, 1))
+
+
+def _checked_forecast(fitted, periods: int) -> np.ndarray:
+    forecast = fitted.forecast(steps=periods)
+    if np.any(np.isnan(forecast)):
+        raise ValueError("NaN in forecast output")
+    return forecast
 
 
 def forecast_arima(df_ts: pd.DataFrame, periods: int) -> Union[np.ndarray, pd.Series]:
     """
     Run ARIMA forecast on quarterly enrollment data.
 
+    The fitted model is reused from the model cache when the series matches
+    a previous fit.
+
     Args:
         df_ts: DataFrame with columns 'ds' (datetime) and 'y' (values)
         periods: Number of periods to forecast
@@ -28,35 +45,41 @@ def forecast_arima(df_ts: pd.DataFrame, periods: int) -> Union[np.ndarray, pd.Se
 
     endog = df_ts['y'].values
 
+    # Imported on first use to keep module import light
+    import statsmodels
+    from statsmodels.tsa.arima.model import ARIMA
+
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
 
-        try:
-            # ARIMA(1,1,1) — one autoregressive term, first differencing, one MA term
-            model = ARIMA(endog, order=(1, 1, 1))
-            fitted = model.fit()
-            forecast = fitted.forecast(steps=periods)
-            if np.any(np.isnan(forecast)):
-                raise ValueError("NaN in forecast output")
-            return forecast
-        except Exception:
-            try:
-                # Fallback 1: ARIMA(1,1,0) — simpler model without MA component
-                model = ARIMA(endog, order=(1, 1, 0))
-                fitted = model.fit()
-                forecast = fitted.forecast(steps=periods)
-                if np.any(np.isnan(forecast)):
-                    raise ValueError("NaN in forecast output")
-                return forecast
-            except Exception:
+        cache = get_model_cache()
+        key = None
+        start = 0
+        if cache is not None:
+            key = series_fingerprint(
+                df_ts, "arima", {"orders": ARIMA_ORDERS, "version": statsmodels.__version__}
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                stage, fitted = cached
+                if fitted is None:
+                    return np.full(periods, df_ts['y'].mean())
                 try:
-                    # Fallback 2: ARIMA(0,1,1) — MA-only with differencing
-                    model = ARIMA(endog, order=(0, 1, 1))
-                    fitted = model.fit()
-                    forecast = fitted.forecast(steps=periods)
-                    if np.any(np.isnan(forecast)):
-                        raise ValueError("NaN in forecast output")
-                    return forecast
+                    return _checked_forecast(fitted, periods)
                 except Exception:
-                    # Fallback 3: Naive mean
-                    return np.full(periods, df_ts['y'].mean())
+                    start = stage + 1
+
+        for stage, order in enumerate(ARIMA_ORDERS[start:], start=start):
+            try:
+                fitted = ARIMA(endog, order=order).fit()
+                forecast = _checked_forecast(fitted, periods)
+            except Exception:
+                continue
+            if cache is not None:
+                cache.put(key, (stage, fitted))
+            return forecast
+
+        # Fallback 3: Naive mean
+        if cache is not None:
+            cache.put(key, (len(ARIMA_ORDERS), None))
+        return np.full(periods, df_ts['y'].mean())
@@ -0,0 +1,499 @@
+"""
+Admissions-driven cohort-flow forecasting.
+
+Projects FOUN seat demand for any target term from admissions counts and the
+sequencing map by major. Each entering cohort (admit term x campus x student
+type) sits at some (year, quarter) of its program's sequence at the target
+term; its applicants, discounted by the progression rate once per elapsed
+term, take that quarter's FOUN courses.
+
+The sequencing map is compiled once into per-quarter (rows x courses) seat
+weight matrices, and each (interest, campus, year, quarter) resolves to one
+course weight vector, memoized. A forecast stacks the weight vectors of every
+cohort, campus and interest and multiplies them by the applicant counts of
+all scenarios (accepted, confirmed) in a single batched product.
+"""
+
+import csv
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from forecast_tool.data.admissions import (
+    ADMISSIONS_SCENARIOS,
+    AdmissionsCounts,
+    normalize_program_base,
+    normalize_text,
+    parse_admissions_counts,
+)
+from forecast_tool.data.program_resolver import resolver_for
+
+FOUN_CODE_RE = re.compile(r"\bFOUN\s*(\d{3})\b", re.IGNORECASE)
+
+# Quarter order within an academic year, and their term code digits
+QUARTERS = ("fall", "winter", "spring", "summer")
+QUARTER_DIGITS = {"fall": "10", "winter": "20", "spring": "30", "summer": "40"}
+
+FIRST_YEAR = "first year"
+SECOND_YEAR = "second year"
+
+# ((cohort term, campus, cohort year label), interest, applicants)
+UnmappedInterest = Tuple[Tuple[str, str, str], str, float]
+
+
+def extract_foun_codes(cell_value: str) -> List[str]:
+    if not cell_value:
+        return []
+    codes = []
+    for match in FOUN_CODE_RE.findall(str(cell_value)):
+        codes.append(f"FOUN {match}")
+    # Deduplicate while preserving order
+    seen = set()
+    deduped = []
+    for code in codes:
+        if code in seen:
+            continue
+        seen.add(code)
+        deduped.append(code)
+    return deduped
+
+
+@dataclass(frozen=True)
+class QuarterPlan:
+    mode: str  # "required" | "choice"
+    courses: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SequenceRow:
+    program_raw: str
+    program_base: str
+    degree: str
+    campus_raw: str
+    campuses: Tuple[str, ...]
+    year: str
+    fall: QuarterPlan
+    winter: QuarterPlan
+    spring: QuarterPlan
+    summer: QuarterPlan
+
+
+def parse_quarter_plan(cell_value: str) -> QuarterPlan:
+    text = str(cell_value).strip() if cell_value else ""
+    if not text:
+        return QuarterPlan(mode="required", courses=tuple())
+    mode = "choice" if "CHOICE" in text.upper() else "required"
+    courses = tuple(extract_foun_codes(text))
+    return QuarterPlan(mode=mode, courses=courses)
+
+
+def parse_campuses(campus_raw: str) -> Tuple[str, ...]:
+    campus_norm = normalize_text(campus_raw)
+    if not campus_norm:
+        return tuple()
+    if campus_norm == "GENERAL":
+        return ("GENERAL",)
+    parts = [p.strip() for p in campus_norm.split("|")]
+    parts = [p for p in parts if p]
+    return tuple(parts)
+
+
+def campus_matches(sequence_row: SequenceRow, campus: str) -> bool:
+    campus = normalize_text(campus)
+    if not campus:
+        return False
+    if "GENERAL" in sequence_row.campuses:
+        return True
+    return campus in sequence_row.campuses
+
+
+def load_sequence_rows(path: Path) -> List[SequenceRow]:
+    rows: List[SequenceRow] = []
+    with path.open(newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for r in reader:
+            campus_raw = (r.get("campus") or "").strip()
+            program_raw = (r.get("program") or "").strip()
+            degree = (r.get("degree") or "").strip()
+            year = (r.get("year") or "").strip()
+            if not program_raw or not year:
+                continue
+            rows.append(
+                SequenceRow(
+                    program_raw=program_raw,
+                    program_base=normalize_program_base(program_raw),
+                    degree=degree,
+                    campus_raw=campus_raw,
+                    campuses=parse_campuses(campus_raw),
+                    year=year,
+                    fall=parse_quarter_plan(r.get("fall")),
+                    winter=parse_quarter_plan(r.get("winter")),
+                    spring=parse_quarter_plan(r.get("spring")),
+                    summer=parse_quarter_plan(r.get("summer")),
+                )
+            )
+    return rows
+
+
+def build_program_index(sequence_rows: Iterable[SequenceRow]) -> Dict[str, List[SequenceRow]]:
+    index: Dict[str, List[SequenceRow]] = {}
+    for row in sequence_rows:
+        index.setdefault(row.program_base, []).append(row)
+    return index
+
+
+# --------------- Terms and cohorts ---------------
+
+def _split_term(term_code: str) -> Tuple[int, int]:
+    """(academic year, quarter position 0-3) of a term code like '202630'."""
+    term_code = str(term_code)
+    if len(term_code) != 6 or not term_code.isdigit() or term_code[4:] not in QUARTER_DIGITS.values():
+        raise ValueError(f"Invalid term code: '{term_code}'. Expected YYYY10/20/30/40.")
+    return int(term_code[:4]), int(term_code[4:]) // 10 - 1
+
+
+def term_ordinal(term_code: str) -> int:
+    """Running quarter count, so the difference of two ordinals is the number of terms between them."""
+    academic_year, position = _split_term(term_code)
+    return academic_year * len(QUARTERS) + position
+
+
+@dataclass(frozen=True)
+class Cohort:
+    """Where an entering cohort stands in its sequence at the target term."""
+    start_term: str
+    year_label: str
+    quarter: str
+    transitions: int
+
+
+def first_year_cohorts(target_term: str) -> Dict[str, Cohort]:
+    """
+    Cohorts entering in the target term's academic year, up to the target.
+
+    Earlier starters follow the calendar, taking the target quarter's
+    first-year courses; students starting in the target term itself take
+    the first quarter (fall) of the sequence.
+    """
+    academic_year, position = _split_term(target_term)
+    target_quarter = QUARTERS[position]
+    cohorts = {}
+    for start_position in range(position + 1):
+        start_term = f"{academic_year}{QUARTER_DIGITS[QUARTERS[start_position]]}"
+        cohorts[start_term] = Cohort(
+            start_term=start_term,
+            year_label=FIRST_YEAR,
+            quarter="fall" if start_position == position else target_quarter,
+            transitions=position - start_position,
+        )
+    return cohorts
+
+
+def second_year_cohort(target_term: str) -> Cohort:
+    """The previous fall's entering cohort, in its second year at the target."""
+    academic_year, position = _split_term(target_term)
+    start_term = f"{academic_year - 1}{QUARTER_DIGITS['fall']}"
+    return Cohort(
+        start_term=start_term,
+        year_label=SECOND_YEAR,
+        quarter=QUARTERS[position],
+        transitions=term_ordinal(target_term) - term_ordinal(start_term),
+    )
+
+
+# --------------- Compiled map ---------------
+
+class CohortFlowMap:
+    """
+    Sequencing map compiled for cohort-flow forecasts.
+
+    ``plan_weights[quarter]`` is a (rows x courses) matrix of seats per
+    student: 1 for each required course, 1/n for each of n choice courses.
+    Row indices are precompiled per (program, year), and the course weight
+    vector of each (interest, campus, year, quarter) is memoized.
+    """
+
+    def __init__(self, rows: Sequence[SequenceRow]):
+        self.rows = tuple(rows)
+        self.program_index = build_program_index(self.rows)
+        self.resolver = resolver_for(self.program_index, normalize_program_base)
+        self.courses = sorted({
+            course
+            for row in self.rows
+            for quarter in QUARTERS
+            for course in getattr(row, quarter).courses
+        })
+        self.course_index = {course: i for i, course in enumerate(self.courses)}
+
+        self.plan_weights: Dict[str, np.ndarray] = {}
+        for quarter in QUARTERS:
+            weights = np.zeros((len(self.rows), len(self.courses)))
+            for r, row in enumerate(self.rows):
+                plan: QuarterPlan = getattr(row, quarter)
+                if not plan.courses:
+                    continue
+                seats = 1.0 / len(plan.courses) if plan.mode == "choice" else 1.0
+                for course in plan.courses:
+                    weights[r, self.course_index[course]] += seats
+            self.plan_weights[quarter] = weights
+
+        # program -> year label -> row indices, in map order
+        self._program_years: Dict[str, Dict[str, List[int]]] = {}
+        for r, row in enumerate(self.rows):
+            by_year = self._program_years.setdefault(row.program_base, {})
+            by_year.setdefault(row.year.strip().lower(), []).append(r)
+
+        self._vectors: Dict[Tuple[str, str, str, str], Optional[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def matching_rows(self, interest: str, campus: str, year_label: str) -> List[int]:
+        """
+        Map rows for an admissions interest at one campus and year; rows of
+        the matched programs at other campuses when none serve this one.
+        """
+        candidates = [
+            r
+            for program in self.resolver.matches(interest)
+            for r in self._program_years.get(program, {}).get(year_label, ())
+        ]
+        on_campus = [r for r in candidates if campus_matches(self.rows[r], campus)]
+        return on_campus or candidates
+
+    def course_weights(
+        self, interest: str, campus: str, year_label: str, quarter: str
+    ) -> Optional[np.ndarray]:
+        """Seats per student in each course, averaged over matching rows; None if unmapped."""
+        key = (interest, campus, year_label, quarter)
+        with self._lock:
+            if key in self._vectors:
+                return self._vectors[key]
+        rows = self.matching_rows(interest, campus, year_label)
+        vector = self.plan_weights[quarter][rows].sum(axis=0) / len(rows) if rows else None
+        with self._lock:
+            self._vectors[key] = vector
+        return vector
+
+
+def _file_version(path: Path) -> Tuple[str, int, int]:
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+# Parsed sources: resolved path -> ((path, mtime_ns, size), value)
+_SOURCE_CACHE: Dict[Tuple[str, str], Tuple[Tuple[str, int, int], object]] = {}
+_SOURCE_LOCK = threading.Lock()
+
+
+def _cached_source(kind: str, path: Path, build):
+    version = _file_version(path)
+    key = (kind, version[0])
+    with _SOURCE_LOCK:
+        cached = _SOURCE_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    value = build()
+    with _SOURCE_LOCK:
+        _SOURCE_CACHE[key] = (version, value)
+    return value
+
+
+def get_cohort_flow_map(path: Path) -> CohortFlowMap:
+    """Compiled cohort-flow map for a sequencing map CSV, rebuilt when it changes."""
+    return _cached_source("map", path, lambda: CohortFlowMap(load_sequence_rows(path)))
+
+
+def get_admissions_counts(path: Path) -> AdmissionsCounts:
+    """Applicant counts for every sheet of an admissions workbook, re-read when it changes."""
+
+    def build():
+        counts = parse_admissions_counts(path)
+        return {
+            key: {scenario: dict(by_interest) for scenario, by_interest in scenarios.items()}
+            for key, scenarios in counts.items()
+        }
+
+    return _cached_source("admissions", path, build)
+
+
+def fall_cohort_size(historical_path: Path, term_code: str) -> float:
+    """
+    Size of a fall entering cohort from historical enrollment: the larger of
+    that term's DRAW 100 and DSGN 100 enrollments (0 when absent).
+    """
+
+    def build():
+        totals: Dict[Tuple[int, str], float] = {}
+        with historical_path.open(newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    term = int(row.get("TERM") or 0)
+                except ValueError:
+                    continue
+                subj = (row.get("SUBJ") or "").strip().upper()
+                crs = (row.get("CRS NUMBER") or "").strip()
+                if crs != "100" or subj not in ("DRAW", "DSGN"):
+                    continue
+                try:
+                    act_enr = float(row.get("ACT ENR") or 0)
+                except ValueError:
+                    act_enr = 0.0
+                totals[(term, subj)] = totals.get((term, subj), 0.0) + act_enr
+        return totals
+
+    totals = _cached_source("cohort_sizes", historical_path, build)
+    term = int(term_code)
+    return max(totals.get((term, "DRAW"), 0.0), totals.get((term, "DSGN"), 0.0))
+
+
+# --------------- Engine ---------------
+
+@dataclass
+class CohortFlowResult:
+    """
+    Demand for every scenario at once.
+
+    Attributes:
+        demand: (scenarios x campuses x courses) projected seats
+        unmapped: Per scenario, interests no map row could serve
+    """
+    target_term: str
+    scenarios: Tuple[str, ...]
+    campuses: Tuple[str, ...]
+    courses: Tuple[str, ...]
+    demand: np.ndarray
+    unmapped: Dict[str, List[UnmappedInterest]]
+
+    def demand_by_course(self, scenario: str) -> Dict[Tuple[str, str], float]:
+        """{(course, campus): seats} for one scenario, positive entries only."""
+        seats = self.demand[self.scenarios.index(scenario)]
+        return {
+            (self.courses[i], self.campuses[c]): float(seats[c, i])
+            for c, i in zip(*np.nonzero(seats > 0))
+        }
+
+
+def run_cohort_flow(
+    flow_map: CohortFlowMap,
+    admissions_counts: AdmissionsCounts,
+    target_term: str,
+    progression_rate: float = 0.95,
+    include_transfers: bool = False,
+    include_second_year: bool = True,
+    prior_cohort_total: float = 0.0,
+    scenarios: Sequence[str] = ADMISSIONS_SCENARIOS,
+) -> CohortFlowResult:
+    """
+    Project FOUN demand for ``target_term`` from admissions counts.
+
+    First-year demand comes from the cohorts of ``first_year_cohorts``.
+    Second-year demand (approximate) spreads ``prior_cohort_total`` students
+    over campuses and interests in proportion to the target academic year's
+    fall freshmen, and places them as ``second_year_cohort``.
+
+    Args:
+        flow_map: Compiled sequencing map
+        admissions_counts: Output of ``parse_admissions_counts``
+        target_term: Term code, e.g. '202630'
+        progression_rate: Per-term retention applied once per elapsed term
+        include_transfers: Count transfer (TR) admits as first-year cohorts
+        include_second_year: Add the estimated second-year cohort
+        prior_cohort_total: Size of the previous fall's entering cohort
+        scenarios: Scenarios to project ("accepted", "confirmed")
+    """
+    scenarios = tuple(scenarios)
+    cohorts = first_year_cohorts(target_term)
+
+    # One group per cohort x campus: its applicants by scenario and interest
+    groups: List[Tuple[Tuple[str, str, str], str, Cohort, List[str], np.ndarray]] = []
+
+    def add_group(cohort_key, campus, cohort, by_scenario: Sequence[Dict[str, float]]):
+        interests = list(dict.fromkeys(
+            interest for counts in by_scenario for interest in counts
+        ))
+        counts = np.array(
+            [[float(c.get(interest, 0.0)) for interest in interests] for c in by_scenario]
+        ).reshape(len(by_scenario), len(interests))
+        groups.append((cohort_key, campus, cohort, interests, counts))
+
+    for (term, campus, stype), by_scenario in admissions_counts.items():
+        cohort = cohorts.get(term)
+        if cohort is None:
+            continue
+        if (not include_transfers) and stype == "TR":
+            continue
+        add_group(
+            (term, campus, cohort.year_label),
+            campus,
+            cohort,
+            [by_scenario.get(scenario, {}) for scenario in scenarios],
+        )
+
+    if include_second_year and prior_cohort_total > 0:
+        # The prior fall cohort is assumed to share this year's fall freshman mix
+        prior = second_year_cohort(target_term)
+        fall_term = f"{target_term[:4]}{QUARTER_DIGITS['fall']}"
+        fall_freshmen = [
+            (campus, by_scenario)
+            for (term, campus, stype), by_scenario in admissions_counts.items()
+            if term == fall_term and stype == "FR"
+        ]
+        totals = np.array([
+            sum(float(v) for _, by_scenario in fall_freshmen for v in by_scenario.get(scenario, {}).values())
+            for scenario in scenarios
+        ])
+        scale = np.divide(
+            float(prior_cohort_total), totals, out=np.zeros_like(totals), where=totals > 0
+        )
+        for campus, by_scenario in fall_freshmen:
+            add_group(
+                (prior.start_term, campus, prior.year_label),
+                campus,
+                prior,
+                [
+                    {interest: float(v) * scale[s] for interest, v in by_scenario.get(scenario, {}).items()}
+                    for s, scenario in enumerate(scenarios)
+                ],
+            )
+
+    campuses = tuple(dict.fromkeys(campus for _, campus, _, _, _ in groups))
+    campus_index = {campus: c for c, campus in enumerate(campuses)}
+    unmapped: Dict[str, List[UnmappedInterest]] = {scenario: [] for scenario in scenarios}
+
+    # Stack every (group, interest) as one row: scaled applicants per scenario,
+    # course weights and campus, then project them all in one product.
+    applicants: List[np.ndarray] = []
+    weights: List[np.ndarray] = []
+    row_campus: List[int] = []
+    for cohort_key, campus, cohort, interests, counts in groups:
+        multiplier = progression_rate ** cohort.transitions
+        for i, interest in enumerate(interests):
+            vector = flow_map.course_weights(interest, campus, cohort.year_label, cohort.quarter)
+            if vector is None:
+                for s, scenario in enumerate(scenarios):
+                    if counts[s, i] > 0:
+                        unmapped[scenario].append((cohort_key, interest, float(counts[s, i])))
+                continue
+            applicants.append(np.clip(counts[:, i], 0.0, None) * multiplier)
+            weights.append(vector)
+            row_campus.append(campus_index[campus])
+
+    demand = np.zeros((len(scenarios), len(campuses), len(flow_map.courses)))
+    if weights:
+        campus_onehot = np.zeros((len(row_campus), len(campuses)))
+        campus_onehot[np.arange(len(row_campus)), row_campus] = 1.0
+        demand = np.einsum(
+            "rs,rc,rk->sck", np.array(applicants), campus_onehot, np.array(weights)
+        )
+
+    return CohortFlowResult(
+        target_term=target_term,
+        scenarios=scenarios,
+        campuses=campuses,
+        courses=tuple(flow_map.courses),
+        demand=demand,
+        unmapped=unmapped,
+    )
@@ -3,6 +3,7 @@ Ensemble forecasting methods and section calculations.
 Extracted from app.py for modularity.
 """
 
+import itertools
 import logging
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
@@ -144,12 +145,23 @@ def optimize_ensemble_weights(
     horizon: int = 1,
     step: int = 1,
     metric: str = "rmse",
+    incremental: bool = False,
+    method: str = "grid",
 ) -> Tuple[Dict[str, float], float]:
     """
-    Find optimal ensemble weights via grid search over temporal cross-validation.
+    Find optimal ensemble weights over temporal cross-validation.
 
-    Generates all weight combinations (summing to 1.0) at the given step size,
-    evaluates each combination's CV error, and returns the best weights.
+    With ``method="grid"``, generates all weight combinations (summing to 1.0)
+    at the given step size, evaluates every combination's CV error in one
+    vectorized pass over the cached fold predictions, and returns the best
+    weights. The grid grows combinatorially with the number of models, so
+    for larger ensembles use a continuous solver instead:
+
+      - ``"nnls"``: non-negative least squares, rescaled to sum to 1.0
+      - ``"simplex"``: projected gradient descent on the weight simplex
+
+    Both minimize squared error over the fold predictions (``metric`` is
+    only used to score the result), and ignore ``weight_step``.
 
     Args:
         df_ts: DataFrame with 'ds' (datetime) and 'y' (values) columns.
@@ -161,20 +173,32 @@ def optimize_ensemble_weights(
         horizon: Forecast horizon for temporal CV.
         step: Step size between CV folds.
         metric: Error metric to minimize ("rmse", "mae", or "mape").
+        incremental: Opt in to starting each fold's fit from the previous
+                     fold for models that support it (only ETS; see
+                     ``forecasting.incremental``). Every fold is still
+                     fitted. Warm-started fold errors differ slightly from
+                     cold refits, so the selected weights can shift.
+        method: Weight search: "grid", "nnls" or "simplex".
 
     Returns:
         Tuple of (best_weights_dict, best_metric_value).
         best_weights_dict maps model name -> optimal weight.
 
     Raises:
-        ValueError: If df_ts has insufficient data for cross-validation.
+        ValueError: If df_ts has insufficient data for cross-validation,
+                    or ``method`` is unknown.
     """
+    if method not in WEIGHT_SOLVERS and method != "grid":
+        raise ValueError(
+            f"Unknown weight optimization method '{method}'; "
+            f"expected 'grid' or one of {sorted(WEIGHT_SOLVERS)}."
+        )
+
+    from forecast_tool.forecasting.incremental import fold_forecaster
+    from forecast_tool.forecasting.model_cache import model_cache_suspended
     from forecast_tool.validation.temporal_cv import (
         expanding_window_splits,
         _extract_predictions,
-        _compute_rmse,
-        _compute_mae,
-        _compute_mape,
     )
 
     if len(df_ts) < min_train_size + horizon:
@@ -193,7 +217,13 @@ def optimize_ensemble_weights(
     if not splits:
         raise ValueError("No valid CV splits could be generated.")
 
-    # Pre-compute per-model predictions for each fold
+    if incremental:
+        fold_fns = {name: fold_forecaster(fn) for name, fn in forecast_fns.items()}
+    else:
+        fold_fns = dict(forecast_fns)
+
+    # Pre-compute per-model predictions for each fold (in order, so
+    # incremental forecasters can build on the previous fold)
     # fold_preds[model_name] = list of np.ndarray predictions per fold
     # fold_actuals = list of np.ndarray actuals per fold
     fold_preds: Dict[str, List[Optional[np.ndarray]]] = {name: [] for name in model_names}
@@ -209,7 +239,9 @@ def optimize_ensemble_weights(
         any_valid = False
         for name in model_names:
             try:
-                raw = forecast_fns[name](train_df, horizon)
+                # Fold fits are used once per run; keep them out of the cache
+                with model_cache_suspended():
+                    raw = fold_fns[name](train_df, horizon)
                 preds = _extract_predictions(raw, horizon)
                 if np.all(np.isnan(preds)):
                     preds = None
@@ -225,91 +257,244 @@ def optimize_ensemble_weights(
     if not valid_folds:
         raise ValueError("All models failed on all folds.")
 
-    # Generate weight grid
-    weight_combos = _generate_weight_grid(n_models, weight_step)
-
-    best_weights = None
-    best_error = float("inf")
-
-    metric_fn = {
-        "rmse": _compute_rmse,
-        "mae": _compute_mae,
-    }.get(metric)
+    # Stack fold predictions into a (models x folds x horizon) tensor; missing
+    # models and short outputs are NaN
+    pred_tensor = np.full((n_models, len(valid_folds), horizon), np.nan)
+    for m, name in enumerate(model_names):
+        for j, fold_i in enumerate(valid_folds):
+            fp = fold_preds[name][fold_i]
+            if fp is not None:
+                n = min(len(fp), horizon)
+                pred_tensor[m, j, :n] = fp[:n]
+    actual_matrix = np.array([fold_actuals[i] for i in valid_folds], dtype=float)
+
+    if method == "grid":
+        # Evaluate every weight combination at once
+        weight_matrix = _generate_weight_matrix(n_models, weight_step)
+    else:
+        weight_matrix = WEIGHT_SOLVERS[method](pred_tensor, actual_matrix)[None, :]
+    errors = _grid_errors(weight_matrix, pred_tensor, actual_matrix, metric)
+
+    finite = np.isfinite(errors)
+    if finite.any():
+        best = int(np.argmin(np.where(finite, errors, np.inf)))
+        best_weights = {model_names[i]: float(weight_matrix[best, i]) for i in range(n_models)}
+        best_error = float(errors[best])
+    else:
+        logger.warning("Weight optimization failed; returning default weights.")
+        best_weights = dict(DEFAULT_WEIGHTS)
+        best_error = float("inf")
 
-    for combo in weight_combos:
-        weights = {model_names[i]: combo[i] for i in range(n_models)}
-        fold_errors = []
+    return best_weights, best_error
 
-        for fold_i in valid_folds:
-            actuals = fold_actuals[fold_i]
 
-            # Build weighted prediction for this fold
-            preds_dict = {}
-            for name in model_names:
-                fp = fold_preds[name][fold_i]
-                if fp is not None:
-                    preds_dict[name] = fp
+# Upper bound on combos x folds x horizon cells evaluated per chunk
+_GRID_CHUNK_CELLS = 1 << 22
 
-            if not preds_dict:
-                continue
 
-            # Compute ensemble prediction (handle per-horizon-step)
-            ensemble_preds = np.zeros(horizon)
-            for h in range(horizon):
-                point_preds = {}
-                for name, arr in preds_dict.items():
-                    if h < len(arr) and np.isfinite(arr[h]):
-                        point_preds[name] = arr[h]
+def _grid_errors(
+    weight_matrix: np.ndarray,
+    pred_tensor: np.ndarray,
+    actual_matrix: np.ndarray,
+    metric: str,
+) -> np.ndarray:
+    """
+    Mean CV error of each weight combination.
 
-                if point_preds:
-                    ensemble_preds[h] = _weighted_mean_with_nan(point_preds, weights)
-                else:
-                    ensemble_preds[h] = np.nan
+    Args:
+        weight_matrix: (combos x models) non-negative weights.
+        pred_tensor: (models x folds x horizon) predictions, NaN where missing.
+        actual_matrix: (folds x horizon) actual values.
+        metric: "rmse", "mae" or "mape".
 
-            if np.all(np.isnan(ensemble_preds)):
-                continue
+    Returns:
+        (combos,) mean error over the folds each combination could score,
+        NaN where no fold qualified (or an unknown metric).
+    """
+    n_combos = weight_matrix.shape[0]
+    errors = np.full(n_combos, np.nan)
+    if metric not in ("rmse", "mae", "mape"):
+        return errors
+
+    # Per-step ensemble: weights of missing predictions are redistributed
+    # over the models that did predict (as in _weighted_mean_with_nan)
+    valid = np.isfinite(pred_tensor)
+    preds = np.where(valid, pred_tensor, 0.0)
+    valid = valid.astype(float)
+
+    if metric == "mape":
+        nonzero = actual_matrix != 0
+        safe_actuals = np.where(nonzero, actual_matrix, 1.0)
+
+    cells = max(1, pred_tensor.shape[1] * pred_tensor.shape[2])
+    chunk = max(1, _GRID_CHUNK_CELLS // cells)
+    for lo in range(0, n_combos, chunk):
+        w = weight_matrix[lo:lo + chunk]
+        num = np.einsum("cm,mfh->cfh", w, preds)
+        den = np.einsum("cm,mfh->cfh", w, valid)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ensemble = np.where(den > 0, num / den, np.nan)
+
+        # Folds where the ensemble has no prediction at all are skipped
+        scored = ~np.all(np.isnan(ensemble), axis=2)
+        diff = actual_matrix[None] - ensemble
+        if metric == "rmse":
+            fold_err = np.sqrt(np.mean(diff ** 2, axis=2))
+        elif metric == "mae":
+            fold_err = np.mean(np.abs(diff), axis=2)
+        else:
+            # MAPE over nonzero actuals; folds with none are skipped
+            scored &= nonzero.any(axis=1)[None]
+            pct = np.abs(diff / safe_actuals[None])
+            count = nonzero.sum(axis=1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                fold_err = np.sum(np.where(nonzero[None], pct, 0.0), axis=2) / count * 100
 
-            if metric == "mape":
-                err = _compute_mape(actuals, ensemble_preds)
-                if err is not None:
-                    fold_errors.append(err)
-            elif metric_fn is not None:
-                fold_errors.append(metric_fn(actuals, ensemble_preds))
+        n_scored = scored.sum(axis=1)
+        total = np.sum(np.where(scored, fold_err, 0.0), axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            errors[lo:lo + chunk] = np.where(n_scored > 0, total / n_scored, np.nan)
+    return errors
 
-        if fold_errors:
-            mean_error = float(np.mean(fold_errors))
-            if mean_error < best_error:
-                best_error = mean_error
-                best_weights = weights
 
-    if best_weights is None:
-        logger.warning("Weight optimization failed; returning default weights.")
-        best_weights = dict(DEFAULT_WEIGHTS)
-        best_error = float("inf")
+def _generate_weight_matrix(n_models: int, step: float) -> np.ndarray:
+    """
+    All weight combinations summing to 1.0 at the given step, as a
+    (combos x models) array in lexicographic order.
 
-    return best_weights, best_error
+    Each combination is a composition of ``round(1 / step)`` steps into
+    ``n_models`` parts, enumerated via the positions of the part separators.
+    """
+    n_steps = int(round(1.0 / step))
+    if n_models == 1:
+        return np.array([[round(n_steps * step, 10)]])
+    bars = np.array(
+        list(itertools.combinations(range(n_steps + n_models - 1), n_models - 1)),
+        dtype=int,
+    ).reshape(-1, n_models - 1)
+    edges = np.hstack([
+        np.full((len(bars), 1), -1),
+        bars,
+        np.full((len(bars), 1), n_steps + n_models - 1),
+    ])
+    counts = np.diff(edges, axis=1) - 1
+    return np.round(counts * step, 10)
 
 
 def _generate_weight_grid(n_models: int, step: float) -> List[Tuple[float, ...]]:
     """Generate all weight combinations summing to 1.0 at the given step size."""
-    n_steps = int(round(1.0 / step))
-    combos = []
-    _generate_recursive(n_models, n_steps, [], combos, step)
-    return combos
-
-
-def _generate_recursive(
-    remaining: int,
-    remaining_steps: int,
-    current: List[float],
-    results: List[Tuple[float, ...]],
-    step: float,
-) -> None:
-    """Recursive helper for weight grid generation."""
-    if remaining == 1:
-        weight = round(remaining_steps * step, 10)
-        results.append(tuple(current + [weight]))
-        return
-    for s in range(remaining_steps + 1):
-        weight = round(s * step, 10)
-        _generate_recursive(remaining - 1, remaining_steps - s, current + [weight], results, step)
+    return [tuple(float(w) for w in row) for row in _generate_weight_matrix(n_models, step)]
+
+
+# Rounds of re-imputing missing model predictions in the continuous solvers
+_IMPUTE_ROUNDS = 3
+
+
+def _solve_continuous(
+    pred_tensor: np.ndarray,
+    actual_matrix: np.ndarray,
+    solve: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> np.ndarray:
+    """
+    Fit simplex weights to the fold predictions with a least-squares ``solve``.
+
+    Each (fold, step) cell is a regression row. A model missing from a cell
+    is imputed with the current ensemble's value there, which is what weight
+    redistribution amounts to, and the solve is repeated as the weights
+    settle. Cells no model predicted are dropped.
+    """
+    n_models = pred_tensor.shape[0]
+    preds = pred_tensor.reshape(n_models, -1).T
+    actuals = actual_matrix.reshape(-1)
+    valid = np.isfinite(preds)
+    rows = valid.any(axis=1) & np.isfinite(actuals)
+    preds, valid, actuals = preds[rows], valid[rows], actuals[rows]
+
+    weights = np.full(n_models, 1.0 / n_models)
+    if not len(actuals):
+        return weights
+    complete = valid.all()
+    for _ in range(1 if complete else _IMPUTE_ROUNDS):
+        filled = preds
+        if not complete:
+            masked = np.where(valid, preds, 0.0)
+            den = valid @ weights
+            # Fall back to a plain mean where only zero-weight models predicted
+            ensemble = np.where(
+                den > 0,
+                (masked @ weights) / np.where(den > 0, den, 1.0),
+                masked.sum(axis=1) / valid.sum(axis=1),
+            )
+            filled = np.where(valid, preds, ensemble[:, None])
+        weights = solve(filled, actuals)
+    return weights
+
+
+def _nnls_weights(pred_tensor: np.ndarray, actual_matrix: np.ndarray) -> np.ndarray:
+    """
+    Non-negative least squares weights summing to 1.0.
+
+    The sum-to-one constraint is enforced by a heavily weighted extra
+    regression row; the result is rescaled to absorb any residual.
+    """
+    from scipy.optimize import nnls
+
+    def solve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        penalty = 1e3 * max(float(np.abs(a).max()), 1.0)
+        w, _ = nnls(
+            np.vstack([a, np.full((1, a.shape[1]), penalty)]),
+            np.append(b, penalty),
+        )
+        total = w.sum()
+        if total <= 0:
+            return np.full(a.shape[1], 1.0 / a.shape[1])
+        return w / total
+
+    return _solve_continuous(pred_tensor, actual_matrix, solve)
+
+
+def _project_to_simplex(v: np.ndarray) -> np.ndarray:
+    """Euclidean projection of ``v`` onto {w : w >= 0, sum(w) = 1}."""
+    u = np.sort(v)[::-1]
+    cumulative = np.cumsum(u) - 1.0
+    idx = np.arange(1, len(v) + 1)
+    rho = np.nonzero(u - cumulative / idx > 0)[0][-1]
+    return np.maximum(v - cumulative[rho] / (rho + 1), 0.0)
+
+
+def _simplex_weights(
+    pred_tensor: np.ndarray,
+    actual_matrix: np.ndarray,
+    max_iter: int = 5000,
+    tol: float = 1e-9,
+) -> np.ndarray:
+    """Least squares weights on the simplex via accelerated projected gradient."""
+
+    def solve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        gram = a.T @ a
+        target = a.T @ b
+        # Step 1/L, L = largest eigenvalue of the quadratic's Hessian
+        lipschitz = float(np.linalg.eigvalsh(gram)[-1])
+        w = np.full(a.shape[1], 1.0 / a.shape[1])
+        if lipschitz <= 0:
+            return w
+        # FISTA: the fold predictions are nearly collinear, so plain
+        # projected gradient converges slowly
+        z, t = w, 1.0
+        for _ in range(max_iter):
+            w_next = _project_to_simplex(z - (gram @ z - target) / lipschitz)
+            if np.max(np.abs(w_next - w)) < tol:
+                return w_next
+            t_next = (1.0 + np.sqrt(1.0 + 4.0 * t * t)) / 2.0
+            z = w_next + ((t - 1.0) / t_next) * (w_next - w)
+            w, t = w_next, t_next
+        return w
+
+    return _solve_continuous(pred_tensor, actual_matrix, solve)
+
+
+# Continuous weight solvers for optimize_ensemble_weights(method=...)
+WEIGHT_SOLVERS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "nnls": _nnls_weights,
+    "simplex": _simplex_weights,
+}
@@ -3,19 +3,88 @@ Exponential Smoothing (ETS/Holt-Winters) forecasting model.
 Extracted from app.py for modularity.
 """
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from forecast_tool.forecasting.model_cache import get_model_cache, series_fingerprint
 
 if TYPE_CHECKING:
     from pandas import Series, DataFrame
 
+# Model specifications tried in order; a fit is cached with the index of the
+# stage that succeeded (len(ETS_STAGES) = naive mean)
+ETS_STAGES = (
+    # Full Holt-Winters (Trend + Seasonality); seasonal_periods=4 for quarterly data
+    {"seasonal_periods": 4, "trend": "add", "seasonal": "add", "damped_trend": True},
+    # Fallback 1: Simple Exponential Smoothing (Level only)
+    {"trend": "add"},
+)
+
+
+def _warm_start_params(fitted: Any, spec: Dict[str, Any]) -> np.ndarray:
+    """Pack a previous fit's estimates in the order ExponentialSmoothing.fit expects."""
+    params = fitted.params
+    start = [params["smoothing_level"]]
+    if spec.get("trend"):
+        start.append(params["smoothing_trend"])
+    if spec.get("seasonal"):
+        start.append(params["smoothing_seasonal"])
+    start.append(params["initial_level"])
+    if spec.get("trend"):
+        start.append(params["initial_trend"])
+    if spec.get("damped_trend"):
+        start.append(params["damping_trend"])
+    if spec.get("seasonal"):
+        start.extend(params["initial_seasons"])
+    return np.asarray(start, dtype=float)
+
+
+def fit_ets(
+    y: np.ndarray,
+    periods: int,
+    start: int = 0,
+    warm_start: Optional[Tuple[int, Any]] = None,
+) -> Tuple[int, Optional[Any], np.ndarray]:
+    """
+    Run the ETS fallback cascade from stage ``start``.
+
+    ``warm_start`` is a previous ``(stage, fitted)`` result on a prefix of
+    ``y``; when the cascade reaches that stage, optimization starts from its
+    estimates instead of a brute-force grid search.
+
+    Returns:
+        (stage, fitted results or None for the naive mean, forecast)
+    """
+    # Imported on first use to keep module import light
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+    for stage, spec in enumerate(ETS_STAGES[start:], start=start):
+        try:
+            model = ExponentialSmoothing(y, **spec)
+            if warm_start is not None and warm_start[0] == stage and warm_start[1] is not None:
+                try:
+                    fitted = model.fit(
+                        start_params=_warm_start_params(warm_start[1], spec), use_brute=False
+                    )
+                except Exception:
+                    fitted = model.fit()
+            else:
+                fitted = model.fit()
+            return stage, fitted, fitted.forecast(steps=periods)
+        except Exception:
+            continue
+    # Fallback 2: Naive mean
+    return len(ETS_STAGES), None, np.full(periods, np.mean(y))
+
 
 def forecast_ets(df_ts: pd.DataFrame, periods: int) -> Union[np.ndarray, pd.Series]:
     """
     Run Exponential Smoothing (Holt-Winters) forecast.
 
+    The fitted model is reused from the model cache when the series matches
+    a previous fit.
+
     Args:
         df_ts: DataFrame with columns 'ds' (datetime) and 'y' (values)
         periods: Number of periods to forecast
@@ -25,25 +94,70 @@ def forecast_ets(df_ts: pd.DataFrame, periods: int) -> Union[np.ndarray, pd.Seri
     """
     if df_ts.empty or len(df_ts) < 2:
         return np.full(periods, np.nan)
-    try:
-        # Try full Holt-Winters (Trend + Seasonality)
-        # seasonal_periods=4 for quarterly data
-        model = ExponentialSmoothing(
-            df_ts['y'].values,
-            seasonal_periods=4,
-            trend='add',
-            seasonal='add',
-            damped_trend=True
+
+    return _cached_fit(df_ts, periods, "ets")[2]
+
+
+def _cached_fit(
+    df_ts: pd.DataFrame,
+    periods: int,
+    cache_name: str,
+) -> Tuple[int, Optional[Any], np.ndarray]:
+    """Run ``fit_ets`` through the model cache; returns (stage, fitted, forecast)."""
+    import statsmodels
+
+    y = df_ts['y'].values
+    cache = get_model_cache()
+    key = None
+    start = 0
+    if cache is not None:
+        key = series_fingerprint(
+            df_ts, cache_name, {"version": statsmodels.__version__}
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            stage, fitted = cached
+            if fitted is None:
+                return stage, None, np.full(periods, df_ts['y'].mean())
+            try:
+                return stage, fitted, fitted.forecast(steps=periods)
+            except Exception:
+                start = stage + 1
+
+    stage, fitted, forecast = fit_ets(y, periods, start)
+    if cache is not None:
+        cache.put(key, (stage, fitted))
+    return stage, fitted, forecast
+
+
+class ETSFoldForecaster:
+    """
+    ``forecast_ets`` for a sequence of expanding-window CV folds.
+
+    Call once per fold, in order. Each fold's fit starts from the previous
+    fold's estimates (see ``fit_ets``), which skips the brute-force start
+    search. Fold fits are not stored in the model cache.
+    """
+
+    def __init__(self):
+        self._y: Optional[np.ndarray] = None
+        self._last: Optional[Tuple[int, Any]] = None
+
+    def __call__(self, df_ts: pd.DataFrame, periods: int) -> Union[np.ndarray, pd.Series]:
+        if df_ts.empty or len(df_ts) < 2:
+            return np.full(periods, np.nan)
+
+        y = df_ts['y'].to_numpy(dtype=float)
+        prev = self._y
+        continues = (
+            prev is not None
+            and len(y) > len(prev)
+            and np.array_equal(y[:len(prev)], prev)
         )
-        fitted = model.fit()
-        forecast = fitted.forecast(steps=periods)
+        if not continues:
+            self._last = None
+
+        stage, fitted, forecast = fit_ets(y, periods, 0, self._last)
+        self._y = y
+        self._last = (stage, fitted)
         return forecast
-    except Exception:
-        try:
-            # Fallback 1: Simple Exponential Smoothing (Level only)
-            model = ExponentialSmoothing(df_ts['y'].values, trend='add')
-            fitted = model.fit()
-            return fitted.forecast(steps=periods)
-        except Exception:
-            # Fallback 2: Naive mean
-            return np.full(periods, df_ts['y'].mean())
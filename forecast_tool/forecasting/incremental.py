@@ -0,0 +1,50 @@
+"""
+Fold-to-fold state reuse for expanding-window cross-validation.
+
+Consecutive expanding-window folds differ by a single observation, so a
+model's previous fold is a good starting point for the next one. Forecast
+functions with an incremental counterpart are swapped for it here; any
+other callable is used as-is (refit from scratch on every fold).
+
+Only ETS has a counterpart, and it is opt-in (``incremental=True`` in
+``optimize_ensemble_weights``). Every fold is still fitted; warm-starting
+from the previous fold only skips the brute-force start search. The
+optimizer can settle on slightly different estimates, so fold errors are
+comparable to a cold refit but not identical (within about 1e-3 on the FOUN
+history) and the selected weights can change.
+
+Appending observations to a fixed-parameter ARIMA fit, refitting ARIMA from
+its previous estimates, and warm-starting Prophet from the previous fold's
+parameters were tried and changed fold errors noticeably on the FOUN history
+(Prophet warm starts were also slower, since y and t are rescaled between
+folds), so those models refit from scratch.
+"""
+
+import importlib
+from typing import Any, Callable
+
+import pandas as pd
+
+# Forecast function (qualified name) -> "module:class" of its fold forecaster.
+# Resolved lazily so looking one up does not import the model libraries.
+_FOLD_FORECASTERS = {
+    "forecast_tool.forecasting.ets_forecast.forecast_ets":
+        "forecast_tool.forecasting.ets_forecast:ETSFoldForecaster",
+}
+
+
+def fold_forecaster(
+    forecast_fn: Callable[[pd.DataFrame, int], Any],
+) -> Callable[[pd.DataFrame, int], Any]:
+    """
+    Return a forecaster to call once per CV fold, in fold order.
+
+    For functions with an incremental counterpart this is a fresh stateful
+    instance (use one per series); otherwise ``forecast_fn`` itself.
+    """
+    name = f"{getattr(forecast_fn, '__module__', '')}.{getattr(forecast_fn, '__qualname__', '')}"
+    target = _FOLD_FORECASTERS.get(name)
+    if target is None:
+        return forecast_fn
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name), class_name)()
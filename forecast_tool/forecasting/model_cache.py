@@ -0,0 +1,193 @@
+"""
+Persistent cache of fitted forecasting models.
+
+Fits are keyed by a fingerprint of the training series (ds, y) and the
+model configuration, so a course whose history has not changed is never
+refit. Entries are pickled to disk (shared by worker processes) and evicted
+least-recently-used once the cache exceeds its entry limit.
+
+Only final fits are cached: cross-validation folds run inside
+``model_cache_suspended()``, since every run refits each training window
+once, in a cycle longer than the cache, and storing them would only evict
+the fits worth keeping.
+
+Entries are unpickled on read, so anyone who can write to the cache
+directory can run code in the forecasting process. The directory is created
+private to the current user (mode 0700); do not point MODEL_CACHE_DIR at a
+shared or world-writable location.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from forecast_tool.config.settings import MODEL_CACHE_DIR, MODEL_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every entry when the cached payload format changes
+CACHE_FORMAT_VERSION = 1
+
+
+def series_fingerprint(df_ts: pd.DataFrame, model_name: str, config: Dict[str, Any]) -> str:
+    """
+    Hash a training series together with the model configuration.
+
+    Args:
+        df_ts: DataFrame with 'y' values (and 'ds' dates, when present)
+        model_name: Model identifier, e.g. "prophet"
+        config: JSON-serializable model settings (include library versions)
+
+    Returns:
+        Hex digest usable as a cache key.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_FORMAT_VERSION}:{model_name}:".encode())
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+    if "ds" in df_ts.columns:
+        ds = pd.to_datetime(df_ts["ds"]).to_numpy(dtype="datetime64[ns]")
+        digest.update(ds.astype(np.int64).tobytes())
+    digest.update(np.asarray(df_ts["y"], dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+class ModelCache:
+    """
+    Directory of pickled fits with least-recently-used eviction.
+
+    The entry count is tracked in memory (counted once on open), so a put
+    only scans the directory when it takes the cache over its limit; eviction
+    then trims to 90% of the limit and resyncs the count.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_entries: int = MODEL_CACHE_MAX_ENTRIES):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            os.chmod(self.directory, 0o700)
+        except OSError:
+            pass
+        self._lock = threading.Lock()
+        self._count = sum(1 for _ in self.directory.glob("*.pkl"))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable model cache entry {path.name}: {e}")
+            self._remove(path)
+            return None
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` (atomic write), then enforce the size limit."""
+        path = self._path(key)
+        try:
+            is_new = not path.exists()
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except Exception as e:
+            logger.warning(f"Could not write model cache entry: {e}")
+            return
+        with self._lock:
+            if is_new:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
+
+    def clear(self) -> None:
+        """Remove every cached fit."""
+        with self._lock:
+            for path in self.directory.glob("*.pkl"):
+                self._remove(path)
+            self._count = 0
+
+    def _evict(self) -> None:
+        # Other processes share the directory, so rescan rather than trust
+        # the in-memory count, and trim below the limit so the next few puts
+        # don't rescan again
+        entries = []
+        for path in self.directory.glob("*.pkl"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        keep = max(int(self.max_entries * 0.9), 1)
+        excess = len(entries) - keep
+        if excess > 0:
+            entries.sort()
+            for _, path in entries[:excess]:
+                self._remove(path)
+        self._count = min(len(entries), keep)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+_default_cache: Optional[ModelCache] = None
+
+_suspended: ContextVar[bool] = ContextVar("model_cache_suspended", default=False)
+
+
+@contextmanager
+def model_cache_suspended() -> Iterator[None]:
+    """Bypass the model cache (no reads or writes) for fits inside the block."""
+    token = _suspended.set(True)
+    try:
+        yield
+    finally:
+        _suspended.reset(token)
+
+
+def get_model_cache() -> Optional[ModelCache]:
+    """
+    Return the process-wide model cache rooted at MODEL_CACHE_DIR.
+
+    Returns None (caching disabled) when the directory cannot be created, or
+    inside ``model_cache_suspended()``.
+    """
+    global _default_cache
+    if _suspended.get():
+        return None
+    if _default_cache is None:
+        try:
+            _default_cache = ModelCache(MODEL_CACHE_DIR)
+        except OSError as e:
+            logger.warning(f"Model cache disabled: {e}")
+            return None
+    return _default_cache
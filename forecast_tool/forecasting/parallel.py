@@ -0,0 +1,268 @@
+"""
+Process-pool execution layer for per-course model fitting.
+
+Prophet/Stan, ETS and ARIMA fits are CPU-bound and independent across
+courses, so they are fanned out over worker processes. Pools use the spawn
+start method, since the API submits work from threads and a forked child can
+inherit locks another thread held at fork time. Spawned workers start cold
+(interpreter plus model libraries), so one long-lived pool per size is kept
+and reused across calls. Task functions live at module level so they can be
+pickled.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from forecast_tool.config.settings import FORECAST_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# Start method for worker pools (see module docstring)
+POOL_START_METHOD = "spawn"
+
+
+def resolve_workers(max_workers: Optional[int], n_tasks: int) -> int:
+    """
+    Number of worker processes to use for ``n_tasks`` tasks.
+
+    Args:
+        max_workers: Requested pool size. None falls back to
+                     FORECAST_MAX_WORKERS, then os.cpu_count().
+        n_tasks: Number of tasks to run.
+
+    Returns:
+        Pool size between 1 and n_tasks (1 means run in-process).
+    """
+    if max_workers is None:
+        max_workers = FORECAST_MAX_WORKERS or os.cpu_count() or 1
+    return max(1, min(int(max_workers), n_tasks))
+
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _shared_pool(workers: int) -> ProcessPoolExecutor:
+    """The process-wide pool of ``workers`` processes, started on first use."""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(POOL_START_METHOD),
+            )
+            _pools[workers] = pool
+        return pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    with _pools_lock:
+        for workers, shared in list(_pools.items()):
+            if shared is pool:
+                del _pools[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pools() -> None:
+    """Stop every shared worker pool (they are restarted on demand)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _submit(pool: ProcessPoolExecutor, fn: Callable[[Any], Any], item: Any) -> Future:
+    """Submit one task, reporting failure to start workers as a broken pool."""
+    try:
+        return pool.submit(fn, item)
+    except (OSError, RuntimeError) as e:
+        # Workers could not be started (e.g. restricted sandboxes), or the
+        # pool was shut down after breaking in another call
+        raise BrokenProcessPool(f"cannot start worker processes: {e}") from e
+
+
+def parallel_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """
+    Apply ``fn`` to every item on a process pool, preserving order.
+
+    Runs serially in-process when only one worker is needed or when a pool
+    cannot be used (see ``parallel_imap_unordered``), so callers never need
+    a separate code path. Exceptions raised by ``fn`` propagate.
+    """
+    items = list(items)
+    if resolve_workers(max_workers, len(items)) <= 1:
+        return [fn(item) for item in items]
+
+    results: List[Any] = [None] * len(items)
+    for index, result in parallel_imap_unordered(
+        fn, items, max_workers=max_workers, max_pending=len(items)
+    ):
+        results[index] = result
+    return results
+
+
+def parallel_imap_unordered(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Apply ``fn`` to items on a process pool, yielding results as they finish.
+
+    ``items`` is consumed lazily and at most ``max_pending`` tasks (default
+    twice the pool size) are in flight, so memory stays bounded however many
+    tasks there are.
+
+    An exception raised by ``fn`` propagates to the caller. Only pool
+    failures (workers that cannot be started, or that die) fall back to
+    running in-process, for the items not yet yielded.
+
+    Yields:
+        (index of the item in ``items``, fn(item)) in completion order.
+    """
+    items = iter(enumerate(items))
+    workers = resolve_workers(max_workers, sys.maxsize)
+    if workers <= 1:
+        for index, item in items:
+            yield index, fn(item)
+        return
+
+    max_pending = max(workers, max_pending or 2 * workers)
+    pending: Dict[Future, Tuple[int, Any]] = {}
+    pool = None
+    try:
+        pool = _shared_pool(workers)
+
+        def collect() -> Iterator[Tuple[int, Any]]:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # Raises the task's own exception, or BrokenProcessPool
+                result = future.result()
+                index, _ = pending.pop(future)
+                yield index, result
+
+        for index, item in items:
+            try:
+                pending[_submit(pool, fn, item)] = (index, item)
+            except BrokenProcessPool:
+                # Not submitted: run it with the rest below
+                items = itertools.chain([(index, item)], items)
+                raise
+            if len(pending) >= max_pending:
+                yield from collect()
+        while pending:
+            yield from collect()
+    except BrokenProcessPool as e:
+        if pool is not None:
+            _discard_pool(pool)
+        logger.warning(f"Process pool unavailable ({e}); finishing tasks serially.")
+        for future, (index, item) in list(pending.items()):
+            del pending[future]
+            if future.done() and not future.cancelled() and not isinstance(
+                future.exception(), BrokenProcessPool
+            ):
+                # Finished before the pool broke
+                yield index, future.result()
+            else:
+                yield index, fn(item)
+        for index, item in items:
+            yield index, fn(item)
+    finally:
+        # The pool outlives this call; don't leave queued work behind if
+        # the consumer stops early or a task raised
+        for future in pending:
+            future.cancel()
+
+
+def _final_forecast_value(task: Tuple[Callable, pd.DataFrame, int]) -> float:
+    """Run one model on one series and return its last forecast value (NaN on failure)."""
+    fn, df_ts, periods = task
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            raw = fn(df_ts, periods)
+        except Exception:
+            return float("nan")
+    if isinstance(raw, pd.DataFrame):
+        if not raw.empty and "yhat" in raw.columns:
+            return float(raw["yhat"].values[-1])
+        return float("nan")
+    arr = np.asarray(raw).flatten()
+    return float(arr[-1]) if len(arr) > 0 else float("nan")
+
+
+def _optimize_weights_task(task: Tuple[pd.DataFrame, Dict[str, Callable], Dict[str, Any]]):
+    """Run ``optimize_ensemble_weights`` for one series; None if it fails."""
+    from forecast_tool.forecasting.ensemble import optimize_ensemble_weights
+
+    df_ts, forecast_fns, cv_kwargs = task
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            return optimize_ensemble_weights(df_ts, forecast_fns, **cv_kwargs)
+        except Exception:
+            return None
+
+
+def _course_forecast_task(task: Tuple[pd.DataFrame, Dict[str, Callable], int, Optional[Dict[str, Any]]]):
+    """Optimize weights (when ``cv_kwargs`` is given) and fit every model for one series."""
+    df_ts, forecast_fns, periods, cv_kwargs = task
+    optimized = None
+    if cv_kwargs is not None:
+        optimized = _optimize_weights_task((df_ts, forecast_fns, cv_kwargs))
+    predictions = {
+        name: _final_forecast_value((fn, df_ts, periods)) for name, fn in forecast_fns.items()
+    }
+    return optimized, predictions
+
+
+def iter_course_forecasts(
+    series: Dict[str, pd.DataFrame],
+    forecast_fns: Dict[str, Callable[[pd.DataFrame, int], Any]],
+    periods: int,
+    optimize_keys: Iterable[str] = (),
+    max_workers: Optional[int] = None,
+    **cv_kwargs: Any,
+) -> Iterator[Tuple[str, bool, Optional[Tuple[Dict[str, float], float]], Dict[str, float]]]:
+    """
+    Optimize ensemble weights and fit every model for each series in
+    parallel, yielding each course as soon as it finishes.
+
+    Args:
+        optimize_keys: Courses to run weight optimization for; extra keyword
+                       arguments are passed to ``optimize_ensemble_weights``.
+
+    Yields:
+        (course key, whether optimization ran, (weights, error) or None if
+        it failed or did not run, {model name: final forecast value}) in
+        completion order.
+    """
+    keys = list(series)
+    optimize_keys = set(optimize_keys)
+    tasks = (
+        (series[key], forecast_fns, periods, cv_kwargs if key in optimize_keys else None)
+        for key in keys
+    )
+    for index, (optimized, predictions) in parallel_imap_unordered(
+        _course_forecast_task, tasks, max_workers=max_workers
+    ):
+        key = keys[index]
+        yield key, key in optimize_keys, optimized, predictions
@@ -5,16 +5,26 @@ Extracted from app.py for modularity.
 
 from typing import TYPE_CHECKING
 import pandas as pd
-from prophet import Prophet
+
+from forecast_tool.forecasting.model_cache import get_model_cache, series_fingerprint
 
 if TYPE_CHECKING:
     from prophet.forecaster import Prophet
 
+PROPHET_PARAMS = {
+    "yearly_seasonality": True,
+    "weekly_seasonality": False,
+    "daily_seasonality": False,
+}
+
 
 def forecast_prophet(df_ts: pd.DataFrame, periods: int) -> pd.DataFrame:
     """
     Run Prophet forecast.
 
+    The fitted model is reused from the model cache when the series and
+    settings match a previous fit.
+
     Args:
         df_ts: DataFrame with columns 'ds' (datetime) and 'y' (values)
         periods: Number of periods to forecast
@@ -26,9 +36,25 @@ def forecast_prophet(df_ts: pd.DataFrame, periods: int) -> pd.DataFrame:
     if df_ts.empty or len(df_ts) < 2:
         return pd.DataFrame()
 
+    # Imported on first use: prophet (and its Stan backend) is slow to load
+    import prophet
+    from prophet import Prophet
+
+    cache = get_model_cache()
+    key = None
+    model = None
+    if cache is not None:
+        key = series_fingerprint(
+            df_ts, "prophet", {**PROPHET_PARAMS, "version": prophet.__version__}
+        )
+        model = cache.get(key)
+
     try:
-        model = Prophet(yearly_seasonality=True, weekly_seasonality=False, daily_seasonality=False)
-        model.fit(df_ts)
+        if model is None:
+            model = Prophet(**PROPHET_PARAMS)
+            model.fit(df_ts)
+            if cache is not None:
+                cache.put(key, model)
         future = model.make_future_dataframe(periods=periods, freq='QS')
         forecast = model.predict(future)
         return forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].tail(periods)
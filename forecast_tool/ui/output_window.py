@@ -10,7 +10,8 @@ import numpy as np
 from forecast_tool.chat.conversation import ConversationManager
 from forecast_tool.chat.responses import format_forecast_response, format_upload_response, format_error_response
 from forecast_tool.data.loaders import load_course_mapping, load_historical_data, calculate_summer_ratios
-from forecast_tool.data.transformers import quarter_to_date, date_to_quarter_label
+from forecast_tool.data.panel import EnrollmentPanel
+from forecast_tool.data.transformers import date_to_quarter_label
 from forecast_tool.forecasting.prophet_forecast import forecast_prophet
 from forecast_tool.forecasting.ets_forecast import forecast_ets
 from forecast_tool.forecasting.ensemble import calculate_sections, ensemble_forecast
@@ -254,15 +255,13 @@ def render_forecast_output(command):
     progress = st.progress(0)
     status = st.empty()
 
+    series = EnrollmentPanel(df).quarterly()
+
     for i, course in enumerate(selected_courses):
         status.text(f"Forecasting {course}...")
 
         # Prepare time series
-        course_df = df[df['course_code'] == course].copy()
-        course_df['ds'] = course_df.apply(lambda r: quarter_to_date(r['year'], r['quarter']), axis=1)
-        course_df = course_df.groupby('ds')['enrollment'].sum().reset_index()
-        course_df.columns = ['ds', 'y']
-        course_df = course_df.sort_values('ds')
+        course_df = series.get(course, pd.DataFrame(columns=['ds', 'y']))
 
         if len(course_df) < 2:
             st.warning(f"⚠️ {course}: Not enough data points")
@@ -388,6 +387,8 @@ def render_visualizations(df_results, df_historical, selected_courses):
     """Render trend visualizations."""
     st.subheader("Trend Visualization")
 
+    history = EnrollmentPanel(df_historical).quarterly()
+
     for course in selected_courses:
         course_forecast = df_results[df_results['Course'] == course]
 
@@ -396,10 +397,9 @@ def render_visualizations(df_results, df_historical, selected_courses):
 
             # Prepare chart data
             # Historical
-            hist = df_historical[df_historical['course_code'] == course].copy()
-            if not hist.empty:
-                hist['ds'] = hist.apply(lambda r: quarter_to_date(r['year'], r['quarter']), axis=1)
-                hist = hist.groupby('ds')['enrollment'].sum().reset_index()
+            hist = history.get(course)
+            if hist is not None:
+                hist = hist.rename(columns={'y': 'enrollment'})
                 hist['quarter_label'] = hist['ds'].apply(date_to_quarter_label)
                 hist['type'] = 'Historical'
 
@@ -3,11 +3,14 @@ Expanding-window temporal cross-validation for enrollment forecasting.
 
 Generates train/test splits that respect chronological order, evaluates
 forecast callables on each fold, and aggregates error metrics (MAPE, RMSE, MAE).
+``cross_validate_all_courses`` runs the folds of many courses and models on
+a process pool.
 """
 
 import logging
+import warnings
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -184,39 +187,55 @@ def temporal_cross_validate(
         test_df = df_sorted.iloc[test_idx]
         actuals = test_df["y"].values.astype(float)
 
-        try:
-            raw_pred = forecast_fn(train_df, horizon)
-            predictions = _extract_predictions(raw_pred, horizon)
-        except Exception as exc:
-            logger.warning("Fold %d forecast failed: %s", fold_num, exc)
-            predictions = np.full(horizon, np.nan)
-
-        # Skip folds where forecast returned NaN
-        if np.all(np.isnan(predictions)):
-            logger.warning("Fold %d produced all-NaN predictions, skipping.", fold_num)
-            continue
-
-        mape = _compute_mape(actuals, predictions)
-        rmse = _compute_rmse(actuals, predictions)
-        mae = _compute_mae(actuals, predictions)
-
-        fold_results.append(
-            FoldResult(
-                fold=fold_num,
-                train_size=len(train_idx),
-                test_size=len(test_idx),
-                mape=mape,
-                rmse=rmse,
-                mae=mae,
-                actuals=actuals,
-                predictions=predictions,
-            )
-        )
+        result = _evaluate_fold(fold_num, train_df, actuals, forecast_fn, horizon)
+        if result is not None:
+            fold_results.append(result)
 
     if not fold_results:
         raise ValueError("All folds failed to produce valid predictions.")
 
-    # Aggregate metrics
+    return _aggregate_folds(fold_results)
+
+
+def _evaluate_fold(
+    fold_num: int,
+    train_df: pd.DataFrame,
+    actuals: np.ndarray,
+    forecast_fn: Callable[[pd.DataFrame, int], Union[pd.DataFrame, np.ndarray]],
+    horizon: int,
+) -> Optional[FoldResult]:
+    """Forecast one fold and score it; None if the forecast is all NaN."""
+    from forecast_tool.forecasting.model_cache import model_cache_suspended
+
+    try:
+        # Fold fits are used once per run; keep them out of the cache
+        with model_cache_suspended():
+            raw_pred = forecast_fn(train_df, horizon)
+        predictions = _extract_predictions(raw_pred, horizon)
+    except Exception as exc:
+        logger.warning("Fold %d forecast failed: %s", fold_num, exc)
+        predictions = np.full(horizon, np.nan)
+
+    # Skip folds where forecast returned NaN
+    if np.all(np.isnan(predictions)):
+        logger.warning("Fold %d produced all-NaN predictions, skipping.", fold_num)
+        return None
+
+    return FoldResult(
+        fold=fold_num,
+        train_size=len(train_df),
+        test_size=len(actuals),
+        mape=_compute_mape(actuals, predictions),
+        rmse=_compute_rmse(actuals, predictions),
+        mae=_compute_mae(actuals, predictions),
+        actuals=actuals,
+        predictions=predictions,
+    )
+
+
+def _aggregate_folds(fold_results: List[FoldResult]) -> CVResult:
+    """Combine per-fold metrics (in fold order) into a CVResult."""
+    fold_results = sorted(fold_results, key=lambda f: f.fold)
     rmse_vals = np.array([f.rmse for f in fold_results])
     mae_vals = np.array([f.mae for f in fold_results])
 
@@ -259,12 +278,23 @@ def cross_validate_course(
     Returns:
         CVResult for the given course.
     """
-    from forecast_tool.data.transformers import quarter_to_date
-
     course_df = df_hist[df_hist["course_code"] == course_code].copy()
     if course_df.empty:
         raise ValueError(f"No data found for course '{course_code}'.")
 
+    return temporal_cross_validate(
+        _course_series(course_df),
+        forecast_fn,
+        min_train_size=min_train_size,
+        horizon=horizon,
+        step=step,
+    )
+
+
+def _course_series(course_df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate one course's history to a chronological ``ds``/``y`` series."""
+    from forecast_tool.data.transformers import quarters_to_dates
+
     # Aggregate enrollment per quarter in case of multiple sections
     agg = (
         course_df.groupby(["year", "quarter"])["enrollment"]
@@ -272,15 +302,128 @@ def cross_validate_course(
         .reset_index()
     )
 
-    agg["ds"] = agg.apply(
-        lambda row: quarter_to_date(row["year"], row["quarter"]), axis=1
-    )
+    agg["ds"] = quarters_to_dates(agg["year"], agg["quarter"])
     agg = agg.rename(columns={"enrollment": "y"}).sort_values("ds").reset_index(drop=True)
+    return agg[["ds", "y"]]
 
-    return temporal_cross_validate(
-        agg[["ds", "y"]],
-        forecast_fn,
+
+def _fold_task(task: tuple) -> Tuple[str, str, Optional[FoldResult]]:
+    """Evaluate one (course, model, fold) task; module-level so it pickles."""
+    course, model_name, fold_num, train_df, actuals, forecast_fn, horizon = task
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = _evaluate_fold(fold_num, train_df, actuals, forecast_fn, horizon)
+    return course, model_name, result
+
+
+def iter_course_fold_results(
+    df_hist: pd.DataFrame,
+    forecast_fns: Dict[str, Callable[[pd.DataFrame, int], Union[pd.DataFrame, np.ndarray]]],
+    courses: Optional[Iterable[str]] = None,
+    min_train_size: int = 8,
+    horizon: int = 1,
+    step: int = 1,
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[str, str, Optional[FoldResult]]]:
+    """Run every (course, fold, model) task on a process pool, streaming results.
+
+    Tasks are generated lazily and at most ``max_pending`` are in flight, so
+    only a bounded number of training windows are held at once.
+
+    Args:
+        df_hist: DataFrame with ``year``, ``quarter``, ``course_code``,
+                 ``enrollment`` (as for ``cross_validate_course``).
+        forecast_fns: Mapping of model name to forecast callable. Callables
+                      must be picklable (module-level functions).
+        courses: Courses to validate (default: every course in ``df_hist``).
+        min_train_size: Passed through to ``expanding_window_splits``.
+        horizon: Passed through.
+        step: Passed through.
+        max_workers: Pool size (see ``forecasting.parallel.resolve_workers``).
+        max_pending: In-flight task limit (default: twice the pool size).
+
+    Yields:
+        ``(course, model_name, FoldResult)`` in completion order. The
+        FoldResult is None when that fold's forecast failed or was all NaN.
+    """
+    from forecast_tool.data.panel import EnrollmentPanel
+    from forecast_tool.forecasting.parallel import parallel_imap_unordered
+
+    def tasks():
+        panel = EnrollmentPanel(df_hist).quarterly()
+        for course in (panel if courses is None else courses):
+            series = panel.get(course)
+            if series is None:
+                logger.warning("No data found for course '%s', skipping.", course)
+                continue
+            if len(series) < min_train_size + horizon:
+                logger.warning(
+                    "Insufficient data for cross-validation of '%s': %d observations.",
+                    course, len(series),
+                )
+                continue
+            splits = expanding_window_splits(len(series), min_train_size, horizon, step)
+            for fold_num, (train_idx, test_idx) in enumerate(splits, start=1):
+                train_df = series.iloc[train_idx].copy()
+                actuals = series["y"].values[test_idx].astype(float)
+                for model_name, forecast_fn in forecast_fns.items():
+                    yield (course, model_name, fold_num, train_df, actuals, forecast_fn, horizon)
+
+    for _, result in parallel_imap_unordered(
+        _fold_task, tasks(), max_workers=max_workers, max_pending=max_pending
+    ):
+        yield result
+
+
+def cross_validate_all_courses(
+    df_hist: pd.DataFrame,
+    forecast_fns: Dict[str, Callable[[pd.DataFrame, int], Union[pd.DataFrame, np.ndarray]]],
+    courses: Optional[Iterable[str]] = None,
+    min_train_size: int = 8,
+    horizon: int = 1,
+    step: int = 1,
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    on_fold: Optional[Callable[[str, str, FoldResult], None]] = None,
+) -> Dict[str, Dict[str, CVResult]]:
+    """Cross-validate every model on every course in parallel.
+
+    Wraps ``iter_course_fold_results`` and aggregates the streamed folds
+    into one CVResult per course and model, matching what
+    ``cross_validate_course`` returns for each pair.
+
+    Args:
+        on_fold: Optional callback invoked with ``(course, model_name,
+                 FoldResult)`` as each successful fold finishes (e.g. for
+                 progress reporting).
+        Other arguments: see ``iter_course_fold_results``.
+
+    Returns:
+        ``{course: {model_name: CVResult}}``. Courses without enough data,
+        and models whose folds all failed, are omitted.
+    """
+    folds: Dict[str, Dict[str, List[FoldResult]]] = {}
+    for course, model_name, result in iter_course_fold_results(
+        df_hist,
+        forecast_fns,
+        courses=courses,
         min_train_size=min_train_size,
         horizon=horizon,
         step=step,
-    )
+        max_workers=max_workers,
+        max_pending=max_pending,
+    ):
+        if result is None:
+            continue
+        folds.setdefault(course, {}).setdefault(model_name, []).append(result)
+        if on_fold is not None:
+            on_fold(course, model_name, result)
+
+    return {
+        course: {
+            model_name: _aggregate_folds(model_folds)
+            for model_name, model_folds in by_model.items()
+        }
+        for course, by_model in sorted(folds.items())
+    }
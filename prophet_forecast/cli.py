@@ -67,6 +67,12 @@ def main() -> int:
         default=0.0,
         help="Growth percentage adjustment (e.g., 5 for 5%% growth)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for model fitting (default: CPU count)",
+    )
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
@@ -105,6 +111,7 @@ def main() -> int:
         section_capacity=args.capacity,
         buffer_percent=args.buffer,
         by_campus=args.by_campus,
+        max_workers=args.workers,
     )
     
     if not args.quiet:
@@ -62,6 +62,83 @@ def term_to_date(year: int, quarter: str) -> datetime:
     return datetime(int(year), month, 1)
 
 
+def _parse_term_codes(term_codes: pd.Series) -> pd.DataFrame:
+    """
+    Standalone ``forecast_tool.data.transformers.parse_term_codes``.
+
+    Returns:
+        DataFrame (same index) with columns: quarter, year; unknown
+        suffixes give None / NaN
+    """
+    codes = pd.to_numeric(term_codes, errors="coerce")
+    suffix = codes % 100
+    quarter = suffix.map(TERM_MAP)
+    known = quarter.notna()
+    # Fall term belongs to the previous academic year
+    year = (codes // 100 - (suffix == 10)).where(known)
+    if known.all():
+        year = year.astype(int)
+    return pd.DataFrame({"quarter": quarter.where(known, None), "year": year}, index=term_codes.index)
+
+
+def _quarters_to_dates(years: pd.Series, quarters: pd.Series) -> pd.Series:
+    """Standalone ``forecast_tool.data.transformers.quarters_to_dates``."""
+    q_lower = quarters.astype(str).str.lower().str.strip()
+    month = q_lower.map(QUARTER_TO_MONTH).fillna(1).astype(int)
+    # Winter quarter belongs to the next calendar year
+    year = years.astype(int) + (q_lower == "winter").astype(int)
+    return pd.to_datetime(pd.DataFrame({"year": year, "month": month, "day": 1}))
+
+
+def _quarter_ratios(df: pd.DataFrame, key_columns: list[str], target: str, feeder: str) -> dict:
+    """Standalone ``forecast_tool.data.panel.EnrollmentPanel.quarter_ratios``."""
+    quarter = df["quarter"].astype(str).str.strip().str.lower()
+    rows = df.assign(_quarter=quarter)[quarter.isin([target, feeder])]
+    totals = rows.groupby(key_columns + ["year", "_quarter"])["enrollment"].sum().unstack("_quarter")
+    if target not in totals.columns or feeder not in totals.columns:
+        return {}
+    valid = totals[target].notna() & (totals[feeder] > 0)
+    ratios = totals.loc[valid, target] / totals.loc[valid, feeder]
+    means = ratios.groupby(level=key_columns if len(key_columns) > 1 else key_columns[0]).mean()
+    return {key: float(value) for key, value in means.items()}
+
+
+try:
+    from forecast_tool.data.panel import EnrollmentPanel
+    from forecast_tool.data.snapshot import read_history_csv
+    from forecast_tool.data.transformers import parse_term_codes, quarters_to_dates
+except ImportError:
+    # Standalone use without the forecast_tool package: read the CSV
+    # directly and use the equivalents above
+    EnrollmentPanel = None
+    read_history_csv = pd.read_csv
+    parse_term_codes = _parse_term_codes
+    quarters_to_dates = _quarters_to_dates
+
+
+def quarter_ratios(
+    df: pd.DataFrame,
+    key_columns: list[str],
+    target_quarter: str,
+    feeder_quarter: str,
+) -> dict:
+    """
+    Mean target/feeder quarter enrollment ratio per group across years.
+
+    Args:
+        df: Enrollment rows with year, quarter, enrollment and key columns
+        key_columns: Columns identifying a group (e.g. ["course_code"])
+        target_quarter: Quarter name in the numerator (e.g. "summer")
+        feeder_quarter: Quarter name in the denominator (e.g. "spring")
+
+    Returns:
+        {key: ratio}; keys are tuples when there are several key columns
+    """
+    if EnrollmentPanel is not None:
+        return EnrollmentPanel(df, key_columns).quarter_ratios(target_quarter, feeder_quarter)
+    return _quarter_ratios(df, key_columns, target_quarter.strip().lower(), feeder_quarter.strip().lower())
+
+
 def date_to_quarter_label(date: datetime) -> str:
     """
     Convert a datetime back to a quarter label.
@@ -101,7 +178,7 @@ def load_historical_data(
     Returns:
         DataFrame with columns: year, quarter, course_code, campus, enrollment, ds
     """
-    df = pd.read_csv(filepath)
+    df = read_history_csv(filepath)
     
     # Create course code from SUBJ and CRS NUMBER
     df["course_code"] = df["SUBJ"].astype(str).str.strip() + " " + df["CRS NUMBER"].astype(str).str.strip()
@@ -112,10 +189,10 @@ def load_historical_data(
         "CAMPUS": "campus",
     })
     
-    # Parse term codes
-    parsed = df["TERM"].apply(parse_term_code)
-    df["quarter"] = parsed.apply(lambda x: x[0])
-    df["year"] = parsed.apply(lambda x: x[1])
+    # Parse term codes; rows with an unknown term suffix are dropped
+    df[["quarter", "year"]] = parse_term_codes(df["TERM"])
+    df = df[df["quarter"].notna()]
+    df["year"] = df["year"].astype(int)
     
     # Apply filters
     if campus_filter:
@@ -125,7 +202,7 @@ def load_historical_data(
         df = df[df["course_code"].str.upper() == course_filter.upper()]
     
     # Create datetime column for Prophet
-    df["ds"] = df.apply(lambda r: term_to_date(r["year"], r["quarter"]), axis=1)
+    df["ds"] = quarters_to_dates(df["year"], df["quarter"])
     
     # Keep relevant columns
     columns = ["year", "quarter", "course_code", "campus", "enrollment", "ds"]
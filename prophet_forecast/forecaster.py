@@ -2,13 +2,16 @@
 Core Prophet-based enrollment forecasting for university scheduling.
 """
 
+import logging
+import multiprocessing
+import os
 import warnings
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Optional
-
-from prophet import Prophet
+from typing import TYPE_CHECKING, Optional
 
 from prophet_forecast.config import (
     DEFAULT_SECTION_CAPACITY,
@@ -16,11 +19,46 @@ from prophet_forecast.config import (
     PROPHET_CONFIG,
     DEFAULT_SUMMER_RATIO,
 )
-from prophet_forecast.data_loader import date_to_quarter_label, aggregate_enrollment
+from prophet_forecast.data_loader import date_to_quarter_label, aggregate_enrollment, quarter_ratios
+
+try:
+    from forecast_tool.forecasting.model_cache import get_model_cache, series_fingerprint
+    from forecast_tool.forecasting.parallel import parallel_map
+except ImportError:
+    # Standalone use without the forecast_tool package: no fit cache and a
+    # per-fit process pool
+    get_model_cache = None
+    parallel_map = None
 
+if TYPE_CHECKING:
+    from prophet import Prophet
 
 warnings.filterwarnings("ignore")
 
+logger = logging.getLogger(__name__)
+
+
+def _create_prophet_model() -> "Prophet":
+    """Create a new Prophet model with configured settings."""
+    # Imported on first use: prophet (and its Stan backend) is slow to load,
+    # and is not needed when every model comes from the cache
+    from prophet import Prophet
+
+    return Prophet(
+        yearly_seasonality=PROPHET_CONFIG["yearly_seasonality"],
+        weekly_seasonality=PROPHET_CONFIG["weekly_seasonality"],
+        daily_seasonality=PROPHET_CONFIG["daily_seasonality"],
+        seasonality_mode=PROPHET_CONFIG["seasonality_mode"],
+    )
+
+
+def _fit_prophet_model(prophet_df: pd.DataFrame) -> "Prophet":
+    """Fit one Prophet model (module-level so worker processes can run it)."""
+    warnings.filterwarnings("ignore")
+    model = _create_prophet_model()
+    model.fit(prophet_df)
+    return model
+
 
 class UniversityForecaster:
     """
@@ -33,6 +71,7 @@ class UniversityForecaster:
         section_capacity: Number of students per section
         buffer_percent: Extra capacity buffer for section planning
         by_campus: Whether to create separate models per campus
+        max_workers: Worker processes used to fit models in parallel
         models: Dictionary of trained Prophet models
     """
     
@@ -42,6 +81,7 @@ class UniversityForecaster:
         buffer_percent: float = DEFAULT_BUFFER_PERCENT,
         by_campus: bool = False,
         summer_ratio: float = DEFAULT_SUMMER_RATIO,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the forecaster.
@@ -51,25 +91,24 @@ class UniversityForecaster:
             buffer_percent: Buffer percentage for sections (default: 10)
             by_campus: Train separate models per campus (default: False)
             summer_ratio: Default Summer/Spring enrollment ratio (default: 0.15)
+            max_workers: Processes for parallel model fitting; 1 fits serially
+                         (default: None = FORECAST_MAX_WORKERS when forecast_tool
+                         is installed, else os.cpu_count())
         """
         self.section_capacity = section_capacity
         self.buffer_percent = buffer_percent
         self.by_campus = by_campus
         self.summer_ratio = summer_ratio
+        self.max_workers = max_workers
         
-        self.models: dict[str, Prophet] = {}
+        self.models: dict[str, "Prophet"] = {}
         self.training_data: Optional[pd.DataFrame] = None
         self.summer_ratios: dict[str, float] = {}
         self._last_spring_forecasts: dict[str, float] = {}
     
-    def _create_prophet_model(self) -> Prophet:
+    def _create_prophet_model(self) -> "Prophet":
         """Create a new Prophet model with configured settings."""
-        return Prophet(
-            yearly_seasonality=PROPHET_CONFIG["yearly_seasonality"],
-            weekly_seasonality=PROPHET_CONFIG["weekly_seasonality"],
-            daily_seasonality=PROPHET_CONFIG["daily_seasonality"],
-            seasonality_mode=PROPHET_CONFIG["seasonality_mode"],
-        )
+        return _create_prophet_model()
     
     def _calculate_summer_ratios(self, df: pd.DataFrame) -> dict[str, float]:
         """
@@ -81,38 +120,10 @@ class UniversityForecaster:
         Returns:
             Dictionary mapping course keys to Summer/Spring ratios
         """
-        ratios = {}
-        
+        key_columns = ["course_code", "campus"] if self.by_campus else ["course_code"]
+        ratios = quarter_ratios(df, key_columns, "summer", "spring")
         if self.by_campus:
-            group_key = lambda r: f"{r['course_code']}|{r['campus']}"
-        else:
-            group_key = lambda r: r["course_code"]
-        
-        # Group data by course (and campus)
-        for key in df.apply(group_key, axis=1).unique():
-            if self.by_campus:
-                course, campus = key.split("|")
-                course_df = df[(df["course_code"] == course) & (df["campus"] == campus)]
-            else:
-                course_df = df[df["course_code"] == key]
-            
-            course_ratios = []
-            years = course_df["year"].unique()
-            
-            for year in years:
-                spring = course_df[(course_df["year"] == year) & (course_df["quarter"].str.lower() == "spring")]
-                summer = course_df[(course_df["year"] == year) & (course_df["quarter"].str.lower() == "summer")]
-                
-                if not spring.empty and not summer.empty:
-                    spring_val = spring["enrollment"].sum()
-                    summer_val = summer["enrollment"].sum()
-                    
-                    if spring_val > 0:
-                        course_ratios.append(summer_val / spring_val)
-            
-            if course_ratios:
-                ratios[key] = sum(course_ratios) / len(course_ratios)
-        
+            return {f"{course}|{campus}": ratio for (course, campus), ratio in ratios.items()}
         return ratios
     
     def fit(self, df: pd.DataFrame) -> "UniversityForecaster":
@@ -138,6 +149,7 @@ class UniversityForecaster:
         else:
             groups = agg_df.groupby("course_code")
         
+        jobs = []
         for group_key, group_df in groups:
             if self.by_campus:
                 course, campus = group_key
@@ -155,13 +167,69 @@ class UniversityForecaster:
             if len(prophet_df) < 2:
                 continue
             
-            # Train the model
-            model = self._create_prophet_model()
-            model.fit(prophet_df)
+            jobs.append((model_key, prophet_df))
+        
+        # Train the models (independent fits, fanned out over processes)
+        for (model_key, _), model in zip(jobs, self._fit_models([df for _, df in jobs])):
             self.models[model_key] = model
         
         return self
     
+    def _fit_models(self, frames: list[pd.DataFrame]) -> list["Prophet"]:
+        """
+        Fit one Prophet model per frame, reusing cached fits where possible.
+        
+        Args:
+            frames: Prepared 'ds'/'y' DataFrames
+            
+        Returns:
+            Fitted models in the same order as frames
+        """
+        cache = get_model_cache() if get_model_cache is not None else None
+        if cache is None:
+            return self._fit_uncached(frames)
+        
+        from importlib.metadata import version
+        
+        config = {**PROPHET_CONFIG, "version": version("prophet")}
+        keys = [series_fingerprint(frame, "prophet_forecast", config) for frame in frames]
+        models = [cache.get(key) for key in keys]
+        missing = [i for i, model in enumerate(models) if model is None]
+        
+        fitted = self._fit_uncached([frames[i] for i in missing])
+        for i, model in zip(missing, fitted):
+            models[i] = model
+            cache.put(keys[i], model)
+        return models
+    
+    def _fit_uncached(self, frames: list[pd.DataFrame]) -> list["Prophet"]:
+        """Fit one Prophet model per frame, in parallel when possible."""
+        if not frames:
+            return []
+        if parallel_map is not None:
+            # Shared spawn pools, with their own serial fallback
+            return parallel_map(_fit_prophet_model, frames, max_workers=self.max_workers)
+        
+        workers = self.max_workers if self.max_workers is not None else (os.cpu_count() or 1)
+        workers = max(1, min(int(workers), len(frames)))
+        if workers > 1:
+            try:
+                # Spawn, not fork: a forked child can inherit locks held by
+                # other threads of the parent
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                ) as pool:
+                    return list(pool.map(_fit_prophet_model, frames))
+            except (BrokenProcessPool, OSError, RuntimeError) as e:
+                logger.warning(f"Process pool unavailable ({e}); fitting serially.")
+        
+        models = []
+        for prophet_df in frames:
+            model = self._create_prophet_model()
+            model.fit(prophet_df)
+            models.append(model)
+        return models
+    
     def predict(
         self,
         periods: int = 4,
@@ -0,0 +1,10 @@
+"""Shared pytest setup: make the project root and api/ importable, as the API does."""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+for path in (PROJECT_ROOT, PROJECT_ROOT / "api"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,151 @@
+"""Admissions cohort flow: term arithmetic, map compilation and the engine."""
+
+import csv
+
+import numpy as np
+import pytest
+from openpyxl import Workbook
+
+from forecast_tool.data.admissions import parse_admissions_counts
+from forecast_tool.forecasting.cohort_flow import (
+    CohortFlowMap,
+    first_year_cohorts,
+    load_sequence_rows,
+    run_cohort_flow,
+    second_year_cohort,
+    term_ordinal,
+)
+
+SEQUENCE_ROWS = [
+    {"campus": "Savannah", "program": "Animation", "degree": "BFA", "year": "first year",
+     "fall": "FOUN 110, FOUN 112", "winter": "CHOICE: FOUN 113 or FOUN 220",
+     "spring": "FOUN 245", "summer": ""},
+    {"campus": "Savannah", "program": "Animation", "degree": "BFA", "year": "second year",
+     "fall": "", "winter": "FOUN 220", "spring": "", "summer": ""},
+    {"campus": "Atlanta | Savannah", "program": "Acting", "degree": "BFA", "year": "first year",
+     "fall": "FOUN 110", "winter": "FOUN 112", "spring": "", "summer": ""},
+]
+
+
+@pytest.fixture
+def flow_map(tmp_path):
+    path = tmp_path / "sequence_map.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(SEQUENCE_ROWS[0]))
+        writer.writeheader()
+        writer.writerows(SEQUENCE_ROWS)
+    return CohortFlowMap(load_sequence_rows(path))
+
+
+def _counts(accepted, confirmed):
+    return {"accepted": dict(accepted), "confirmed": dict(confirmed)}
+
+
+def test_first_year_cohorts_follow_calendar():
+    cohorts = first_year_cohorts("202630")
+    assert list(cohorts) == ["202610", "202620", "202630"]
+    assert [c.transitions for c in cohorts.values()] == [2, 1, 0]
+    # Earlier starters take the target quarter; new starters begin in fall
+    assert [c.quarter for c in cohorts.values()] == ["spring", "spring", "fall"]
+
+
+def test_second_year_cohort():
+    cohort = second_year_cohort("202630")
+    assert cohort.start_term == "202510"
+    assert cohort.quarter == "spring"
+    assert cohort.transitions == term_ordinal("202630") - term_ordinal("202510") == 6
+
+
+@pytest.mark.parametrize("term", ["2026", "202650", "abcdef", ""])
+def test_invalid_term_raises(term):
+    with pytest.raises(ValueError):
+        first_year_cohorts(term)
+
+
+def test_plan_weights(flow_map):
+    weights = flow_map.course_weights("ANIMATION", "Savannah", "first year", "winter")
+    by_course = dict(zip(flow_map.courses, weights))
+    assert by_course["FOUN 113"] == pytest.approx(0.5)
+    assert by_course["FOUN 220"] == pytest.approx(0.5)
+    assert by_course["FOUN 110"] == 0
+    assert flow_map.course_weights("UNLISTED", "Savannah", "first year", "fall") is None
+
+
+def test_rows_at_other_campuses_serve_unmatched_campus(flow_map):
+    # Animation is only mapped at Savannah; Atlanta admits still get its plan
+    assert flow_map.matching_rows("ANIMATION", "Atlanta", "first year") == [0]
+    assert flow_map.matching_rows("ACTING", "Atlanta", "first year") == [2]
+
+
+def test_run_cohort_flow(flow_map):
+    counts = {
+        ("202610", "Savannah", "FR"): _counts({"ANIMATION": 20}, {"ANIMATION": 8}),
+        ("202620", "Savannah", "FR"): _counts({"ANIMATION": 10, "UNKNOWN XYZ": 3}, {"ANIMATION": 4}),
+        ("202620", "Savannah", "TR"): _counts({"ANIMATION": 5}, {"ANIMATION": 5}),
+        ("202630", "Savannah", "FR"): _counts({"ANIMATION": 7}, {"ANIMATION": 7}),
+    }
+    result = run_cohort_flow(flow_map, counts, "202620", progression_rate=0.9)
+
+    accepted = result.demand_by_course("accepted")
+    # Fall starters one term in: 20 * 0.9 split over the winter choice
+    assert accepted[("FOUN 113", "Savannah")] == pytest.approx(9.0)
+    assert accepted[("FOUN 220", "Savannah")] == pytest.approx(9.0)
+    # Winter starters take the fall courses; transfers and spring admits are excluded
+    assert accepted[("FOUN 110", "Savannah")] == pytest.approx(10.0)
+    assert accepted[("FOUN 112", "Savannah")] == pytest.approx(10.0)
+    assert ("FOUN 245", "Savannah") not in accepted
+
+    confirmed = result.demand_by_course("confirmed")
+    assert confirmed[("FOUN 113", "Savannah")] == pytest.approx(3.6)
+    assert confirmed[("FOUN 110", "Savannah")] == pytest.approx(4.0)
+
+    assert result.unmapped["accepted"] == [(("202620", "Savannah", "first year"), "UNKNOWN XYZ", 3.0)]
+    assert result.unmapped["confirmed"] == []
+
+    with_transfers = run_cohort_flow(
+        flow_map, counts, "202620", progression_rate=0.9, include_transfers=True
+    )
+    assert with_transfers.demand_by_course("accepted")[("FOUN 110", "Savannah")] == pytest.approx(15.0)
+
+
+def test_second_year_demand(flow_map):
+    counts = {("202610", "Savannah", "FR"): _counts({"ANIMATION": 20}, {"ANIMATION": 10})}
+    base = run_cohort_flow(flow_map, counts, "202620", progression_rate=0.9)
+    result = run_cohort_flow(
+        flow_map, counts, "202620", progression_rate=0.9, prior_cohort_total=100.0
+    )
+    extra = result.demand_by_course("accepted")[("FOUN 220", "Savannah")] - \
+        base.demand_by_course("accepted")[("FOUN 220", "Savannah")]
+    # 100 prior-fall students in their second-year winter, five terms on
+    assert extra == pytest.approx(100.0 * 0.9 ** 5)
+
+    skipped = run_cohort_flow(
+        flow_map, counts, "202620", progression_rate=0.9,
+        prior_cohort_total=100.0, include_second_year=False,
+    )
+    assert np.array_equal(skipped.demand, base.demand)
+
+
+def test_parse_admissions_counts(tmp_path):
+    book = Workbook()
+    sheet = book.active
+    sheet.title = "202610 - SAV - FR"
+    sheet.append(["Accepted Applicants"])
+    sheet.append([])
+    sheet.append(["ID", "1st Interest", "Major", "Latest Decision", "MAT Fee Paid Date"])
+    sheet.append([1, "Animation", None, "Accepted", "2025-05-01"])
+    sheet.append([2, "1 Acting", None, "Accepted", None])
+    sheet.append([3, None, "Animation", "Accepted - MAT Fee Paid", None])
+    sheet.append([4, None, None, "Accepted", None])
+    book.create_sheet("202620 - ATL - TR").append(["1st Interest"])
+    book.create_sheet("Summary").append(["ignored"])
+    path = tmp_path / "admissions.xlsx"
+    book.save(path)
+
+    counts = parse_admissions_counts(path)
+    sav = counts[("202610", "Savannah", "FR")]
+    assert dict(sav["accepted"]) == {"ANIMATION": 2, "ACTING": 1}
+    assert dict(sav["confirmed"]) == {"ANIMATION": 2}
+    assert set(counts) == {("202610", "Savannah", "FR"), ("202620", "Atlanta", "TR")}
+
+    assert set(parse_admissions_counts(path, terms=["202620"])) == {("202620", "Atlanta", "TR")}
@@ -0,0 +1,33 @@
+"""calculate_foun_demand's admissions loader."""
+
+from openpyxl import Workbook
+
+from calculate_foun_demand import load_admissions_data
+
+
+def test_load_admissions_data_scans_for_header(tmp_path):
+    book = Workbook()
+    fr = book.active
+    fr.title = "202620 - SAV - FR"
+    fr.append(["Accepted Applicants"])
+    fr.append([])  # written without a <row> element
+    fr.append(["ID", "1st Interest", "Campus"])
+    fr.append([1, "Animation", "SAV"])
+    fr.append([2, "Animation", "SAV"])
+    fr.append([3, "Acting", "ATL"])
+    fr.append([4, None, "SAV"])
+    tr = book.create_sheet("202620 - ATL - TR")
+    for _ in range(12):
+        tr.append(["preamble"])
+    tr.append(["ID", "Major"])
+    tr.append([5, "Painting"])
+    book.create_sheet("202610 - SAV - FR").append(["1st Interest"])
+    path = tmp_path / "admissions.xlsx"
+    book.save(path)
+
+    rows = load_admissions_data(path).to_dict("records")
+    assert rows == [
+        {"MajorRaw": "Acting", "Location": "ATL", "Count": 1, "StudentType": "FR"},
+        {"MajorRaw": "Animation", "Location": "SAV", "Count": 2, "StudentType": "FR"},
+        {"MajorRaw": "Painting", "Location": "Unknown", "Count": 1, "StudentType": "TR"},
+    ]
@@ -0,0 +1,45 @@
+"""/api/forecast/horizon input handling."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from forecaster import run_sequence_forecast_horizon
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    calls = []
+
+    def fake_horizon(**kwargs):
+        calls.append(kwargs)
+        return []
+
+    monkeypatch.setattr(main, "run_sequence_forecast_horizon", fake_horizon)
+    monkeypatch.setattr(main, "_read_disk_config", lambda: {"quarters_to_forecast": 3})
+    return calls
+
+
+@pytest.mark.parametrize("quarters", [0, -1, main.MAX_HORIZON_QUARTERS + 1])
+def test_quarters_out_of_range_is_400(client, captured, quarters):
+    response = client.post("/api/forecast/horizon", json={"term": "Spring 2026", "quarters": quarters})
+    assert response.status_code == 400
+    assert captured == []
+
+
+def test_quarters_default_from_config(client, captured):
+    response = client.post("/api/forecast/horizon", json={"term": "Spring 2026"})
+    assert response.status_code == 200
+    assert captured[0]["quarters"] == 3
+
+
+def test_buffer_of_minus_100_percent_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="buffer_percent"):
+        run_sequence_forecast_horizon(
+            tmp_path / "map.csv", tmp_path / "enrollment.csv", "Spring 2026", buffer_percent=-100
+        )
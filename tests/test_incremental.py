@@ -0,0 +1,51 @@
+"""Fold forecasters for expanding-window CV."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecast_tool.forecasting import ensemble
+from forecast_tool.forecasting.ets_forecast import ETSFoldForecaster, forecast_ets
+from forecast_tool.forecasting.incremental import fold_forecaster
+from forecast_tool.forecasting.model_cache import model_cache_suspended
+
+
+def _mean(df_ts, periods):
+    return np.full(periods, df_ts["y"].mean())
+
+
+@pytest.fixture
+def seasonal_series():
+    t = np.arange(16)
+    return pd.DataFrame({
+        "ds": pd.date_range("2018-01-01", periods=16, freq="QS"),
+        "y": 100.0 + 2.0 * t + 10.0 * np.sin(t * np.pi / 2),
+    })
+
+
+def test_only_ets_has_a_fold_forecaster():
+    assert isinstance(fold_forecaster(forecast_ets), ETSFoldForecaster)
+    assert fold_forecaster(_mean) is _mean
+
+
+def test_warm_start_is_opt_in(monkeypatch, seasonal_series):
+    calls = []
+    monkeypatch.setattr(
+        "forecast_tool.forecasting.incremental.fold_forecaster",
+        lambda fn: calls.append(fn) or fn,
+    )
+    fns = {"ets": forecast_ets, "mean": _mean}
+    ensemble.optimize_ensemble_weights(seasonal_series, fns, min_train_size=12)
+    assert calls == []
+    ensemble.optimize_ensemble_weights(seasonal_series, fns, min_train_size=12, incremental=True)
+    assert calls == [forecast_ets, _mean]
+
+
+def test_ets_fold_forecaster_tracks_cold_refits(seasonal_series):
+    fold = ETSFoldForecaster()
+    for end in range(12, 16):
+        train = seasonal_series.iloc[:end]
+        warm = np.asarray(fold(train, 1), dtype=float)
+        with model_cache_suspended():
+            cold = np.asarray(forecast_ets(train, 1), dtype=float)
+        assert warm == pytest.approx(cold, rel=1e-2)
@@ -0,0 +1,191 @@
+"""Background jobs: JobManager, SSE framing and the /api/jobs endpoints."""
+
+import json
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from jobs import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JobFailed,
+    JobManager,
+    sse_events,
+)
+
+
+def _wait(job, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not job.done:
+        assert time.monotonic() < deadline, "job did not finish"
+        job.wait_events(len(job.events), 0.05)
+    return job
+
+
+def _parse_sse(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = {}
+        for line in block.splitlines():
+            if line.startswith(":"):
+                continue
+            name, _, value = line.partition(": ")
+            fields[name] = value
+        if fields:
+            events.append(fields)
+    return events
+
+
+def _two_rows(emit):
+    emit({"course": "FOUN 110"})
+    emit({"course": "FOUN 112"})
+    return {"total": 2}
+
+
+def test_job_records_events_and_result():
+    manager = JobManager(max_workers=1)
+    job, reused = manager.submit("demo", {"n": 1}, _two_rows)
+    assert not reused
+    _wait(job)
+    assert job.status == JOB_COMPLETED
+    assert job.events == [{"course": "FOUN 110"}, {"course": "FOUN 112"}]
+    assert job.to_dict()["progress"] == 2
+    assert job.result == {"total": 2}
+    assert manager.get(job.id) is job
+
+
+def test_identical_submission_reuses_job():
+    manager = JobManager(max_workers=1)
+    job, _ = manager.submit("demo", {"n": 1}, _two_rows)
+    again, reused = manager.submit("demo", {"n": 1}, _two_rows)
+    assert reused and again is job
+    other, reused = manager.submit("demo", {"n": 2}, _two_rows)
+    assert not reused and other is not job
+
+
+def test_failed_job_reports_detail_and_is_not_reused():
+    def fail(emit):
+        raise JobFailed("Invalid input: bad", 400)
+
+    manager = JobManager(max_workers=1)
+    job, _ = manager.submit("demo", {"n": 1}, fail)
+    _wait(job)
+    assert job.status == JOB_FAILED
+    assert (job.error, job.status_code) == ("Invalid input: bad", 400)
+    retry, reused = manager.submit("demo", {"n": 1}, fail)
+    assert not reused and retry is not job
+
+
+def test_unexpected_error_is_generic():
+    def crash(emit):
+        raise RuntimeError("secret details")
+
+    manager = JobManager(max_workers=1)
+    job, _ = manager.submit("demo", {}, crash)
+    _wait(job)
+    assert job.status == JOB_FAILED
+    assert "secret" not in job.error
+    assert job.status_code == 500
+
+
+def test_finished_jobs_evicted_beyond_limit():
+    manager = JobManager(max_workers=1, max_jobs=2)
+    first, _ = manager.submit("demo", {"n": 1}, _two_rows)
+    _wait(first)
+    for n in (2, 3):
+        _wait(manager.submit("demo", {"n": n}, _two_rows)[0])
+    assert manager.get(first.id) is None
+
+
+def test_sse_streams_rows_then_done():
+    manager = JobManager(max_workers=1)
+    release = threading.Event()
+
+    def slow(emit):
+        emit({"course": "FOUN 110"})
+        release.wait(5)
+        emit({"course": "FOUN 112"})
+        return {"total": 2}
+
+    job, _ = manager.submit("demo", {}, slow)
+    stream = sse_events(job)
+    first = next(stream)
+    assert first.startswith("id: 0\nevent: result\n")
+    release.set()
+    events = _parse_sse(first + "".join(stream))
+    assert [e["event"] for e in events] == ["result", "result", "done"]
+    assert [e.get("id") for e in events[:2]] == ["0", "1"]
+    assert json.loads(events[2]["data"]) == {"total": 2}
+
+    # Resuming after the first row skips it
+    resumed = _parse_sse("".join(sse_events(job, start=1)))
+    assert [e.get("id") for e in resumed] == ["1", None]
+
+
+def test_sse_reports_error():
+    def missing(emit):
+        raise JobFailed("nope", 404)
+
+    manager = JobManager(max_workers=1)
+    job, _ = manager.submit("demo", {}, missing)
+    _wait(job)
+    events = _parse_sse("".join(sse_events(job)))
+    assert events[-1]["event"] == "error"
+    assert json.loads(events[-1]["data"]) == {"detail": "nope"}
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def test_job_endpoints(client):
+    job, _ = main.jobs.submit("demo", {"test": "endpoints"}, _two_rows)
+    _wait(job)
+
+    status = client.get(f"/api/jobs/{job.id}")
+    assert status.status_code == 200
+    assert status.json()["status"] == JOB_COMPLETED
+    assert status.json()["result"] == {"total": 2}
+
+    events = client.get(f"/api/jobs/{job.id}/events")
+    assert events.headers["content-type"].startswith("text/event-stream")
+    parsed = _parse_sse(events.text)
+    assert [e["event"] for e in parsed] == ["result", "result", "done"]
+
+    resumed = _parse_sse(client.get(f"/api/jobs/{job.id}/events", params={"after": 0}).text)
+    assert [e["event"] for e in resumed] == ["result", "done"]
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/api/jobs/nope").status_code == 404
+    assert client.get("/api/jobs/nope/events").status_code == 404
+
+
+def test_ensemble_job_rejects_unknown_weight_method(client):
+    response = client.post("/api/jobs/ensemble", json={"config": {"weight_method": "bogus"}})
+    assert response.status_code == 400
+    assert "weight_method" in response.json()["detail"]
+
+
+def test_history_version_tracks_crosswalk(tmp_path):
+    from forecast_tool.config.settings import CROSSWALK_PATH, HISTORICAL_DATA_PATH
+    from registry import DataRegistry
+
+    registry = DataRegistry(tmp_path)
+    (tmp_path / "Data").mkdir()
+    (tmp_path / HISTORICAL_DATA_PATH).write_text("SUBJ,CRS NUMBER,TERM,ACT ENR\n")
+    crosswalk = tmp_path / CROSSWALK_PATH
+    before = registry.history_version()
+    assert before[1] is None
+
+    crosswalk.write_text("old,new\nFOUN 100,FOUN 110\n")
+    with_crosswalk = registry.history_version()
+    assert with_crosswalk != before
+
+    crosswalk.write_text("old,new\nFOUN 100,FOUN 111\nFOUN 200,FOUN 210\n")
+    assert registry.history_version() != with_crosswalk
+    assert registry.history_version()[0] == before[0]
@@ -0,0 +1,91 @@
+"""ModelCache storage, LRU eviction and fold-fit suspension."""
+
+import os
+import stat
+
+import numpy as np
+import pandas as pd
+
+from forecast_tool.forecasting.model_cache import (
+    ModelCache,
+    get_model_cache,
+    model_cache_suspended,
+    series_fingerprint,
+)
+
+
+def _entry(cache, key):
+    return cache.directory / f"{key}.pkl"
+
+
+def test_put_get_roundtrip(tmp_path):
+    cache = ModelCache(tmp_path / "cache", max_entries=8)
+    assert cache.get("missing") is None
+    cache.put("a", {"fitted": [1, 2, 3]})
+    assert cache.get("a") == {"fitted": [1, 2, 3]}
+    assert len(cache) == 1
+
+
+def test_directory_is_private(tmp_path):
+    cache = ModelCache(tmp_path / "cache")
+    assert stat.S_IMODE(cache.directory.stat().st_mode) == 0o700
+
+
+def test_overwrite_does_not_grow_count(tmp_path):
+    cache = ModelCache(tmp_path / "cache", max_entries=8)
+    cache.put("a", 1)
+    cache.put("a", 2)
+    assert len(cache) == 1
+    assert cache.get("a") == 2
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ModelCache(tmp_path / "cache", max_entries=4)
+    for i, key in enumerate("abcd"):
+        cache.put(key, i)
+        os.utime(_entry(cache, key), (1000 + i, 1000 + i))
+    # Reading "a" marks it most recently used
+    assert cache.get("a") == 0
+
+    cache.put("e", 4)
+
+    # Over the limit: trimmed to 90% of it, oldest first
+    remaining = {path.stem for path in cache.directory.glob("*.pkl")}
+    assert remaining == {"a", "d", "e"}
+    assert len(cache) == 3
+
+
+def test_count_survives_reopen(tmp_path):
+    cache = ModelCache(tmp_path / "cache", max_entries=8)
+    for key in "abc":
+        cache.put(key, key)
+    assert len(ModelCache(tmp_path / "cache")) == 3
+
+
+def test_unreadable_entry_is_discarded(tmp_path):
+    cache = ModelCache(tmp_path / "cache")
+    cache.put("a", 1)
+    _entry(cache, "a").write_bytes(b"not a pickle")
+    assert cache.get("a") is None
+    assert not _entry(cache, "a").exists()
+
+
+def test_suspended_disables_default_cache():
+    with model_cache_suspended():
+        assert get_model_cache() is None
+        with model_cache_suspended():
+            assert get_model_cache() is None
+        assert get_model_cache() is None
+
+
+def test_fingerprint_tracks_data_and_config():
+    df = pd.DataFrame({
+        "ds": pd.date_range("2020-01-01", periods=4, freq="QS"),
+        "y": [1.0, 2.0, 3.0, 4.0],
+    })
+    base = series_fingerprint(df, "ets", {"version": "1"})
+    assert series_fingerprint(df.copy(), "ets", {"version": "1"}) == base
+    assert series_fingerprint(df, "ets", {"version": "2"}) != base
+    assert series_fingerprint(df, "arima", {"version": "1"}) != base
+    changed = df.assign(y=np.array([1.0, 2.0, 3.0, 5.0]))
+    assert series_fingerprint(changed, "ets", {"version": "1"}) != base
@@ -0,0 +1,61 @@
+"""Process-pool helpers: ordering, error propagation and serial fallback."""
+
+import pytest
+
+from forecast_tool.forecasting import parallel
+
+
+def _square(x):
+    return x * x
+
+
+def _fail_on_three(x):
+    if x == 3:
+        raise FileNotFoundError(f"missing {x}")
+    return x
+
+
+class _UnstartablePool:
+    """Stands in for a pool whose workers cannot be started."""
+
+    def submit(self, fn, item):
+        raise PermissionError("no semaphores")
+
+    def shutdown(self, **kwargs):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pools():
+    yield
+    parallel.shutdown_pools()
+
+
+def test_parallel_map_preserves_order():
+    assert parallel.parallel_map(_square, range(8), max_workers=2) == [x * x for x in range(8)]
+
+
+def test_imap_unordered_yields_every_index():
+    results = dict(parallel.parallel_imap_unordered(_square, range(10), max_workers=2, max_pending=3))
+    assert results == {x: x * x for x in range(10)}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_task_errors_propagate(max_workers):
+    with pytest.raises(FileNotFoundError, match="missing 3"):
+        parallel.parallel_map(_fail_on_three, range(6), max_workers=max_workers)
+    with pytest.raises(FileNotFoundError, match="missing 3"):
+        list(parallel.parallel_imap_unordered(_fail_on_three, range(6), max_workers=max_workers))
+
+
+def test_unstartable_pool_falls_back_to_serial(monkeypatch):
+    monkeypatch.setitem(parallel._pools, 3, _UnstartablePool())
+    assert parallel.parallel_map(_square, range(6), max_workers=3) == [x * x for x in range(6)]
+    # The failed pool is dropped so the next call starts a fresh one
+    assert 3 not in parallel._pools
+
+
+def test_resolve_workers():
+    assert parallel.resolve_workers(4, 2) == 2
+    assert parallel.resolve_workers(0, 5) == 1
+    assert parallel.resolve_workers(3, 10) == 3
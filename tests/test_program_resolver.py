@@ -0,0 +1,131 @@
+"""ProgramResolver lookups agree with the linear scans they replace."""
+
+import difflib
+import random
+
+import pytest
+
+from forecast_tool.data.admissions import normalize_program_base
+from forecast_tool.data import program_resolver
+from forecast_tool.data.program_resolver import ProgramResolver, keys_version, resolver_for
+
+KEYS = [
+    "ANIMATION",
+    "ACCESSORY DESIGN",
+    "ACTING",
+    "ADVERTISING AND BRANDING",
+    "ARCHITECTURE",
+    "ART",
+    "FILM AND TELEVISION",
+    "FASHION",
+    "FASHION MARKETING AND MANAGEMENT",
+    "UX DESIGN",
+    "GRAPHIC DESIGN",
+    "GRAPHIC DESIGN AND VISUAL EXPERIENCE",
+    "INTERACTIVE DESIGN AND GAME DEVELOPMENT",
+    "UX",
+]
+
+NAMES = [
+    "ANIMATION", "ANIMATON", "ANIM", "DESIGN", "GRAPHIC DESIGN", "FASHION",
+    "UX", "U", "AR", "FILM", "FILM AND TV", "ADVERTISING", "GAME DEVELOPMENT",
+    "ACCESORY DESIGN", "XYZ", "",
+]
+
+
+@pytest.fixture
+def resolver():
+    return ProgramResolver(KEYS)
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_with_prefix_matches_scan(resolver, name):
+    assert resolver.with_prefix(name) == tuple(k for k in KEYS if k.startswith(name))
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_containing_matches_scan(resolver, name):
+    expected = sorted((k for k in KEYS if name and (k in name or name in k)), key=len)
+    assert resolver.containing(name) == tuple(expected)
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_close_matches_difflib(resolver, name):
+    expected = difflib.get_close_matches(name, KEYS, n=5, cutoff=0.78) if name else []
+    assert resolver.close(name) == tuple(expected)
+
+
+@pytest.mark.parametrize("keys, name", [
+    (["ABYCD"], "ABXCD"),          # ratio 0.8, no shared trigram
+    (["ABXCDYEF"], "ABCDEF"),      # ratio 0.857, no shared trigram
+    (["EE", "ABDEC"], "EDE"),      # ratio 0.8, no shared bigram
+    (["AB"], "AXB"),
+])
+def test_close_without_shared_ngrams_matches_difflib(keys, name):
+    expected = tuple(difflib.get_close_matches(name, keys, n=5, cutoff=0.78))
+    assert expected
+    assert ProgramResolver(keys).close(name) == expected
+
+
+@pytest.mark.parametrize("cutoff", [0.6, 0.7, 0.78, 0.8, 0.9])
+def test_close_matches_difflib_on_random_keys(cutoff):
+    rng = random.Random(0)
+    for _ in range(500):
+        alphabet = "ABCDEFGH"[:rng.randint(3, 8)]
+        word = lambda: "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 7)))
+        keys = [word() for _ in range(rng.randint(1, 10))]
+        name = word()
+        expected = tuple(difflib.get_close_matches(name, list(dict.fromkeys(keys)), n=3, cutoff=cutoff))
+        assert ProgramResolver(keys).close(name, n=3, cutoff=cutoff) == expected
+
+
+def test_matches_prefers_exact_then_containing_then_close(resolver):
+    assert resolver.matches("ANIMATION") == ("ANIMATION",)
+    assert resolver.matches("FILM") == ("FILM AND TELEVISION",)
+    assert resolver.matches("ANIMATON") == ("ANIMATION",)
+    assert resolver.matches("XYZ") == ()
+    assert resolver.exact("ART") == "ART"
+    assert resolver.exact("ARTS") is None
+
+
+def test_normalizes_raw_names():
+    resolver = ProgramResolver(
+        [normalize_program_base(k) for k in ("Animation", "Graphic Design")],
+        normalize_program_base,
+    )
+    assert resolver.matches("1 Animation") == ("ANIMATION",)
+    assert resolver.matches("Graphic Design - Fall Only") == ("GRAPHIC DESIGN",)
+
+
+def test_results_are_memoized(resolver):
+    first = resolver.containing("DESIGN")
+    assert resolver.containing("DESIGN") is first
+
+
+def test_duplicate_keys_collapse():
+    resolver = ProgramResolver(["ART", "ART", "ACTING"])
+    assert resolver.keys == ("ART", "ACTING")
+    assert resolver.with_prefix("A") == ("ART", "ACTING")
+
+
+def test_resolver_for_shares_by_key_set():
+    shared = resolver_for(KEYS)
+    assert resolver_for(list(KEYS)) is shared
+    assert resolver_for(KEYS[:-1]) is not shared
+    assert shared.version == keys_version(KEYS)
+
+
+def test_memo_is_bounded(monkeypatch, resolver):
+    monkeypatch.setattr(program_resolver, "_MEMO_SIZE", 3)
+    for name in ("A", "AN", "ANI", "ANIM"):
+        resolver.with_prefix(name)
+    assert len(resolver._memo) == 3
+    assert resolver.with_prefix("A") == tuple(k for k in KEYS if k.startswith("A"))
+
+
+def test_resolver_for_keys_on_the_normalizer():
+    upper = lambda name: name.upper()
+    shared = resolver_for(KEYS, upper)
+    assert resolver_for(KEYS, upper) is shared
+    assert resolver_for(KEYS, lambda name: name.upper()) is not shared
+    assert resolver_for(KEYS, normalize_program_base).normalize is normalize_program_base
@@ -0,0 +1,67 @@
+"""Result-cache keys and the /api/forecast cache key inputs."""
+
+import os
+
+import pytest
+
+import main
+from result_cache import ResultCache, result_key
+
+
+def test_result_key_ignores_dict_order():
+    assert result_key({"a": 1, "b": [1, 2]}) == result_key({"b": [1, 2], "a": 1})
+
+
+def test_result_key_tracks_values():
+    base = result_key({"term": "Spring 2026", "config": {"capacity": 20}})
+    assert result_key({"term": "Spring 2026", "config": {"capacity": 21}}) != base
+    assert result_key({"term": "Winter 2026", "config": {"capacity": 20}}) != base
+
+
+def test_result_cache_lru_and_stats():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {"hits": 3, "misses": 1, "entries": 2, "maxEntries": 2}
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "DATA_DIR", tmp_path)
+    return tmp_path
+
+
+def _key(method="sequence", term="Spring 2026"):
+    return main._forecast_cache_key(main.ForecastRequest(term=term, method=method))
+
+
+def test_forecast_key_tracks_request(data_dir):
+    assert _key() == _key()
+    assert _key(term="Winter 2026") != _key()
+    assert _key(method="admissions") != _key()
+
+
+def test_forecast_key_tracks_saved_forecast_edits(data_dir):
+    saved = data_dir / "Winter_2026_FOUN_Forecast.csv"
+    saved.write_text("course,campus,projected_seats\nFOUN 110,Savannah,100\n")
+    before = _key()
+
+    # In-place edit: the directory's own stat does not change
+    saved.write_text("course,campus,projected_seats\nFOUN 110,Savannah,120\n")
+    stamp = saved.stat()
+    os.utime(saved, ns=(stamp.st_atime_ns, stamp.st_mtime_ns + 1_000_000_000))
+    assert _key() != before
+
+
+def test_forecast_key_ignores_unrelated_files(data_dir):
+    before = _key()
+    (data_dir / "FOUN_Historical.csv.ratiocube.npz").write_bytes(b"cube")
+    (data_dir / "Spring25.csv.termidx.json").write_text("{}")
+    assert _key() == before
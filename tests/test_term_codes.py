@@ -0,0 +1,54 @@
+"""Term-code parsing and quarter ratios, and prophet_forecast's standalone copies."""
+
+import pandas as pd
+import pytest
+
+from forecast_tool.data import transformers
+from prophet_forecast import data_loader
+
+TERMS = pd.Series([202210, 202220, 202230, 202240, 202250], index=list("abcde"))
+
+
+def test_parse_term_codes():
+    parsed = transformers.parse_term_codes(TERMS)
+    assert parsed.loc["a"].tolist() == ["Fall", 2021]
+    assert parsed.loc["d"].tolist() == ["Summer", 2022]
+    assert pd.isna(parsed.loc["e", "quarter"])
+    assert pd.isna(parsed.loc["e", "year"])
+
+
+def test_prophet_loader_uses_shared_converters():
+    assert data_loader.parse_term_codes is transformers.parse_term_codes
+    assert data_loader.quarters_to_dates is transformers.quarters_to_dates
+
+
+def test_standalone_parse_matches_shared():
+    pd.testing.assert_frame_equal(
+        data_loader._parse_term_codes(TERMS), transformers.parse_term_codes(TERMS)
+    )
+
+
+@pytest.mark.parametrize("terms", [TERMS.iloc[:4], TERMS.iloc[[0, 3]]])
+def test_standalone_dates_match_shared(terms):
+    parsed = transformers.parse_term_codes(terms)
+    expected = transformers.quarters_to_dates(parsed["year"], parsed["quarter"])
+    pd.testing.assert_series_equal(
+        data_loader._quarters_to_dates(parsed["year"], parsed["quarter"]), expected
+    )
+
+
+@pytest.mark.parametrize("keys", [["course_code"], ["course_code", "campus"]])
+def test_standalone_quarter_ratios_match_panel(keys):
+    from forecast_tool.data.panel import EnrollmentPanel
+
+    df = pd.DataFrame({
+        "course_code": ["A", "A", "A", "A", "B", "B", "B"],
+        "campus": ["SAV", "SAV", "ATL", "SAV", "SAV", "SAV", "SAV"],
+        "year": [2021, 2021, 2021, 2022, 2021, 2021, 2022],
+        "quarter": ["Spring", "Summer", "Spring", "Spring", "Spring", "Summer", "Summer"],
+        "enrollment": [40, 10, 20, 30, 0, 5, 8],
+    })
+    expected = EnrollmentPanel(df, keys).quarter_ratios("summer", "spring")
+    assert expected
+    assert data_loader._quarter_ratios(df, keys, "summer", "spring") == pytest.approx(expected)
+    assert data_loader.quarter_ratios(df, keys, "Summer", "Spring") == pytest.approx(expected)
@@ -0,0 +1,9 @@
+"""API import budget (see api/warmup.py)."""
+
+from warmup import check_import_budget
+
+
+def test_api_import_stays_within_budget():
+    report = check_import_budget()
+    assert report["loaded"] == [], f"heavy modules imported at startup: {report['loaded']}"
+    assert report["ok"], f"import took {report['seconds']:.2f}s (budget {report['budget']}s)"
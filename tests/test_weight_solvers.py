@@ -0,0 +1,98 @@
+"""Ensemble weight search: the continuous solvers and optimize_ensemble_weights."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecast_tool.forecasting.ensemble import (
+    WEIGHT_SOLVERS,
+    _project_to_simplex,
+    optimize_ensemble_weights,
+)
+
+
+def _exact(df_ts, periods):
+    # The series below is linear, so extending the last step is exact
+    y = df_ts["y"].to_numpy(dtype=float)
+    return y[-1] + (y[-1] - y[-2]) * np.arange(1, periods + 1)
+
+
+def _mean(df_ts, periods):
+    return np.full(periods, df_ts["y"].mean())
+
+
+def _nan(df_ts, periods):
+    return np.full(periods, np.nan)
+
+
+@pytest.fixture
+def linear_series():
+    return pd.DataFrame({
+        "ds": pd.date_range("2018-01-01", periods=16, freq="QS"),
+        "y": 10.0 + 2.0 * np.arange(16),
+    })
+
+
+def test_project_to_simplex():
+    for v in (np.array([0.2, 0.3, 0.5]), np.array([3.0, -1.0, 0.5]), np.array([-2.0, -2.0])):
+        w = _project_to_simplex(v)
+        assert np.all(w >= 0)
+        assert w.sum() == pytest.approx(1.0)
+    # Points already on the simplex are unchanged
+    assert _project_to_simplex(np.array([0.2, 0.3, 0.5])) == pytest.approx([0.2, 0.3, 0.5])
+
+
+@pytest.mark.parametrize("method", sorted(WEIGHT_SOLVERS))
+def test_solvers_recover_mixture(method):
+    rng = np.random.default_rng(0)
+    pred_tensor = rng.uniform(50, 150, size=(3, 12, 2))
+    actual_matrix = 0.6 * pred_tensor[0] + 0.4 * pred_tensor[1]
+    weights = WEIGHT_SOLVERS[method](pred_tensor, actual_matrix)
+    assert weights.sum() == pytest.approx(1.0)
+    assert weights == pytest.approx([0.6, 0.4, 0.0], abs=1e-4)
+
+
+@pytest.mark.parametrize("method", sorted(WEIGHT_SOLVERS))
+def test_solvers_handle_missing_predictions(method):
+    rng = np.random.default_rng(1)
+    pred_tensor = rng.uniform(50, 150, size=(2, 10, 1))
+    actual_matrix = pred_tensor[0].copy()
+    pred_tensor[1, ::2] = np.nan
+    weights = WEIGHT_SOLVERS[method](pred_tensor, actual_matrix)
+    assert np.all(weights >= 0)
+    assert weights.sum() == pytest.approx(1.0)
+    assert weights[0] == pytest.approx(1.0, abs=1e-3)
+
+
+@pytest.mark.parametrize("method", ["grid", *sorted(WEIGHT_SOLVERS)])
+def test_optimize_picks_exact_model(linear_series, method):
+    weights, error = optimize_ensemble_weights(
+        linear_series,
+        {"exact": _exact, "mean": _mean},
+        min_train_size=6,
+        method=method,
+    )
+    assert set(weights) == {"exact", "mean"}
+    assert sum(weights.values()) == pytest.approx(1.0)
+    assert weights["exact"] == pytest.approx(1.0, abs=1e-6)
+    assert error == pytest.approx(0.0, abs=1e-6)
+
+
+def test_optimize_redistributes_failed_model(linear_series):
+    # A model with no predictions gives its weight to the others, so any
+    # weighting scores like the working model alone
+    weights, error = optimize_ensemble_weights(
+        linear_series, {"exact": _exact, "broken": _nan}, min_train_size=6
+    )
+    assert sum(weights.values()) == pytest.approx(1.0)
+    assert error == pytest.approx(0.0, abs=1e-9)
+
+
+def test_optimize_rejects_unknown_method(linear_series):
+    with pytest.raises(ValueError, match="Unknown weight optimization method"):
+        optimize_ensemble_weights(linear_series, {"exact": _exact}, method="bogus")
+
+
+def test_optimize_rejects_short_series(linear_series):
+    with pytest.raises(ValueError, match="Insufficient data"):
+        optimize_ensemble_weights(linear_series.head(5), {"exact": _exact}, min_train_size=6)